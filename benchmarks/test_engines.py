@@ -0,0 +1,258 @@
+"""
+Timings of the engine computations, to catch performance regressions.
+
+Requires pytest-benchmark. From the repository root:
+
+    python -m pytest benchmarks --benchmark-autosave
+    python -m pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+
+The first command stores the results in .benchmarks, the second one
+compares a new run with the last stored one and fails if any mean
+got more than 10% slower.
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from lib.Engine.BiquadEngine import BiquadEngine
+from lib.Engine.Topology import Topology
+from lib.Engine.FIRExporter import FIRExporter
+from lib.Engine.OverlapAddConvolver import OverlapAddConvolver
+from lib.Engine.PartitionedConvolver import PartitionedConvolver
+from lib.Engine.StreamProcessor import StreamProcessor
+from lib.Engine.AudioMonitor import AudioMonitor
+from lib.Engine.NullAudioBackend import NullAudioBackend
+from lib.Engine.SignalGenerator import SignalGenerator
+
+# Filter types whose order is a parameter
+ORDERED_TYPES = [
+    "allpass",
+    "butterworth highpass",
+    "butterworth lowpass",
+    "bessel highpass",
+    "bessel lowpass",
+    "chebyshev i highpass",
+    "chebyshev i lowpass",
+    "chebyshev ii highpass",
+    "chebyshev ii lowpass",
+    "elliptic highpass",
+    "elliptic lowpass"
+]
+
+# Second order filter types
+BIQUAD_TYPES = ["highpass", "lowpass", "peak", "lowshelf", "highshelf"]
+
+ORDERS = [1, 2, 4, 8, 16]
+
+@pytest.fixture(autouse=True)
+def disable_design_cache():
+    """
+    Every computation designs its filter, except where a test
+    enables the design cache again
+    """
+
+    caches = [BiquadEngine.design_cache, BiquadEngine.tilt_cache, BiquadEngine.matched_cache]
+    maxsizes = [cache.get_maxsize() for cache in caches]
+
+    for cache in caches:
+        cache.clear()
+        cache.set_maxsize(0)
+
+    yield
+
+    for cache, maxsize in zip(caches, maxsizes):
+        cache.set_maxsize(maxsize)
+        cache.clear()
+
+def create_cell(**parameters) -> BiquadEngine:
+    """
+    Returns:
+        BiquadEngine: A cell with the parameters set, at 48 kHz
+    """
+
+    cell = BiquadEngine()
+    Topology.set_parameters(cell, {"frequency": 1000} | parameters)
+
+    return cell
+
+def compute_again(benchmark, engine) -> None:
+    """
+    Times engine.compute(), the engine being marked as
+    modified before every round as the GUI does
+    """
+
+    benchmark.pedantic(engine.compute, setup=engine.mark_dirty, rounds=20, warmup_rounds=1)
+
+@pytest.mark.parametrize("filtertype", BIQUAD_TYPES)
+def test_biquad(benchmark, filtertype):
+
+    benchmark.group = "biquad"
+
+    compute_again(benchmark, create_cell(filtertype=filtertype, gain=6))
+
+@pytest.mark.parametrize("order", ORDERS)
+@pytest.mark.parametrize("filtertype", ORDERED_TYPES)
+def test_order(benchmark, filtertype, order):
+
+    benchmark.group = f"order {filtertype}"
+
+    compute_again(benchmark, create_cell(filtertype=filtertype, order=order))
+
+@pytest.mark.parametrize("transband_width", [100, 300, 1000])
+@pytest.mark.parametrize("stopband_attenuation", [40, 60, 80, 100])
+@pytest.mark.parametrize("filtertype", ["fir highpass", "fir lowpass"])
+def test_fir(benchmark, filtertype, stopband_attenuation, transband_width):
+
+    benchmark.group = f"fir {filtertype}"
+
+    compute_again(benchmark, create_cell(
+        filtertype=filtertype,
+        frequency=2000,
+        stopband_attenuation=stopband_attenuation,
+        transband_width=transband_width
+    ))
+
+@pytest.mark.parametrize("order", [10, 20, 40])
+@pytest.mark.parametrize("slope", [-6, -3, 3])
+def test_tilt(benchmark, slope, order):
+
+    benchmark.group = "tilt"
+
+    compute_again(benchmark, create_cell(filtertype="tilt", frequency=20, order=order, slope=slope))
+
+@pytest.mark.parametrize("filtertype", ["peak", "highshelf", "butterworth lowpass", "elliptic lowpass", "tilt"])
+def test_matched(benchmark, filtertype):
+
+    benchmark.group = "matched"
+
+    compute_again(benchmark, create_cell(filtertype=filtertype, order=8, frequency=12000, gain=6, matched=True))
+
+@pytest.mark.parametrize("delay", [0, 1, 10.5, 100, 1000, 4800, 48000])
+def test_delay(benchmark, delay):
+
+    benchmark.group = "delay"
+
+    compute_again(benchmark, create_cell(filtertype="butterworth lowpass", order=4, delay=delay))
+
+def test_design_cache_hit(benchmark):
+
+    benchmark.group = "design cache"
+
+    BiquadEngine.design_cache.set_maxsize(256)
+
+    compute_again(benchmark, create_cell(filtertype="elliptic lowpass", order=8))
+
+def create_cascades(cascades: int, cells: int, sample_frequency: float = 48000) -> Topology:
+    """
+    Returns:
+        Topology: A sum of cascades of cells of various types, all computed once
+    """
+
+    cell_descriptions = [
+        {"filtertype": "butterworth lowpass", "order": 4, "frequency": 2000},
+        {"filtertype": "peak", "frequency": 500, "gain": -3, "Q": 2},
+        {"filtertype": "allpass", "order": 2, "frequency": 300},
+        {"filtertype": "lowshelf", "frequency": 100, "gain": 4}
+    ]
+
+    topology = Topology({
+        "sample_frequency": sample_frequency,
+        "cascades": [
+            {"delay": cascade, "cells": [cell_descriptions[cell % 4] for cell in range(cells)]}
+            for cascade in range(cascades)
+        ]
+    })
+    topology.compute()
+
+    return topology
+
+@pytest.mark.parametrize("cells", [1, 2, 4, 8, 16, 32, 64])
+def test_cascade(benchmark, cells):
+
+    benchmark.group = "cascade"
+
+    compute_again(benchmark, create_cascades(1, cells).engines["Cascade A"])
+
+@pytest.mark.parametrize("cascades", [1, 2, 4, 8, 10])
+def test_sum(benchmark, cascades):
+
+    benchmark.group = "sum"
+
+    compute_again(benchmark, create_cascades(cascades, 4).sum_engine)
+
+@pytest.mark.parametrize("cascades", [1, 4, 15])
+def test_topology(benchmark, cascades):
+    """
+    All the cells, cascades and sum computed again, as after
+    changing the sample frequency. 15 cascades make 60 cells.
+    """
+
+    benchmark.group = "topology"
+
+    topology = create_cascades(cascades, 4)
+
+    def mark_dirty():
+
+        for engine in topology.engines.values():
+            engine.mark_dirty()
+
+    benchmark.pedantic(topology.compute, setup=mark_dirty, rounds=5, warmup_rounds=1)
+
+@pytest.mark.parametrize("numtaps", [1024, 4096, 16384])
+@pytest.mark.parametrize("phase", FIRExporter.phases)
+def test_fir_export(benchmark, phase, numtaps):
+
+    benchmark.group = f"fir export {phase}"
+
+    exporter = FIRExporter(create_cascades(4, 4).sum_engine, numtaps, phase)
+
+    benchmark.pedantic(exporter.design, rounds=5, warmup_rounds=1)
+
+@pytest.mark.parametrize("numtaps", [1024, 4096, 16384])
+@pytest.mark.parametrize("block_size", [64, 256, 1024])
+@pytest.mark.parametrize("convolver_class", [OverlapAddConvolver, PartitionedConvolver])
+def test_convolver(benchmark, convolver_class, block_size, numtaps):
+    """
+    One block of a stereo real-time stream, whose duration
+    at 48 kHz is the time available to process it
+    """
+
+    benchmark.group = f"convolver {block_size} frames"
+
+    taps = np.random.default_rng(0).standard_normal(numtaps)
+
+    if convolver_class is PartitionedConvolver:
+        convolver = PartitionedConvolver(taps, 2, block_size)
+    else:
+        convolver = OverlapAddConvolver(taps, 2)
+
+    block = np.random.default_rng(1).standard_normal((block_size, 2))
+
+    benchmark(convolver.process, block)
+
+@pytest.mark.parametrize("interpolating", [False, True])
+@pytest.mark.parametrize("cascades", [1, 4, 15])
+def test_monitor(benchmark, cascades, interpolating):
+    """
+    One callback of a stereo monitoring at 96 kHz, whose
+    budget is 2.667 ms for 256 frames. 15 cascades make 60 cells.
+    """
+
+    benchmark.group = "monitor"
+
+    topology = create_cascades(cascades, 4, 96000)
+
+    audio_monitor = AudioMonitor(
+        topology.sum_engine,
+        NullAudioBackend(96000, 2, 256),
+        SignalGenerator("pink noise", 96000, 2)
+    )
+    audio_monitor.callback(256, False)
+
+    if interpolating:
+        # A transition lasting longer than the benchmark
+        audio_monitor.processor.interpolate(StreamProcessor(topology.sum_engine, 2, 256), 10**9)
+
+    benchmark(audio_monitor.callback, 256, False)
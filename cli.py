@@ -0,0 +1,300 @@
+#!/usr/bin/python
+
+"""
+Evaluates the filters described in JSON or YAML files without the GUI,
+and writes their magnitude, phase and delays to CSV or NPZ files,
+renders an audio file through them, converts them into FIR filters,
+or plays a signal through them in real time.
+
+Examples:
+    python cli.py crossovers.json --output results --format npz --all
+    python cli.py crossovers.json --output results --render recording.wav
+    python cli.py crossovers.json --output results --fir 16384 --fir-phase minimum
+    python cli.py crossovers.json --monitor 10 --source sweep --sink sounddevice
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from lib.Engine.Topology import Topology
+from lib.Engine.BatchProcessor import BatchProcessor
+from lib.Engine.FIRExporter import FIRExporter
+from lib.Engine.AudioMonitor import AudioMonitor
+from lib.Engine.SignalGenerator import SignalGenerator
+from lib.Engine.NullAudioBackend import NullAudioBackend
+from lib.Engine.FileAudioBackend import FileAudioBackend
+from lib.Engine.SoundDeviceAudioBackend import SoundDeviceAudioBackend
+
+def evaluate(topology: Topology, output_directory: Path, format: str, all_engines: bool) -> str:
+    """
+    Computes a topology and writes its responses.
+
+    Args:
+        topology (Topology): The topology to evaluate
+        output_directory (Path): Where to write the file
+        format (str): "csv" or "npz"
+        all_engines (bool): Also write the responses of the cascades and cells
+
+    Returns:
+        str: The written file
+    """
+
+    topology.compute()
+
+    path = output_directory / f"{topology.name}.{format}"
+
+    if format == "csv":
+        topology.export_csv(path, all_engines)
+    else:
+        topology.export_npz(path, all_engines)
+
+    return str(path)
+
+def render(
+    topology:           Topology,
+    output_directory:   Path,
+    input_path:         Path,
+    raw_dtype:          str,
+    raw_channels:       int,
+    block_size:         int,
+    partitioned:        bool
+) -> str:
+    """
+    Computes a topology and processes an audio file through its sum.
+
+    Args:
+        topology (Topology): The topology to render through
+        output_directory (Path): Where to write the file
+        input_path (Path): The WAV or raw file to process
+        raw_dtype (str): NumPy type of the samples of a raw file, None for WAV
+        raw_channels (int): Amount of channels of a raw file
+        block_size (int): Amount of frames processed at once
+        partitioned (bool): Convolve the FIR taps in partitions of the block size
+
+    Returns:
+        str: The written file and the throughput
+    """
+
+    topology.compute()
+
+    suffix = ".raw" if raw_dtype else ".wav"
+    path = output_directory / f"{topology.name}{suffix}"
+
+    statistics = BatchProcessor(topology.sum_engine, block_size, partitioned).process_file(
+        input_path, path, raw_dtype, raw_channels
+    )
+
+    return (
+        f"{path}: {statistics['samples_per_second']:.0f} samples/s, "
+        f"{statistics['realtime_factor']:.0f} times real time, "
+        f"{statistics['max_block_ms']:.3f} ms per block at most"
+    )
+
+def export_fir(
+    topology:           Topology,
+    output_directory:   Path,
+    numtaps:            int,
+    phase:              str,
+    all_engines:        bool
+) -> str:
+    """
+    Computes a topology and converts its sum into FIR taps,
+    written as text with one tap per line.
+
+    Args:
+        topology (Topology): The topology to convert
+        output_directory (Path): Where to write the files
+        numtaps (int): Amount of taps of each FIR
+        phase (str): "linear" or "minimum"
+        all_engines (bool): Also convert the cascades
+
+    Returns:
+        str: The written files and their approximation errors
+    """
+
+    topology.compute()
+
+    names = ["Sum"]
+
+    if all_engines:
+        names += [f"Cascade {chr(ord('A') + i)}" for i in range(len(topology.sum_engine.input_engines))]
+
+    lines = []
+
+    for name in names:
+        exporter = FIRExporter(topology.engines[name], numtaps, phase)
+
+        path = output_directory / f"{topology.name} {name} {phase} phase FIR.txt"
+        exporter.save(path)
+
+        report = exporter.get_report()
+
+        lines.append(
+            f"{path}: max error {report['max_error_db']:.3f} dB, "
+            f"RMS error {report['rms_error_db']:.3f} dB, "
+            f"latency {report['latency']:g} samples"
+        )
+
+    return "\n".join(lines)
+
+def monitor(
+    topology:           Topology,
+    output_directory:   Path,
+    duration:           float,
+    source:             str,
+    sink:               str,
+    channels:           int,
+    block_size:         int
+) -> str:
+    """
+    Computes a topology and plays a signal through its sum in real time.
+
+    Args:
+        topology (Topology): The topology to listen to
+        output_directory (Path): Where to write the file of the "file" sink
+        duration (float): Seconds to play
+        source (str): A kind of SignalGenerator, or a WAV file to play in a loop
+        sink (str): "null", "file" or "sounddevice"
+        channels (int): Amount of output channels
+        block_size (int): Amount of frames per callback
+
+    Returns:
+        str: The underruns and the processing time per callback
+    """
+
+    topology.compute()
+
+    sample_frequency = topology.sum_engine.get_sample_frequency()
+
+    if source in SignalGenerator.kinds:
+        generator = SignalGenerator(source, sample_frequency, channels)
+    else:
+        generator = SignalGenerator("file", sample_frequency, channels, path=source)
+
+    match sink:
+        case "null":
+            backend = NullAudioBackend(sample_frequency, channels, block_size, duration=duration)
+        case "file":
+            path = output_directory / f"{topology.name} monitor.wav"
+            backend = FileAudioBackend(path, sample_frequency, channels, block_size, duration=duration)
+        case "sounddevice":
+            backend = SoundDeviceAudioBackend(sample_frequency, channels, block_size)
+
+    try:
+        audio_monitor = AudioMonitor(topology.sum_engine, backend, generator)
+        audio_monitor.start()
+
+        if sink == "sounddevice":
+            time.sleep(duration)
+            audio_monitor.stop()
+        else:
+            backend.wait()
+    finally:
+        generator.close()
+
+    statistics = audio_monitor.get_statistics()
+
+    return (
+        f"{topology.name}: {statistics['callbacks']} callbacks, {statistics['underruns']} underruns, "
+        f"{statistics['mean_ms']:.3f} ms mean and {statistics['max_ms']:.3f} ms max "
+        f"per block of {statistics['budget_ms']:.3f} ms, load {statistics['max_load']:.0%} at most"
+    )
+
+def main() -> int:
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("descriptions", nargs="+", type=Path,
+        help="JSON or YAML files, each holding a description or a list of them")
+    parser.add_argument("-o", "--output", type=Path, default=Path("."),
+        help="output directory, defaults to the current one")
+    parser.add_argument("-f", "--format", choices=["csv", "npz"], default="csv",
+        help="output file format, defaults to csv")
+    parser.add_argument("-a", "--all", action="store_true",
+        help="also write the responses of the cascades and cells")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+        help="amount of processes evaluating the topologies, defaults to 1")
+    parser.add_argument("-r", "--render", type=Path,
+        help="WAV or raw file to process through each sum instead of writing the responses")
+    parser.add_argument("--fir", type=int, metavar="TAPS",
+        help="write each sum as a FIR of this amount of taps instead of the responses, "
+        "and the cascades with --all")
+    parser.add_argument("--fir-phase", choices=FIRExporter.phases, default="linear",
+        help="phase of the FIR filters, defaults to linear")
+    parser.add_argument("--raw-dtype",
+        help="NumPy type of the samples of a raw file to render, such as <i2 or <f4")
+    parser.add_argument("--raw-channels", type=int, default=1,
+        help="amount of interleaved channels of a raw file to render, defaults to 1")
+    parser.add_argument("--monitor", type=float, metavar="SECONDS",
+        help="play a signal through each sum in real time for this duration instead of writing the responses")
+    parser.add_argument("--source", default="pink noise",
+        help=f"signal to monitor, one of {', '.join(SignalGenerator.kinds[:-1])}, or a WAV file, "
+        "defaults to pink noise")
+    parser.add_argument("--sink", choices=["null", "file", "sounddevice"], default="null",
+        help="audio output of the monitoring, null discarding the samples at the pace of a sound card, "
+        "file writing them as fast as they are processed, sounddevice playing them, defaults to null")
+    parser.add_argument("--channels", type=int, default=2,
+        help="amount of channels to monitor, defaults to 2")
+    parser.add_argument("--block-size", type=int,
+        help="amount of frames rendered or monitored at once, defaults to 65536 for rendering "
+        "and 256 for monitoring")
+    parser.add_argument("--partitioned", action="store_true",
+        help="convolve the FIR taps in partitions of the block size, as a real-time stream would")
+
+    args = parser.parse_args()
+
+    try:
+        topologies = [topology for path in args.descriptions for topology in Topology.load(path)]
+    except (OSError, ValueError) as e:
+        print(f"Invalid description: {e}", file=sys.stderr)
+        return 1
+
+    args.output.mkdir(parents=True, exist_ok=True)
+
+    if args.monitor:
+        # Topologies are played one after the other
+        args.jobs = 1
+        function = monitor
+        jobs = [
+            (topology, args.output, args.monitor, args.source, args.sink, args.channels, args.block_size or 256)
+            for topology in topologies
+        ]
+    elif args.render:
+        function = render
+        jobs = [
+            (
+                topology, args.output, args.render, args.raw_dtype, args.raw_channels,
+                args.block_size or 65536, args.partitioned
+            )
+            for topology in topologies
+        ]
+    elif args.fir:
+        function = export_fir
+        jobs = [(topology, args.output, args.fir, args.fir_phase, args.all) for topology in topologies]
+    else:
+        function = evaluate
+        jobs = [(topology, args.output, args.format, args.all) for topology in topologies]
+
+    try:
+        if args.jobs > 1:
+            with ProcessPoolExecutor(args.jobs) as executor:
+                results = list(executor.map(function, *zip(*jobs)))
+        else:
+            results = [function(*job) for job in jobs]
+    except OSError as e:
+        print(f"Invalid file: {e}", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(f"Invalid filter: {e}", file=sys.stderr)
+        return 1
+
+    for result in results:
+        print(result)
+
+    return 0
+
+if __name__ == '__main__':
+
+    sys.exit(main())
@@ -0,0 +1,293 @@
+import copy
+import logging
+import multiprocessing
+import pickle
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, as_completed
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from lib.Engine.GraphEngine import GraphEngine
+from lib.Engine.EngineScheduler import EngineScheduler, compute_results
+
+class ComputeTaskSignals(QObject):
+    """
+    Signals of a ComputeTask, which can't emit them
+    itself as a QRunnable is not a QObject
+    """
+
+    # Emitted from the worker thread with the task itself
+    finished = pyqtSignal(object)
+
+class ComputeTask(QRunnable):
+    """
+    Computes copies of the outdated engines in a worker thread,
+    leaving the engines displayed by the GUI untouched
+    """
+
+    def __init__(self,
+        engines: list[GraphEngine],
+        executor: Executor = None
+    ) -> None:
+        """
+        Args:
+            engines (list[GraphEngine]):
+                The outdated engines, in topological order
+            executor (Executor, optional):
+                A process pool to compute the input cells in parallel.
+                Defaults to None.
+        """
+
+        super().__init__()
+
+        # The service reads the results after run() returned
+        self.setAutoDelete(False)
+
+        self.signals = ComputeTaskSignals()
+
+        self.engines = engines
+        self.executor = executor
+        self.copies = {}
+
+        # Snapshot of the parameters, taken in the GUI thread
+        for engine in self.engines:
+            engine_copy = copy.copy(engine)
+            engine_copy.input_engines = [
+                self.copies.get(id(input_engine), input_engine)
+                for input_engine in engine.input_engines
+            ]
+            self.copies[id(engine)] = engine_copy
+
+        self.computed_engines = []
+        self.error = None
+        self.cancelled = False
+        self.executor_failed = False
+
+    def cancel(self) -> None:
+        """
+        Asks the task to stop before computing the next engine.
+        Computations already started run to completion.
+        """
+
+        self.cancelled = True
+
+    def run(self) -> None:
+
+        try:
+            engines = self.engines
+
+            input_cells = [engine for engine in engines if not engine.input_engines]
+
+            # Not worth the round trip to the pool for a single cell
+            if self.executor and len(input_cells) > 1:
+                self.compute_in_executor(input_cells)
+
+                # The cells the pool could not compute are computed here
+                engines = [engine for engine in engines if engine not in self.computed_engines]
+
+            with GraphEngine.profiler.capture():
+                for engine in engines:
+                    if self.cancelled:
+                        break
+
+                    self.copies[id(engine)].compute()
+                    self.computed_engines.append(engine)
+
+        except ValueError as e:
+            self.error = e
+
+        except Exception as e:
+            # Any failure must reach the GUI, which waits for this task to end
+            logging.exception("Computation failed")
+            self.error = e
+
+        finally:
+            self.signals.finished.emit(self)
+
+    def compute_in_executor(self, input_cells: list[GraphEngine]) -> None:
+        """
+        Computes the copies of the input cells in the process pool
+        and collects all the results before going further.
+
+        If the pool is broken, shut down or can't receive an engine,
+        the cells it did not compute are left to the thread and
+        executor_failed is set for the service to replace the pool.
+
+        Args:
+            input_cells (list[GraphEngine]): Engines without input engines
+        """
+
+        futures = {}
+
+        try:
+            for engine in input_cells:
+                engine_copy = self.copies[id(engine)]
+                future = self.executor.submit(compute_results, engine_copy, engine_copy.get_frequency_grid())
+                futures[future] = engine
+
+            for future in as_completed(futures):
+                engine = futures[future]
+                engine_copy = self.copies[id(engine)]
+
+                engine_copy.set_results(future.result(), engine_copy.modifications)
+                self.computed_engines.append(engine)
+
+                if self.cancelled:
+                    break
+
+        except (BrokenExecutor, RuntimeError, pickle.PicklingError) as e:
+            logging.warning(f"Process pool failed, computing in a thread instead: {e!r}")
+            self.executor_failed = True
+
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def commit(self) -> list[GraphEngine]:
+        """
+        Stores the computed data into the actual engines.
+        Must be called from the GUI thread.
+
+        Returns:
+            list[GraphEngine]: The engines that received new data
+        """
+
+        for engine in self.computed_engines:
+            engine_copy = self.copies[id(engine)]
+            engine.set_results(engine_copy.get_results(), engine_copy.modifications)
+
+            GraphEngine.profiler.count(engine)
+
+        return self.computed_engines
+
+class ComputeService(QObject):
+    """
+    Computes the outdated engines in a worker pool without
+    ever blocking the GUI thread.
+
+    A single computation runs at a time. A request made while
+    one is running supersedes it: the running one stops after
+    the engine it is computing, what it completed is kept,
+    and a new computation starts for what is left.
+    """
+
+    # Emitted in the GUI thread with the engines that received new data
+    computed = pyqtSignal(list)
+
+    # Emitted in the GUI thread when a computation raised an exception
+    failed = pyqtSignal(str)
+
+    def __init__(self, scheduler: EngineScheduler, *args, **kwargs) -> None:
+        """
+        Args:
+            scheduler (EngineScheduler): The dependency graph of the engines
+        """
+
+        super().__init__(*args, **kwargs)
+
+        self.scheduler = scheduler
+        self.thread_pool = QThreadPool.globalInstance()
+        self.process_pool = None
+        self.task = None
+        self.pending = False
+
+        # All the requests made while handling one user action
+        # are gathered into a single computation
+        self.request_timer = QTimer()
+        self.request_timer.setSingleShot(True)
+        self.request_timer.setInterval(0)
+        self.request_timer.timeout.connect(self.start)
+
+    def request(self) -> None:
+        """
+        Qt slot to compute the outdated engines once
+        the current user action has been handled
+        """
+
+        self.request_timer.start()
+
+    def set_parallel(self, parallel: bool) -> None:
+        """
+        Qt slot to enable or disable computing the input cells
+        in a pool of processes, one per CPU core
+
+        Args:
+            parallel (bool): The parallel computation status
+        """
+
+        if parallel and not self.process_pool:
+            # Forking a process running Qt threads is not safe
+            self.process_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+
+        elif not parallel and self.process_pool:
+            self.process_pool.shutdown(wait=False, cancel_futures=True)
+            self.process_pool = None
+
+    def get_parallel(self) -> bool:
+        """
+        Returns:
+            bool: The current parallel computation status
+        """
+
+        return self.process_pool is not None
+
+    def shutdown(self) -> None:
+        """
+        Stops the running computation and waits for it, so that
+        no worker outlives the application
+        """
+
+        self.request_timer.stop()
+        self.pending = False
+
+        if self.task:
+            self.task.cancel()
+
+        self.thread_pool.waitForDone()
+        self.set_parallel(False)
+
+    def start(self) -> None:
+        """
+        Starts computing the outdated engines, or supersedes
+        the running computation if there is one
+        """
+
+        if self.task:
+            self.task.cancel()
+            self.pending = True
+            return
+
+        self.pending = False
+
+        outdated_engines = self.scheduler.get_outdated_engines()
+
+        if not outdated_engines:
+            return
+
+        self.task = ComputeTask(outdated_engines, self.process_pool)
+        self.task.signals.finished.connect(self.handle_finished)
+
+        self.thread_pool.start(self.task)
+
+    def handle_finished(self, task: ComputeTask) -> None:
+        """
+        Qt slot receiving the finished task in the GUI thread
+        """
+
+        self.task = None
+
+        if task.executor_failed and task.executor is self.process_pool:
+            # A broken pool refuses every later submission
+            self.set_parallel(False)
+            self.set_parallel(True)
+
+        computed_engines = task.commit()
+
+        if computed_engines:
+            self.computed.emit(computed_engines)
+
+        if task.error:
+            logging.warning(task.error)
+            self.failed.emit(str(task.error))
+
+        if self.pending:
+            self.start()
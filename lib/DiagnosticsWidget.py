@@ -0,0 +1,229 @@
+import logging
+
+from PyQt6.QtWidgets import (
+    QWidget,
+    QGridLayout,
+    QHBoxLayout,
+    QCheckBox,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QPlainTextEdit,
+    QFileDialog,
+    QMessageBox
+)
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QFont
+
+from lib.Engine.GraphEngine import GraphEngine
+from lib.Engine.BiquadEngine import BiquadEngine
+from lib.Engine.SumEngine import SumEngine
+from lib.Engine.Topology import Topology
+
+class DiagnosticsWidget(QWidget):
+    """
+    Qt window displaying the timings of the computations and
+    drawings, the computation count of each engine, the design
+    cache statistics, the audio monitor statistics and the cProfile capture.
+    """
+
+    def __init__(self, engine: SumEngine, *args, **kwargs) -> None:
+        """
+        Args:
+            engine (SumEngine): The sum whose cascades and cells are counted
+        """
+
+        super().__init__(*args, **kwargs)
+
+        self.engine = engine
+        self.profiler = GraphEngine.profiler
+
+        # Set by MainWindow while the filters are being listened to
+        self.audio_monitor = None
+
+        self.setWindowTitle("Diagnostics")
+        self.setLayout(QGridLayout())
+        self.resize(800, 700)
+
+        self.timings_checkbox = QCheckBox("Measure timings")
+        self.timings_checkbox.setChecked(self.profiler.get_enabled())
+
+        self.profiling_checkbox = QCheckBox("Capture with cProfile")
+        self.profiling_checkbox.setChecked(self.profiler.get_profiling())
+
+        self.design_cache_label = QLabel()
+        self.audio_monitor_label = QLabel()
+
+        self.stages_table = QTableWidget(0, 6)
+        self.stages_table.setHorizontalHeaderLabels(
+            ["Stage", "Category", "Count", "Total [ms]", "Mean [ms]", "Max [ms]"]
+        )
+        self.stages_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+
+        self.counts_table = QTableWidget(0, 2)
+        self.counts_table.setHorizontalHeaderLabels(["Engine", "Computations"])
+        self.counts_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+
+        self.profile_text = QPlainTextEdit()
+        self.profile_text.setReadOnly(True)
+        self.profile_text.setFont(QFont("monospace"))
+        self.profile_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+
+        self.reset_button = QPushButton("Reset")
+        self.export_json_button = QPushButton("Export JSON")
+        self.export_trace_button = QPushButton("Export Chrome trace")
+        self.export_profile_button = QPushButton("Export cProfile")
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.reset_button)
+        buttons.addStretch()
+        buttons.addWidget(self.export_json_button)
+        buttons.addWidget(self.export_trace_button)
+        buttons.addWidget(self.export_profile_button)
+
+        self.layout().addWidget(self.timings_checkbox, 0, 0)
+        self.layout().addWidget(self.profiling_checkbox, 0, 1)
+        self.layout().addWidget(self.design_cache_label, 1, 0, 1, 2)
+        self.layout().addWidget(self.audio_monitor_label, 2, 0, 1, 2)
+        self.layout().addWidget(self.stages_table, 3, 0)
+        self.layout().addWidget(self.counts_table, 3, 1)
+        self.layout().addWidget(self.profile_text, 4, 0, 1, 2)
+        self.layout().addLayout(buttons, 5, 0, 1, 2)
+
+        self.timings_checkbox.toggled.connect(self.profiler.set_enabled)
+        self.profiling_checkbox.toggled.connect(self.profiler.set_profiling)
+        self.reset_button.clicked.connect(self.handle_reset)
+        self.export_json_button.clicked.connect(self.handle_export_json)
+        self.export_trace_button.clicked.connect(self.handle_export_trace)
+        self.export_profile_button.clicked.connect(self.handle_export_profile)
+
+        # Refreshed while displayed only
+        self.refresh_timer = QTimer()
+        self.refresh_timer.setInterval(1000)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event) -> None:
+
+        super().showEvent(event)
+
+        self.refresh()
+        self.refresh_timer.start()
+
+    def hideEvent(self, event) -> None:
+
+        super().hideEvent(event)
+
+        self.refresh_timer.stop()
+
+    def refresh(self) -> None:
+        """
+        Displays the current measurements
+        """
+
+        design_cache = BiquadEngine.design_cache
+
+        self.design_cache_label.setText(
+            f"Design cache: {len(design_cache)} / {design_cache.get_maxsize()} designs, "
+            f"{design_cache.get_hits()} hits, {design_cache.get_misses()} misses"
+        )
+
+        if self.audio_monitor is None:
+            self.audio_monitor_label.setText("Audio monitor: stopped")
+        else:
+            statistics = self.audio_monitor.get_statistics()
+
+            self.audio_monitor_label.setText(
+                f"Audio monitor: {statistics['callbacks']} callbacks, {statistics['underruns']} underruns, "
+                f"{statistics['mean_ms']:.3f} ms mean, {statistics['max_ms']:.3f} ms max "
+                f"per block of {statistics['budget_ms']:.3f} ms, "
+                f"load {statistics['load']:.0%}, {statistics['max_load']:.0%} max"
+            )
+
+        stages = self.profiler.get_stages()
+
+        self.stages_table.setRowCount(len(stages))
+
+        for row, (stage, statistics) in enumerate(stages.items()):
+            values = [
+                stage,
+                statistics["category"],
+                str(statistics["count"]),
+                f"{statistics['total_ms']:.1f}",
+                f"{statistics['mean_ms']:.3f}",
+                f"{statistics['max_ms']:.3f}"
+            ]
+
+            for column, value in enumerate(values):
+                self.stages_table.setItem(row, column, QTableWidgetItem(value))
+
+        self.stages_table.resizeColumnsToContents()
+
+        counts = self.profiler.get_counts(Topology.get_engine_names(self.engine))
+
+        self.counts_table.setRowCount(len(counts))
+
+        for row, (name, count) in enumerate(counts.items()):
+            self.counts_table.setItem(row, 0, QTableWidgetItem(name))
+            self.counts_table.setItem(row, 1, QTableWidgetItem(str(count)))
+
+        self.counts_table.resizeColumnsToContents()
+
+        self.profile_text.setPlainText(self.profiler.get_profile_summary())
+
+    def handle_reset(self) -> None:
+        """
+        Qt slot to forget all the measurements
+        """
+
+        self.profiler.reset()
+        self.profiling_checkbox.setChecked(False)
+
+        if self.audio_monitor is not None:
+            self.audio_monitor.reset_statistics()
+
+        self.refresh()
+
+    def handle_export_json(self) -> None:
+        """
+        Qt slot to write the statistics to a JSON file
+        """
+
+        path, _ = QFileDialog.getSaveFileName(self, "Export JSON", "diagnostics.json", "JSON (*.json)")
+
+        if path:
+            self.export(self.profiler.export_json, path, Topology.get_engine_names(self.engine))
+
+    def handle_export_trace(self) -> None:
+        """
+        Qt slot to write the timings to a Chrome trace file
+        """
+
+        path, _ = QFileDialog.getSaveFileName(self, "Export Chrome trace", "trace.json", "JSON (*.json)")
+
+        if path:
+            self.export(self.profiler.export_chrome_trace, path)
+
+    def handle_export_profile(self) -> None:
+        """
+        Qt slot to write the cProfile capture
+        """
+
+        path, _ = QFileDialog.getSaveFileName(self, "Export cProfile", "profile.prof", "cProfile (*.prof)")
+
+        if path:
+            self.export(self.profiler.export_profile, path)
+
+    def export(self, export_function, *args) -> None:
+        """
+        Calls an export method of the profiler, displaying its errors in a popup
+
+        Args:
+            export_function (Callable): The method to call
+        """
+
+        try:
+            export_function(*args)
+        except (OSError, ValueError) as e:
+            logging.warning(e)
+            QMessageBox.warning(self, "Export failed", str(e))
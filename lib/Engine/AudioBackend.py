@@ -0,0 +1,89 @@
+from typing import Callable
+
+import numpy as np
+
+class AudioBackend:
+    """
+    Base class of the audio outputs of AudioMonitor.
+
+    A backend calls a callback from its own thread each time it needs
+    a block of samples, as callback(frames, underflow), where underflow
+    tells if the output ran out of samples since the previous call,
+    and plays the block of shape (frames, channels) it returns.
+    """
+
+    def __init__(self, sample_frequency: float = 48000, channels: int = 2, block_size: int = 256) -> None:
+        """
+        Args:
+            sample_frequency (float, optional): The sample frequency in Hertz. Defaults to 48000.
+            channels (int, optional): Amount of output channels. Defaults to 2.
+            block_size (int, optional): Amount of frames requested per callback. Defaults to 256.
+
+        Raises:
+            ValueError: In case of a zero or negative parameter
+        """
+
+        if sample_frequency <= 0:
+            raise ValueError("Sample frequency must be a positive number")
+
+        if channels <= 0:
+            raise ValueError("Amount of channels must be a positive integer")
+
+        if block_size <= 0:
+            raise ValueError("Block size must be a positive integer")
+
+        self.sample_frequency = sample_frequency
+        self.channels = channels
+        self.block_size = block_size
+
+    def get_sample_frequency(self) -> float:
+        """
+        Returns:
+            float: The sample frequency in Hertz
+        """
+
+        return self.sample_frequency
+
+    def get_channels(self) -> int:
+        """
+        Returns:
+            int: The amount of output channels
+        """
+
+        return self.channels
+
+    def get_block_size(self) -> int:
+        """
+        Returns:
+            int: The amount of frames requested per callback
+        """
+
+        return self.block_size
+
+    def start(self, callback: Callable[[int, bool], np.ndarray]) -> None:
+        """
+        Starts calling the callback and playing the blocks it returns
+
+        Args:
+            callback (Callable[[int, bool], np.ndarray]): See the class description
+
+        Raises:
+            ValueError: If the output can't be opened
+        """
+
+        raise NotImplementedError
+
+    def stop(self) -> None:
+        """
+        Stops the output and waits for the last callback to return
+        """
+
+        raise NotImplementedError
+
+    def is_running(self) -> bool:
+        """
+        Returns:
+            bool: True between start() and stop()
+        """
+
+        raise NotImplementedError
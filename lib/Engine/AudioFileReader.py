@@ -0,0 +1,240 @@
+import mmap
+import struct
+
+import numpy as np
+
+class AudioFileReader:
+    """
+    Memory-mapped reader of WAV, RF64 or headerless raw files,
+    returning blocks of float samples.
+
+    Only the block being read is resident in memory: the pages
+    of the blocks already read are handed back to the system,
+    so files of any length can be processed.
+    """
+
+    # WAV format tags
+    FORMAT_PCM = 0x0001
+    FORMAT_FLOAT = 0x0003
+    FORMAT_EXTENSIBLE = 0xFFFE
+
+    def __init__(self,
+        path:               str,
+        raw_dtype:          str = None,
+        raw_channels:       int = 1,
+        raw_sample_frequency: float = 48000
+    ) -> None:
+        """
+        Args:
+            path (str):
+                The file to read
+            raw_dtype (str, optional):
+                NumPy type of the samples of a headerless file, such as
+                "<i2" or "<f4". The file is read as WAV if None.
+                Defaults to None.
+            raw_channels (int, optional):
+                Amount of interleaved channels of a headerless file.
+                Defaults to 1.
+            raw_sample_frequency (float, optional):
+                Sample frequency of a headerless file in Hertz.
+                Defaults to 48000.
+
+        Raises:
+            ValueError: In case of an unsupported or invalid file
+        """
+
+        self.file = open(path, "rb")
+
+        try:
+            if self.file.seek(0, 2) == 0:
+                raise ValueError("The file is empty")
+
+            self.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            if raw_dtype is None:
+                try:
+                    self.parse_wav_header()
+                except struct.error:
+                    raise ValueError("Truncated WAV header")
+            else:
+                try:
+                    self.dtype = np.dtype(raw_dtype)
+                except TypeError:
+                    raise ValueError(f"Unknown sample type {raw_dtype}")
+
+                self.sample_width = self.dtype.itemsize
+                self.channels = raw_channels
+                self.sample_frequency = raw_sample_frequency
+                self.data_offset = 0
+                self.data_size = len(self.mmap)
+
+        except Exception:
+            self.close()
+            raise
+
+        if self.channels <= 0:
+            self.close()
+            raise ValueError("Amount of channels must be a positive integer")
+
+        self.frame_size = self.sample_width * self.channels
+
+        # A truncated file holds less data than its header says
+        self.data_size = min(self.data_size, len(self.mmap) - self.data_offset)
+        self.frames = self.data_size // self.frame_size
+
+    def parse_wav_header(self) -> None:
+        """
+        Reads the format and the location of the samples
+
+        Raises:
+            ValueError: In case of an unsupported or invalid file
+        """
+
+        riff_id, _, wave_id = struct.unpack_from("<4sI4s", self.mmap, 0)
+
+        if riff_id not in [b"RIFF", b"RF64"] or wave_id != b"WAVE":
+            raise ValueError("Not a WAV file")
+
+        # Sizes of RF64 files are stored in their ds64 chunk
+        ds64_data_size = None
+        format_tag = None
+        offset = 12
+
+        while offset + 8 <= len(self.mmap):
+            chunk_id, chunk_size = struct.unpack_from("<4sI", self.mmap, offset)
+            offset += 8
+
+            if chunk_id == b"ds64":
+                _, ds64_data_size = struct.unpack_from("<QQ", self.mmap, offset)
+
+            elif chunk_id == b"fmt ":
+                format_tag, self.channels, self.sample_frequency, _, _, bits_per_sample = \
+                    struct.unpack_from("<HHIIHH", self.mmap, offset)
+
+                if format_tag == self.FORMAT_EXTENSIBLE:
+                    # The actual format starts the sub-format GUID
+                    format_tag, = struct.unpack_from("<H", self.mmap, offset + 24)
+
+            elif chunk_id == b"data":
+                if format_tag is None:
+                    raise ValueError("The format chunk must come before the data")
+
+                self.data_offset = offset
+
+                if riff_id == b"RF64" and chunk_size == 0xFFFFFFFF and ds64_data_size is not None:
+                    self.data_size = ds64_data_size
+                else:
+                    self.data_size = chunk_size
+
+                break
+
+            # Chunks are aligned on 2 bytes
+            offset += chunk_size + chunk_size % 2
+
+        else:
+            raise ValueError("No audio data in the file")
+
+        match format_tag, bits_per_sample:
+            case self.FORMAT_PCM, 8:
+                self.dtype = np.dtype("u1")
+            case self.FORMAT_PCM, 16:
+                self.dtype = np.dtype("<i2")
+            case self.FORMAT_PCM, 24:
+                # Read as bytes, see convert_to_float()
+                self.dtype = np.dtype("u1")
+            case self.FORMAT_PCM, 32:
+                self.dtype = np.dtype("<i4")
+            case self.FORMAT_FLOAT, 32:
+                self.dtype = np.dtype("<f4")
+            case self.FORMAT_FLOAT, 64:
+                self.dtype = np.dtype("<f8")
+            case _:
+                raise ValueError(f"Unsupported WAV format {format_tag} with {bits_per_sample} bits")
+
+        self.sample_width = bits_per_sample // 8
+
+    def read(self, start: int, frames: int) -> np.ndarray:
+        """
+        Args:
+            start (int): Index of the first frame
+            frames (int): Amount of frames, less are returned at the end of the file
+
+        Returns:
+            np.ndarray: Float samples of shape (frames, channels), full scale being 1
+        """
+
+        frames = max(min(frames, self.frames - start), 0)
+        offset = self.data_offset + start * self.frame_size
+
+        if self.sample_width == 3:
+            raw = np.frombuffer(self.mmap, np.uint8, frames * self.frame_size, offset)
+            samples = self.convert_to_float(raw.reshape(frames, self.channels, 3))
+        else:
+            raw = np.frombuffer(self.mmap, self.dtype, frames * self.channels, offset)
+            samples = self.convert_to_float(raw.reshape(frames, self.channels))
+
+        self.release(offset, frames * self.frame_size)
+
+        return samples
+
+    def release(self, offset: int, size: int) -> None:
+        """
+        Hands the pages of a block already read back to the system
+
+        Args:
+            offset (int): Offset of the block in the file in bytes
+            size (int): Size of the block in bytes
+        """
+
+        if not hasattr(mmap, "MADV_DONTNEED"):
+            return
+
+        # Only whole pages can be released
+        start = offset // mmap.PAGESIZE * mmap.PAGESIZE
+        length = offset + size - start
+
+        if length > 0:
+            self.mmap.madvise(mmap.MADV_DONTNEED, start, length)
+
+    def convert_to_float(self, raw: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            raw (np.ndarray): Samples as stored in the file
+
+        Returns:
+            np.ndarray: The samples as floats, full scale being 1
+        """
+
+        if self.sample_width == 3:
+            # Little endian 24 bits placed in the upper bytes of 32 bits
+            padded = np.zeros(raw.shape[:-1] + (4,), dtype=np.uint8)
+            padded[..., 1:] = raw
+
+            return padded.view("<i4")[..., 0] / 2**31
+
+        if self.dtype == np.uint8:
+            return (raw.astype(float) - 128) / 128
+
+        if np.issubdtype(self.dtype, np.integer):
+            return raw.astype(float) / -np.iinfo(self.dtype).min
+
+        return raw.astype(float)
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the file
+        """
+
+        if getattr(self, "mmap", None) is not None:
+            self.mmap.close()
+            self.mmap = None
+
+        self.file.close()
+
+    def __enter__(self) -> "AudioFileReader":
+
+        return self
+
+    def __exit__(self, *args) -> None:
+
+        self.close()
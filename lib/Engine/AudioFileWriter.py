@@ -0,0 +1,115 @@
+import struct
+from pathlib import Path
+
+import numpy as np
+
+class AudioFileWriter:
+    """
+    Streaming writer of 32 bits float samples, to a WAV file
+    if the path ends with .wav, otherwise to a headerless raw file.
+
+    The blocks are appended to the file as they come and the WAV
+    header is completed when closing. Files over 4 GiB are written
+    as RF64, the WAV header having only 32 bits for the sizes.
+    """
+
+    FORMAT_FLOAT = 0x0003
+
+    # RIFF, size, WAVE, JUNK reserving room for a ds64 chunk, fmt, data
+    HEADER_SIZE = 12 + 8 + 28 + 8 + 18 + 8
+
+    def __init__(self, path: str, sample_frequency: float, channels: int) -> None:
+        """
+        Args:
+            path (str): The file to write
+            sample_frequency (float): The sample frequency in Hertz
+            channels (int): Amount of interleaved channels
+
+        Raises:
+            ValueError: In case of a zero or negative amount of channels
+        """
+
+        if channels <= 0:
+            raise ValueError("Amount of channels must be a positive integer")
+
+        self.sample_frequency = int(sample_frequency)
+        self.channels = channels
+        self.wav = Path(path).suffix.lower() == ".wav"
+        self.frames = 0
+
+        self.file = open(path, "wb")
+
+        if self.wav:
+            self.file.write(bytes(self.HEADER_SIZE))
+
+    def write(self, block: np.ndarray) -> None:
+        """
+        Args:
+            block (np.ndarray): Samples of shape (frames,) or (frames, channels)
+
+        Raises:
+            ValueError: If the amount of channels does not match
+        """
+
+        samples = np.asarray(block, dtype="<f4")
+
+        if samples.ndim == 1:
+            samples = samples[:, np.newaxis]
+
+        if samples.shape[1] != self.channels:
+            raise ValueError(f"Expected {self.channels} channels, got {samples.shape[1]}")
+
+        self.file.write(samples.tobytes())
+        self.frames += len(samples)
+
+    def write_header(self) -> None:
+        """
+        Writes the WAV header, now that the size of the data is known
+        """
+
+        data_size = self.frames * self.channels * 4
+        riff_size = self.HEADER_SIZE - 8 + data_size
+
+        if riff_size <= 0xFFFFFFFF:
+            header = struct.pack("<4sI4s", b"RIFF", riff_size, b"WAVE")
+            header += struct.pack("<4sI", b"JUNK", 28) + bytes(28)
+        else:
+            header = struct.pack("<4sI4s", b"RF64", 0xFFFFFFFF, b"WAVE")
+            header += struct.pack("<4sIQQQI", b"ds64", 28, riff_size, data_size, self.frames, 0)
+            data_size = 0xFFFFFFFF
+
+        header += struct.pack(
+            "<4sIHHIIHHH", b"fmt ", 18,
+            self.FORMAT_FLOAT,
+            self.channels,
+            self.sample_frequency,
+            self.sample_frequency * self.channels * 4,
+            self.channels * 4,
+            32,
+            0
+        )
+        header += struct.pack("<4sI", b"data", data_size)
+
+        self.file.seek(0)
+        self.file.write(header)
+
+    def close(self) -> None:
+        """
+        Completes the header and closes the file
+        """
+
+        if self.file.closed:
+            return
+
+        if self.wav:
+            self.write_header()
+
+        self.file.close()
+
+    def __enter__(self) -> "AudioFileWriter":
+
+        return self
+
+    def __exit__(self, *args) -> None:
+
+        self.close()
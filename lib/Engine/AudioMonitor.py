@@ -0,0 +1,228 @@
+import threading
+import time
+
+import numpy as np
+
+from lib.Engine.GraphEngine import GraphEngine
+from lib.Engine.StreamProcessor import StreamProcessor
+from lib.Engine.SignalGenerator import SignalGenerator
+from lib.Engine.AudioBackend import AudioBackend
+
+class AudioMonitor:
+    """
+    Plays a test signal or a file through the filters of a computed
+    cell, cascade or sum in real time, on an audio backend.
+
+    The filters are built by update() in the thread computing the
+    engine and handed over to the audio thread, which never waits
+    for them. Filters of the same structure are reached by moving their
+    coefficients over transition_time, see StreamProcessor.interpolate(),
+    the others by crossfading the old and new outputs.
+
+    The underflows reported by the backend and the processing time of
+    each callback are counted, see get_statistics().
+    """
+
+    def __init__(self,
+        engine:             GraphEngine,
+        backend:            AudioBackend,
+        generator:          SignalGenerator,
+        transition_time:    float = 0.05
+    ) -> None:
+        """
+        Args:
+            engine (GraphEngine): The cell, cascade or sum to listen to
+            backend (AudioBackend): The audio output
+            generator (SignalGenerator): The signal played through the filters
+            transition_time (float, optional): Seconds to move from a filter to the next. Defaults to 0.05.
+
+        Raises:
+            ValueError:
+                If the sample frequencies or the amounts of channels differ,
+                in case of a negative transition time, or if the engine
+                is not computed
+        """
+
+        if generator.get_sample_frequency() != backend.get_sample_frequency():
+            raise ValueError("The signal and the audio output must have the same sample frequency")
+
+        if generator.get_channels() != backend.get_channels():
+            raise ValueError("The signal and the audio output must have the same amount of channels")
+
+        if transition_time < 0:
+            raise ValueError("Transition time must be a positive number")
+
+        self.engine = engine
+        self.backend = backend
+        self.generator = generator
+        self.transition_frames = max(int(transition_time * backend.get_sample_frequency()), 1)
+
+        # Only the handover of a new processor is shared with the audio
+        # thread, which starts with the first one and never waits for it
+        self.lock = threading.Lock()
+        self.pending_processor = None
+
+        self.processor = self.create_processor()
+        self.fading_processor = None
+        self.fade_position = 0
+
+        self.reset_statistics()
+
+    def create_processor(self) -> StreamProcessor:
+        """
+        Returns:
+            StreamProcessor: The current filters of the engine
+
+        Raises:
+            ValueError:
+                If the engine is not computed or its
+                sample frequency differs from the output's
+        """
+
+        if self.engine.get_sample_frequency() != self.backend.get_sample_frequency():
+            raise ValueError(
+                f"The filters are sampled at {self.engine.get_sample_frequency():g} Hz, "
+                f"the audio output at {self.backend.get_sample_frequency():g} Hz"
+            )
+
+        return StreamProcessor(self.engine, self.backend.get_channels(), self.backend.get_block_size())
+
+    def update(self) -> None:
+        """
+        Hands the current filters of the engine over to the audio
+        thread, to be called after each computation of the engine
+
+        Raises:
+            ValueError:
+                If the engine is not computed or its
+                sample frequency differs from the output's
+        """
+
+        processor = self.create_processor()
+
+        with self.lock:
+            self.pending_processor = processor
+
+    def start(self) -> None:
+        """
+        Raises:
+            ValueError: If the audio output can't be started
+        """
+
+        # Imported here, the first callback must not wait for it
+        import scipy.signal
+
+        self.backend.start(self.callback)
+
+    def stop(self) -> None:
+
+        self.backend.stop()
+
+    def is_running(self) -> bool:
+        """
+        Returns:
+            bool: True while the audio output is playing
+        """
+
+        return self.backend.is_running()
+
+    def reset_statistics(self) -> None:
+        """
+        Forgets the underflows and processing times counted so far
+        """
+
+        self.callbacks = 0
+        self.underruns = 0
+        self.frames = 0
+        self.total_seconds = 0
+        self.max_seconds = 0
+        self.max_load = 0
+
+    def get_statistics(self) -> dict:
+        """
+        Returns:
+            dict:
+                The amount of "callbacks" and "underruns", the "mean_ms"
+                and "max_ms" processing time per callback, the "budget_ms"
+                duration of a block, and the "load" and "max_load", the
+                processing time over the duration of the blocks, which must
+                stay well below 1 to play without underruns
+        """
+
+        sample_frequency = self.backend.get_sample_frequency()
+        duration = self.frames / sample_frequency
+
+        return {
+            "callbacks": self.callbacks,
+            "underruns": self.underruns,
+            "mean_ms": self.total_seconds / self.callbacks * 1000 if self.callbacks else 0,
+            "max_ms": self.max_seconds * 1000,
+            "budget_ms": self.backend.get_block_size() / sample_frequency * 1000,
+            "load": self.total_seconds / duration if duration else 0,
+            "max_load": self.max_load
+        }
+
+    def callback(self, frames: int, underflow: bool) -> np.ndarray:
+        """
+        Processes the next block of the signal, in the audio thread
+
+        Args:
+            frames (int): Amount of frames requested
+            underflow (bool): The output ran out of samples since the previous call
+
+        Returns:
+            np.ndarray: The samples to play, of shape (frames, channels)
+        """
+
+        start = time.perf_counter()
+
+        # A processor being handed over is picked up on the next callback
+        if self.lock.acquire(blocking=False):
+            processor, self.pending_processor = self.pending_processor, None
+            self.lock.release()
+
+            if processor is not None:
+                self.switch(processor)
+
+        samples = self.generator.generate(frames)
+        output = self.processor.process(samples)
+
+        if self.fading_processor is not None:
+            gains = np.clip((self.fade_position + np.arange(1, frames + 1)) / self.transition_frames, 0, 1)
+            gains = gains[:, np.newaxis]
+
+            output = output * gains + self.fading_processor.process(samples) * (1 - gains)
+
+            self.fade_position += frames
+
+            if self.fade_position >= self.transition_frames:
+                self.fading_processor = None
+
+        seconds = time.perf_counter() - start
+
+        self.callbacks += 1
+        self.underruns += underflow
+        self.frames += frames
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+        if frames:
+            self.max_load = max(self.max_load, seconds * self.backend.get_sample_frequency() / frames)
+
+        return output
+
+    def switch(self, processor: StreamProcessor) -> None:
+        """
+        Moves from the current filters to new ones, in the audio thread
+
+        Args:
+            processor (StreamProcessor): The new filters
+        """
+
+        if self.processor.can_interpolate(processor):
+            self.processor.interpolate(processor, self.transition_frames)
+        else:
+            # A crossfade in progress is cut short
+            self.fading_processor = self.processor
+            self.fade_position = 0
+            self.processor = processor
@@ -0,0 +1,112 @@
+import time
+
+from lib.Engine.GraphEngine import GraphEngine
+from lib.Engine.StreamProcessor import StreamProcessor
+from lib.Engine.AudioFileReader import AudioFileReader
+from lib.Engine.AudioFileWriter import AudioFileWriter
+
+class BatchProcessor:
+    """
+    Processes audio files of any length through a computed engine,
+    block by block from a memory-mapped input to a streaming output,
+    so that the memory used only depends on the block size.
+    """
+
+    def __init__(self, engine: GraphEngine, block_size: int = 65536, partitioned: bool = False) -> None:
+        """
+        Args:
+            engine (GraphEngine): A computed cell, cascade or sum
+            block_size (int, optional): Amount of frames per block. Defaults to 65536.
+            partitioned (bool, optional):
+                Convolve the FIR taps with partitions of the block size,
+                as a real-time stream would. Defaults to False.
+
+        Raises:
+            ValueError: In case of a zero or negative block size
+        """
+
+        self.engine = engine
+
+        self.set_block_size(block_size)
+
+        self.processor = StreamProcessor(engine, partition_size=self.block_size if partitioned else None)
+
+    def set_block_size(self, block_size: int) -> None:
+        """
+        Args:
+            block_size (int): Amount of frames per block
+
+        Raises:
+            ValueError: In case of a zero or negative number
+        """
+
+        if block_size <= 0:
+            self.block_size = 65536
+            raise ValueError("Block size must be a positive integer")
+        else:
+            self.block_size = block_size
+
+    def get_block_size(self) -> int:
+        """
+        Returns:
+            int: The current amount of frames per block
+        """
+
+        return self.block_size
+
+    def process_file(self,
+        input_path:     str,
+        output_path:    str,
+        raw_dtype:      str = None,
+        raw_channels:   int = 1
+    ) -> dict:
+        """
+        Processes a WAV or raw file into a 32 bits float WAV or raw file.
+        A raw input is assumed to be sampled at the engine's sample frequency.
+
+        Args:
+            input_path (str): The file to read
+            output_path (str): The file to write, WAV if it ends with .wav
+            raw_dtype (str, optional): NumPy type of the samples of a raw input. Defaults to None.
+            raw_channels (int, optional): Amount of channels of a raw input. Defaults to 1.
+
+        Raises:
+            ValueError: If the sample frequency of the input does not match the engine's
+
+        Returns:
+            dict:
+                "frames", "channels", "seconds" of processing time,
+                "samples_per_second" over all the channels,
+                "realtime_factor", the audio duration over the processing time,
+                "max_block_ms", the longest processing time of a block, and
+                "max_load", its ratio to the duration of the block
+        """
+
+        sample_frequency = self.engine.get_sample_frequency()
+
+        with AudioFileReader(input_path, raw_dtype, raw_channels, sample_frequency) as reader:
+            if reader.sample_frequency != sample_frequency:
+                raise ValueError(
+                    f"The file is sampled at {reader.sample_frequency} Hz, "
+                    f"the filters at {sample_frequency:g} Hz"
+                )
+
+            self.processor.set_channels(reader.channels)
+
+            start_time = time.perf_counter()
+
+            with AudioFileWriter(output_path, sample_frequency, reader.channels) as writer:
+                for start in range(0, reader.frames, self.block_size):
+                    writer.write(self.processor.process(reader.read(start, self.block_size)))
+
+            seconds = time.perf_counter() - start_time
+
+            return {
+                "frames": reader.frames,
+                "channels": reader.channels,
+                "seconds": seconds,
+                "samples_per_second": reader.frames * reader.channels / seconds,
+                "realtime_factor": reader.frames / sample_frequency / seconds,
+                "max_block_ms": self.processor.get_statistics()["max_ms"],
+                "max_load": self.processor.get_statistics()["max_load"]
+            }
@@ -1,13 +1,33 @@
 from lib.Engine.GraphEngine import GraphEngine
-from scipy.signal import butter, bessel, cheby1, cheby2, ellip, sosfreqz, tf2sos, kaiserord, firls
-from numpy import log10, angle, pi, sin, cos, sqrt, tan
-from PyQt6.QtCore import QThread, pyqtSignal
+from lib.Engine.DesignCache import DesignCache
+import numpy as np
+from numpy import log10, angle, pi, sin, cos, sqrt, tan, array, arange, zeros, append, ndarray
 
 class BiquadEngine(GraphEngine):
     """
     Child class to compute an input cell's biquad filter
     """
 
+    result_attributes = GraphEngine.result_attributes + ["numtaps"]
+
+    # Designs and responses shared by all the input cells
+    design_cache = DesignCache()
+
+    # SOS of the tilt filters, keyed by (N, alpha, fmin, fmax, fs)
+    tilt_cache = DesignCache()
+
+    # Matched response SOS, keyed by the parameters of the cell
+    matched_cache = DesignCache()
+
+    # Rate of the matched response designs, in multiples of the sample frequency
+    oversampling = 8
+
+    # Designed straight at the sample frequency even in matched response mode
+    fir_types = ["fir highpass", "fir lowpass"]
+
+    # Attributes written by compute_specific() and kept in the design cache
+    design_attributes = ["sos", "taps", "taps_delay", "numtaps", "filter"]
+
     def __init__(self,
         filtertype:             str = "highpass",
         order:                  int = 2,
@@ -16,6 +36,9 @@ class BiquadEngine(GraphEngine):
         passband_ripple:        float = 3,
         stopband_attenuation:   float = 60,
         transband_width:        int = 300,
+        slope:                  float = -3,
+        bandwidth:              float = 10,
+        matched:                bool = False,
         *args, **kwargs
     ) -> None:
         """
@@ -43,6 +66,17 @@ class BiquadEngine(GraphEngine):
                 Transition band width in Hertz.
                 For FIR filters only.
                 Defaults to 300 Hz.
+            slope (float, optional):
+                Slope in dB per octave.
+                For tilt filters only.
+                Defaults to -3.
+            bandwidth (float, optional):
+                Width of the tilted band in octaves above the frequency.
+                For tilt filters only.
+                Defaults to 10.
+            matched (bool, optional):
+                Matched response design mode, see design_matched().
+                Defaults to False.
         """
 
         super().__init__(*args, **kwargs)
@@ -54,17 +88,9 @@ class BiquadEngine(GraphEngine):
         self.set_passband_ripple(passband_ripple)
         self.set_stopband_attenuation(stopband_attenuation)
         self.set_transband_width(transband_width)
-
-        self.compute()
-
-    finished = pyqtSignal()
-
-    def compute_thread(self) -> None:
-
-        self.compute()
-
-        self.finished.emit()
-        QThread.currentThread().quit()
+        self.set_slope(slope)
+        self.set_bandwidth(bandwidth)
+        self.set_matched(matched)
 
     def set_filtertype(self, filtertype: str) -> None:
         """
@@ -75,6 +101,8 @@ class BiquadEngine(GraphEngine):
             ValueError: Raised in case of an invalid string
         """
 
+        self.mark_dirty()
+
         if filtertype.casefold() not in [
             "highpass",
             "lowpass",
@@ -93,7 +121,8 @@ class BiquadEngine(GraphEngine):
             "elliptic highpass",
             "elliptic lowpass",
             "fir highpass",
-            "fir lowpass"
+            "fir lowpass",
+            "tilt"
         ]:
             self.filtertype = "highpass"
             raise ValueError("Incorrect filter type")
@@ -116,6 +145,8 @@ class BiquadEngine(GraphEngine):
             ValueError: In case of a zero or negative number
         """
 
+        self.mark_dirty()
+
         if order <= 0:
             self.order = 1
             raise ValueError("Order must be a positive integer")
@@ -139,6 +170,8 @@ class BiquadEngine(GraphEngine):
             ValueError: In case of value out of bounds
         """
 
+        self.mark_dirty()
+
         if frequency <= 0 or frequency >= self.get_sample_frequency() / 2:
             self.frequency = 1000
             raise ValueError("Frequency must be a positive value under fs/2")
@@ -168,6 +201,8 @@ class BiquadEngine(GraphEngine):
             ValueError: In case of a zero or negative number
         """
 
+        self.mark_dirty()
+
         if Q <= 0:
             self.Q = 0.71
             raise ValueError("Q must be a positive value")
@@ -190,6 +225,8 @@ class BiquadEngine(GraphEngine):
             passband_ripple (float): Maximum passband ripple in dB
         """
 
+        self.mark_dirty()
+
         if passband_ripple < 0:
             self.passband_ripple = 3
             raise ValueError("Passband ripple must be a positive value")
@@ -212,6 +249,8 @@ class BiquadEngine(GraphEngine):
             stopband_attenuation (float): The minimum stopband attenuation in dB
         """
 
+        self.mark_dirty()
+
         if stopband_attenuation < 0:
             self.stopband_attenuation = 60
             raise ValueError("Stopband attenuation must be a positive value")
@@ -234,6 +273,8 @@ class BiquadEngine(GraphEngine):
             transband_width (int): The width of the transition band in Hertz
         """
 
+        self.mark_dirty()
+
         if transband_width < 0 or transband_width >= self.get_sample_frequency() / 2:
             self.transband_width = self.get_frequency() * 2 / 10
             raise ValueError("Transition band width must be a positive value under fs/2")
@@ -254,21 +295,188 @@ class BiquadEngine(GraphEngine):
 
         return self.transband_width
 
+    def set_slope(self, slope: float) -> None:
+        """
+        For tilt filters only
+
+        Args:
+            slope (float): The slope in dB per octave
+
+        Raises:
+            ValueError: In case of value out of bounds
+        """
+
+        self.mark_dirty()
+
+        # Beyond 6 dB per octave, the zeros would pass the next poles
+        if abs(slope) > 6:
+            self.slope = -3
+            raise ValueError("Slope must be between -6 and 6 dB per octave")
+        else:
+            self.slope = slope
+
+    def get_slope(self) -> float:
+        """
+        Returns:
+            float: The current slope in dB per octave
+        """
+
+        return self.slope
+
+    def set_bandwidth(self, bandwidth: float) -> None:
+        """
+        For tilt filters only
+
+        Args:
+            bandwidth (float): The width of the tilted band in octaves above the frequency
+
+        Raises:
+            ValueError: In case of value out of bounds
+        """
+
+        self.mark_dirty()
+
+        if bandwidth <= 0 or bandwidth > 20:
+            self.bandwidth = 10
+            raise ValueError("Bandwidth must be a positive value up to 20 octaves")
+        else:
+            self.bandwidth = bandwidth
+
+    def get_bandwidth(self) -> float:
+        """
+        Returns:
+            float: The current width of the tilted band in octaves
+        """
+
+        return self.bandwidth
+
+    def set_matched(self, matched: bool) -> None:
+        """
+        Args:
+            matched (bool): The matched response design mode status, see design_matched()
+        """
+
+        self.mark_dirty()
+
+        self.matched = matched
+
+    def get_matched(self) -> bool:
+        """
+        Returns:
+            bool: The current matched response design mode status
+        """
+
+        return self.matched
+
+    def get_design_key(self) -> tuple:
+        """
+        Returns:
+            tuple:
+                Hashable summary of everything compute_specific()
+                depends on, used as key in the design cache
+        """
+
+        return (
+            self.get_filtertype().lower(),
+            self.get_order(),
+            self.get_frequency(),
+            self.get_Q(),
+            self.get_passband_ripple(),
+            self.get_stopband_attenuation(),
+            self.get_transband_width(),
+            self.get_slope(),
+            self.get_bandwidth(),
+            self.get_matched(),
+            self.get_sample_frequency(),
+            self.get_gain(),
+            self.get_flip_phase(),
+            self.frequency_grid.get_key(self.get_sample_frequency())
+        )
+
     def compute_specific(self) -> None:
         """
-        Compute the specific filter data based on the parameters.
+        Compute the specific filter data based on the parameters,
+        or fetch it from the design cache if it was computed before.
+        """
+
+        key = self.get_design_key()
+        design = self.design_cache.get(key)
+
+        if design is not None:
+            for name, value in design.items():
+                setattr(self, name, value)
+
+            # compute() adds its own entries to the dictionary
+            self.filter = dict(design["filter"])
+
+            return
+
+        self.compute_design()
+
+        design = {name: getattr(self, name) for name in self.design_attributes if hasattr(self, name)}
+        design["filter"] = dict(self.filter)
+
+        self.design_cache.put(key, design)
+
+    def compute_design(self) -> None:
+        """
+        Compute the specific filter data based on the parameters
+        """
+
+        with self.profiler.measure("design"):
+            self.design()
+
+        with self.profiler.measure("compute_frequency_response"):
+            frequencies, magnitude = self.compute_frequency_response()
+
+        mag_lin = abs(magnitude)
+        mag_db = 20 * log10(abs(magnitude))
+        phase_rad = angle(magnitude, deg=False)
+        phase_deg = angle(magnitude, deg=True)
+
+        self.filter = {
+            "frequencies": frequencies,
+            "magnitude": magnitude,
+            "magnitude_lin": mag_lin,
+            "magnitude_db": mag_db,
+            "phase_rad": phase_rad,
+            "phase_deg": phase_deg
+        }
+
+    def design(self) -> None:
+        """
+        Compute the SOS and FIR taps based on the parameters,
+        in matched response mode if it is enabled
+        """
+
+        if self.get_matched() and self.get_filtertype().lower() not in self.fir_types:
+            self.taps = [1]
+            self.sos = self.design_matched()
+        else:
+            self.design_direct()
+
+    def design_direct(self) -> None:
+        """
+        Compute the SOS and FIR taps based on the parameters,
+        straight at the sample frequency.
 
         References :
             * https://webaudio.github.io/Audio-EQ-Cookbook/audio-eq-cookbook.html
             * https://thewolfsound.com/allpass-filter/
         """
 
+        # Imported here to keep the startup fast, see GraphEngine
+        from scipy.signal import butter, bessel, cheby1, cheby2, ellip, tf2sos, kaiserord, firls
+
         self.w0 = 2 * pi * self.get_frequency() / self.get_sample_frequency()
         self.alpha = sin(self.w0) / (2 * self.get_Q())
         self.A = 10**(self.get_gain() / 40)
 
         gain_offset_db = self.get_gain()
 
+        # Only FIR filters have taps, everything else is pure SOS
+        self.taps = [1]
+
         match self.get_filtertype().lower():
             case "highpass":
                 b = [ (1 + cos(self.w0)) / 2, -(1 + cos(self.w0)), (1 + cos(self.w0)) / 2 ]
@@ -438,32 +646,229 @@ class BiquadEngine(GraphEngine):
 
                 self.numtaps = N
 
-                taps = firls(self.numtaps, bands, gains, fs=self.get_sample_frequency())
+                self.taps = firls(self.numtaps, bands, gains, fs=self.get_sample_frequency())
 
-                self.sos = tf2sos(taps, [1])
+                # Keep the taps as they are and use a unity section
+                # to carry the gain and phase flip
+                self.sos = array([[1, 0, 0, 1, 0, 0]], dtype=float)
+
+            case "tilt":
+                self.sos = self.design_tilt()
 
             case _:
                 raise ValueError("Unknown filter type")
 
         self.process_gain(gain_offset_db)
         self.process_flip_phase()
-        self.process_delay(self.get_delay())
 
-        frequencies, magnitude = sosfreqz(self.sos, worN=self.frequency_points, fs=self.get_sample_frequency())
+    def design_tilt(self) -> ndarray:
+        """
+        Compute the SOS of a tilt filter: N real poles spread geometrically
+        from the frequency to the top of the band, each followed by a real
+        zero a fraction alpha of the spacing further, so that the magnitude
+        follows f^alpha in between. The poles are prewarped and the
+        bilinear transform is applied to all of them at once.
 
-        mag_lin = abs(magnitude)
-        mag_db = 20 * log10(abs(magnitude))
-        phase_rad = angle(magnitude, deg=False)
-        phase_deg = angle(magnitude, deg=True)
+        References :
+            * https://ccrma.stanford.edu/~jos/pdf/IEEEWASPAA2013.pdf
+            * references/DSP/plot_realtilt.py
 
-        self.filter = {
-            "frequencies": frequencies,
-            "magnitude": magnitude,
-            "magnitude_lin": mag_lin,
-            "magnitude_db": mag_db,
-            "phase_rad": phase_rad,
-            "phase_deg": phase_deg
-        }
+        Returns:
+            ndarray: The SOS, with a unity gain at DC
+        """
+
+        fs = self.get_sample_frequency()
+        N = self.get_order()
+        alpha = self.get_slope() / (20 * log10(2))
+        fmin = self.get_frequency()
+
+        # The prewarping diverges at fs/2
+        fmax = max(min(fmin * 2**self.get_bandwidth(), 0.45 * fs), fmin)
+
+        key = (N, alpha, fmin, fmax, fs)
+        design = self.tilt_cache.get(key)
+
+        if design is not None:
+            # process_gain() modifies the first section in place
+            return design["sos"].copy()
+
+        ratio = (fmax / fmin) ** (1 / max(N - 1, 1))
+
+        # Analog poles and zeros in rad/s, negated
+        analog_poles = 2 * fs * tan(pi * fmin * ratio**arange(N) / fs)
+        analog_zeros = analog_poles * ratio**(-alpha)
+
+        # Bilinear transform of real poles and zeros
+        z_poles = (2 * fs - analog_poles) / (2 * fs + analog_poles)
+        z_zeros = (2 * fs - analog_zeros) / (2 * fs + analog_zeros)
+
+        # Pairs of consecutive poles and zeros, an odd one
+        # ending up in a first order section
+        if N % 2 == 1:
+            z_poles = append(z_poles, 0)
+            z_zeros = append(z_zeros, 0)
+
+        z_poles = z_poles.reshape(-1, 2)
+        z_zeros = z_zeros.reshape(-1, 2)
+
+        # Each section has a unity gain at DC
+        section_gains = (1 - z_poles).prod(axis=1) / (1 - z_zeros).prod(axis=1)
+
+        sos = zeros((len(z_poles), 6))
+        sos[:, 0] = section_gains
+        sos[:, 1] = -section_gains * z_zeros.sum(axis=1)
+        sos[:, 2] = section_gains * z_zeros.prod(axis=1)
+        sos[:, 3] = 1
+        sos[:, 4] = -z_poles.sum(axis=1)
+        sos[:, 5] = z_poles.prod(axis=1)
+
+        self.tilt_cache.put(key, {"sos": sos})
+
+        return sos.copy()
+
+    def design_matched(self) -> ndarray:
+        """
+        Compute the SOS in matched response mode: the filter is designed
+        at an oversampled rate, where the bilinear transform barely warps
+        the band up to fs/2, then every section is brought back to the
+        sample frequency without growing the order:
+
+            * Its poles p become p^oversampling, as for the matched Z
+              transform, which keeps their analog frequency and damping.
+            * Its numerator is the least squares fit of the magnitude of
+              the oversampled section with these poles, in relative terms,
+              factorized with its zeros inside the unit circle, or outside
+              where the oversampled section has them, as for allpass filters.
+
+        References :
+            * https://ccrma.stanford.edu/~champ/files/DAFx20in21_paper_15.pdf
+            * https://www.vicanek.de/articles/BiquadFits.pdf
+
+        Returns:
+            ndarray: The SOS at the sample frequency, gain and phase flip applied
+        """
+
+        # The frequency grid is not part of the design
+        key = self.get_design_key()[:-1]
+        design = self.matched_cache.get(key)
+
+        if design is not None:
+            return design["sos"].copy()
+
+        fs = self.get_sample_frequency()
+
+        # Set without mark_dirty(), the cell is being computed
+        self.fs = fs * self.oversampling
+
+        try:
+            self.design_direct()
+            oversampled_sos = np.array(self.sos, dtype=float)
+        finally:
+            self.fs = fs
+
+        # Fitting grid at the sample frequency, as angular frequencies
+        # at the sample frequency and at the oversampled rate
+        omega = 2 * pi * np.geomspace(fs * 1e-4, fs / 2, 256) / fs
+        oversampled_omega = omega / self.oversampling
+
+        oversampled_sos = oversampled_sos / oversampled_sos[:, 3:4]
+
+        z1 = np.exp(-1j * oversampled_omega)
+        target = (
+            (oversampled_sos[:, 0, None] + oversampled_sos[:, 1, None] * z1 + oversampled_sos[:, 2, None] * z1**2)
+            / (1 + oversampled_sos[:, 4, None] * z1 + oversampled_sos[:, 5, None] * z1**2)
+        )
+
+        # Poles of each section, matched at the sample frequency
+        a1 = oversampled_sos[:, 4].astype(complex)
+        a2 = oversampled_sos[:, 5].astype(complex)
+        root = np.sqrt(a1**2 - 4 * a2)
+        poles = np.stack([(-a1 + root) / 2, (-a1 - root) / 2], axis=1) ** self.oversampling
+
+        a1 = -poles.sum(axis=1).real
+        a2 = poles.prod(axis=1).real
+
+        # Zeros of each section, those missing being at the origin
+        oversampled_zeros = np.zeros((len(oversampled_sos), 2), dtype=complex)
+
+        for i, section in enumerate(oversampled_sos):
+            if np.any(section[:3]):
+                section_zeros = np.roots(section[:3])
+                oversampled_zeros[i, :len(section_zeros)] = section_zeros
+
+        # Zeros on the unit circle under fs/2, such as those of highpass
+        # filters or of notches, are matched exactly like the poles
+        fixed = (np.abs(np.abs(oversampled_zeros) - 1) < 1e-6) \
+            & (np.abs(np.angle(oversampled_zeros)) * self.oversampling <= pi + 1e-9)
+        fixed_zeros = np.where(fixed, oversampled_zeros ** self.oversampling, 0)
+
+        z1 = np.exp(-1j * omega)
+        denominators = 1 + a1[:, None] * z1 + a2[:, None] * z1**2
+        fixed_power = np.prod(np.abs(1 - fixed_zeros[:, :, None] * z1) ** 2, axis=1)
+
+        # The power of the other factor of the numerator,
+        # c0 + 2 c1 cos(w) + 2 c2 cos(2w), is linear in c
+        power = np.abs(target * denominators) ** 2 / np.maximum(fixed_power, 1e-300)
+        degrees = 2 - fixed.sum(axis=1)
+        basis = np.stack([np.ones_like(omega), 2 * cos(omega), 2 * cos(2 * omega)], axis=1)
+        basis = basis * (np.arange(3) <= degrees[:, None])[:, None, :]
+
+        # Relative errors, floored where the target has zeros
+        weights = 1 / (power + 1e-9 * power.max(axis=1, keepdims=True))
+        c = np.linalg.pinv(basis * weights[:, :, None]) @ (power * weights)[:, :, None]
+        c0, c1, c2 = c[:, 0, 0], c[:, 1, 0], c[:, 2, 0]
+
+        # Factorized through x = z + 1/z: c2 x^2 + c1 x + c0 - 2 c2 = 0,
+        # an infinite x standing for a zero at the origin
+        quadratic = np.abs(c2) > 1e-12 * np.abs(c0)
+        linear = ~quadratic & (np.abs(c1) > 1e-12 * np.abs(c0))
+        safe_c2 = np.where(quadratic, c2, 1)
+        root = np.sqrt((c1**2 - 4 * safe_c2 * (c0 - 2 * c2)).astype(complex))
+        x = np.select(
+            [quadratic[:, None], linear[:, None]],
+            [
+                np.stack([(-c1 + root) / (2 * safe_c2), (-c1 - root) / (2 * safe_c2)], axis=1),
+                np.stack([-c0 / np.where(linear, c1, 1), np.full_like(c0, np.inf)], axis=1)
+            ],
+            np.inf
+        )
+
+        # The root of z^2 - x z + 1 inside the unit circle, the two
+        # zeros being conjugate when they are on the unit circle
+        with np.errstate(invalid="ignore"):
+            root = np.sqrt(x**2 - 4)
+            root = np.where(np.imag(root) * [1, -1] < 0, -root, root)
+            free_zeros = np.where(np.abs((x + root) / 2) <= 1, (x + root) / 2, (x - root) / 2)
+            free_zeros = np.where(np.isfinite(x), free_zeros, 0)
+
+        # Zeros outside the unit circle in the oversampled design stay outside
+        outside = np.sum(~fixed & (np.abs(oversampled_zeros) > 1 + 1e-6), axis=1)
+        free_zeros = np.take_along_axis(free_zeros, np.argsort(np.abs(free_zeros), axis=1), axis=1)
+        reflected = (np.arange(2) >= 2 - outside[:, None]) & (free_zeros != 0)
+        free_zeros = np.where(reflected, 1 / np.conj(np.where(reflected, free_zeros, 1)), free_zeros)
+
+        # The fitted zeros take the places of the zeros that are not fixed
+        free_index = np.clip(np.cumsum(~fixed, axis=1) - 1, 0, 1)
+        matched_zeros = np.where(fixed, fixed_zeros, np.take_along_axis(free_zeros, free_index, axis=1))
+
+        b1 = -matched_zeros.sum(axis=1).real
+        b2 = matched_zeros.prod(axis=1).real
+
+        # Gain of each numerator by least squares on the relative power,
+        # its sign following the oversampled section
+        numerators = 1 + b1[:, None] * z1 + b2[:, None] * z1**2
+        numerator_power = np.abs(numerators) ** 2 / np.maximum(fixed_power, 1e-300)
+        b0 = np.sqrt(
+            np.sum(weights**2 * power * numerator_power, axis=1)
+            / np.sum(weights**2 * numerator_power**2, axis=1)
+        )
+        b0 *= np.where(np.real(np.sum(np.conj(numerators / denominators) * target, axis=1)) < 0, -1, 1)
+
+        sos = np.stack([b0, b0 * b1, b0 * b2, np.ones_like(b0), a1, a2], axis=1)
+
+        self.matched_cache.put(key, {"sos": sos})
+
+        return sos.copy()
 
     def generate_title(self) -> str:
         """
@@ -499,7 +904,16 @@ class BiquadEngine(GraphEngine):
             case "fir highpass" | "fir lowpass":
                 type_string = f"{self.get_filtertype()}, {self.numtaps} taps"
 
+            case "tilt":
+                type_string = (
+                    f"Tilt filter, {self.get_slope():g} dB/octave"
+                    f" over {self.get_bandwidth():g} octaves, order {self.get_order()}"
+                )
+
             case _:
                 raise ValueError("Unknown filter type")
 
+        if self.get_matched() and self.get_filtertype().lower() not in self.fir_types:
+            type_string += " (matched response)"
+
         return type_string # + f", $f_0 = {self.get_frequency()}$ Hz"
@@ -1,6 +1,5 @@
 from lib.Engine.GraphEngine import GraphEngine
 import numpy as np
-from scipy.signal import sosfreqz
 
 class CascadeEngine(GraphEngine):
     """
@@ -22,23 +21,33 @@ class CascadeEngine(GraphEngine):
 
         self.input_engines = input_engines
 
-        self.compute()
+        self.mark_dirty()
 
     def compute_specific(self) -> None:
         """
-        Compute the cascade of all the input cells
+        Compute the cascade of all the input cells.
+
+        The response is the product of the responses already computed
+        by the input cells, so only the cells that changed have to be
+        evaluated again. The SOS and taps are still gathered for the
+        pole-zero map.
         """
 
-        self.sos = list(self.input_engines[0].sos.copy())
+        self.design()
+
+        # Already part of the input cells' total delays
+        self.taps_delay = sum(engine.taps_delay for engine in self.input_engines)
+
+        frequencies = self.input_engines[0].get_frequencies()
+        magnitude = np.array(self.input_engines[0].get_magnitude_undelayed())
 
         for engine in self.input_engines[1:]:
-            self.sos.extend(engine.sos)
+            magnitude = magnitude * engine.get_magnitude_undelayed()
 
-        self.process_gain(self.get_gain())
-        self.process_flip_phase()
-        self.process_delay(self.get_delay())
+        magnitude *= 10 ** (self.get_gain() / 20)
 
-        frequencies, magnitude = sosfreqz(self.sos, worN=self.frequency_points, fs=self.get_sample_frequency())
+        if self.get_flip_phase():
+            magnitude *= -1
 
         mag_lin = abs(magnitude)
         mag_db = 20 * np.log10(abs(magnitude))
@@ -54,6 +63,34 @@ class CascadeEngine(GraphEngine):
             "phase_deg": phase_deg
         }
 
+    def design(self) -> None:
+        """
+        Gathers the SOS and taps of the input cells
+        """
+
+        # Concatenating creates a new array: applying the gain
+        # and phase flip won't alter the input cells' own SOS
+        self.sos = np.concatenate([np.array(engine.sos, dtype=float) for engine in self.input_engines])
+
+        self.taps = [1]
+
+        for engine in self.input_engines:
+            if len(engine.taps) > 1:
+                self.taps = np.convolve(self.taps, engine.taps)
+
+        self.process_gain(self.get_gain())
+        self.process_flip_phase()
+
+    def get_total_delay(self) -> float:
+        """
+        Returns:
+            float:
+                The delay of the cascade itself plus
+                the total delays of all the input cells
+        """
+
+        return self.get_delay() + sum(engine.get_total_delay() for engine in self.input_engines)
+
     def generate_title(self) -> str:
         """
         Create a string to display as graph title.
@@ -68,9 +105,13 @@ class CascadeEngine(GraphEngine):
 
         self.input_engines.append(engine)
 
+        self.mark_dirty()
+
     def remove_last_engine(self) -> None:
         """
         Remove the last input engine in the list
         """
 
-        del self.input_engines[-1]
\ No newline at end of file
+        del self.input_engines[-1]
+
+        self.mark_dirty()
\ No newline at end of file
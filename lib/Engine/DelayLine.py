@@ -0,0 +1,49 @@
+import numpy as np
+
+class DelayLine:
+    """
+    Streaming delay of blocks of samples by a whole amount of samples
+    """
+
+    def __init__(self, delay: int, channels: int = 1) -> None:
+        """
+        Args:
+            delay (int): The delay in samples
+            channels (int, optional): Amount of channels of the blocks. Defaults to 1.
+
+        Raises:
+            ValueError: In case of a negative delay
+        """
+
+        if delay < 0:
+            raise ValueError("Delay must be a positive value")
+
+        self.delay = int(delay)
+        self.channels = channels
+
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Fills the line with silence
+        """
+
+        self.buffer = np.zeros((self.delay, self.channels))
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            block (np.ndarray): Samples of shape (frames, channels)
+
+        Returns:
+            np.ndarray: The delayed samples, same shape as the block
+        """
+
+        if self.delay == 0:
+            return block
+
+        line = np.concatenate([self.buffer, block])
+
+        self.buffer = line[len(block):]
+
+        return line[:len(block)]
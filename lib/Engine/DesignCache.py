@@ -0,0 +1,120 @@
+from collections import OrderedDict
+from typing import Hashable
+
+class DesignCache:
+    """
+    Least recently used cache of filter designs, keyed
+    by the parameters they were designed from.
+
+    Shared by all the input cells so that going back to
+    a previous design does not compute it again.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """
+        Args:
+            maxsize (int, optional):
+                Maximum amount of designs kept, 0 disables the cache.
+                Defaults to 256.
+        """
+
+        self.designs = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        self.set_maxsize(maxsize)
+
+    def set_maxsize(self, maxsize: int) -> None:
+        """
+        Args:
+            maxsize (int): Maximum amount of designs kept, 0 disables the cache
+
+        Raises:
+            ValueError: In case of a negative number
+        """
+
+        if maxsize < 0:
+            self.maxsize = 256
+            raise ValueError("Cache size must be a positive integer or zero")
+        else:
+            self.maxsize = maxsize
+
+        self.evict()
+
+    def get_maxsize(self) -> int:
+        """
+        Returns:
+            int: The current maximum amount of designs kept
+        """
+
+        return self.maxsize
+
+    def get(self, key: Hashable) -> dict | None:
+        """
+        Args:
+            key (Hashable): The parameters of the design
+
+        Returns:
+            dict | None: The stored design, None if there is none
+        """
+
+        design = self.designs.get(key)
+
+        if design is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.designs.move_to_end(key)
+
+        return design
+
+    def put(self, key: Hashable, design: dict) -> None:
+        """
+        The design must not be modified in place afterwards.
+
+        Args:
+            key (Hashable): The parameters of the design
+            design (dict): The data to store
+        """
+
+        self.designs[key] = design
+        self.designs.move_to_end(key)
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Drops the least recently used designs above the size limit
+        """
+
+        while len(self.designs) > self.maxsize:
+            self.designs.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drops all the designs and resets the counters
+        """
+
+        self.designs.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_hits(self) -> int:
+        """
+        Returns:
+            int: Amount of lookups that found a design
+        """
+
+        return self.hits
+
+    def get_misses(self) -> int:
+        """
+        Returns:
+            int: Amount of lookups that did not find a design
+        """
+
+        return self.misses
+
+    def __len__(self) -> int:
+
+        return len(self.designs)
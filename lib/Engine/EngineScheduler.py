@@ -0,0 +1,125 @@
+from concurrent.futures import Executor
+
+from lib.Engine.GraphEngine import GraphEngine
+from lib.Engine.FrequencyGrid import FrequencyGrid
+
+def compute_results(engine: GraphEngine, frequency_grid: FrequencyGrid) -> dict:
+    """
+    Computes an engine and returns its results.
+    Meant to be run in another process.
+
+    Args:
+        engine (GraphEngine): The engine to compute
+        frequency_grid (FrequencyGrid): The grid of the calling process
+
+    Returns:
+        dict: The results as returned by GraphEngine.get_results()
+    """
+
+    engine.frequency_grid = frequency_grid
+    engine.compute()
+
+    return engine.get_results()
+
+class EngineScheduler:
+    """
+    Dependency graph of the engines, from the input cells
+    to the output sum through the cascades.
+
+    Computes only the engines whose parameters or inputs changed,
+    in topological order, each one at most once per call.
+    """
+
+    def __init__(self, output_engine: GraphEngine) -> None:
+        """
+        Args:
+            output_engine (GraphEngine):
+                The engine at the end of the graph, usually the SumEngine
+        """
+
+        self.output_engine = output_engine
+
+    def get_sorted_engines(self) -> list[GraphEngine]:
+        """
+        Returns:
+            list[GraphEngine]:
+                All the engines of the graph, every engine
+                coming after all of its input engines
+        """
+
+        sorted_engines = []
+        visited = set()
+
+        def visit(engine: GraphEngine) -> None:
+
+            if id(engine) in visited:
+                return
+
+            visited.add(id(engine))
+
+            for input_engine in engine.input_engines:
+                visit(input_engine)
+
+            sorted_engines.append(engine)
+
+        visit(self.output_engine)
+
+        return sorted_engines
+
+    def get_outdated_engines(self) -> list[GraphEngine]:
+        """
+        Returns:
+            list[GraphEngine]:
+                The engines that compute() would compute,
+                in the order it would compute them
+        """
+
+        outdated_engines = []
+
+        for engine in self.get_sorted_engines():
+            if engine.needs_compute() or any(
+                input_engine in outdated_engines for input_engine in engine.input_engines
+            ):
+                outdated_engines.append(engine)
+
+        return outdated_engines
+
+    def compute(self, executor: Executor = None) -> list[GraphEngine]:
+        """
+        Computes the outdated engines.
+
+        Args:
+            executor (Executor, optional):
+                A process pool to compute the input cells in parallel,
+                before the cascades and sums which only combine them.
+                Defaults to None.
+
+        Returns:
+            list[GraphEngine]: The engines that were computed, in order
+        """
+
+        computed_engines = []
+
+        if executor:
+            input_cells = [engine for engine in self.get_outdated_engines() if not engine.input_engines]
+
+            results = executor.map(
+                compute_results,
+                input_cells,
+                [engine.get_frequency_grid() for engine in input_cells]
+            )
+
+            for engine, engine_results in zip(input_cells, results):
+                engine.set_results(engine_results, engine.modifications)
+                computed_engines.append(engine)
+
+        with GraphEngine.profiler.capture():
+            for engine in self.get_sorted_engines():
+                if engine.needs_compute():
+                    engine.compute()
+                    computed_engines.append(engine)
+
+        for engine in computed_engines:
+            GraphEngine.profiler.count(engine)
+
+        return computed_engines
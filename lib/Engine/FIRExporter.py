@@ -0,0 +1,219 @@
+from pathlib import Path
+
+import numpy as np
+
+from lib.Engine.GraphEngine import GraphEngine
+from lib.Engine.SumEngine import SumEngine
+
+class FIRExporter:
+    """
+    Converts a computed cell, cascade or sum into a single FIR filter
+    of a given amount of taps, with a linear or a minimum phase.
+
+    The combined response of the engine is evaluated on a dense FFT grid
+    from its SOS, taps and delays, like StreamProcessor runs them. The
+    linear phase taps are the windowed inverse FFT of its magnitude, the
+    minimum phase taps are obtained from its real cepstrum. The phase of
+    the engine itself is not kept, only its magnitude.
+    """
+
+    phases = ["linear", "minimum"]
+
+    # Magnitudes below this level relative to the peak are raised to it,
+    # to keep the logarithm of the cepstrum finite
+    floor_db = -200
+
+    def __init__(self,
+        engine:     GraphEngine,
+        numtaps:    int = 4096,
+        phase:      str = "linear",
+        window:     str | tuple = "hann"
+    ) -> None:
+        """
+        Args:
+            engine (GraphEngine): A computed cell, cascade or sum
+            numtaps (int, optional): Amount of taps of the FIR. Defaults to 4096.
+            phase (str, optional): "linear" or "minimum". Defaults to "linear".
+            window (str | tuple, optional):
+                Window applied to the taps, in the format of
+                scipy.signal.get_window(). Defaults to "hann".
+
+        Raises:
+            ValueError: In case of an invalid parameter or an engine that is not computed
+        """
+
+        if numtaps <= 0:
+            raise ValueError("Amount of taps must be a positive integer")
+
+        if phase not in self.phases:
+            raise ValueError(f"Phase must be one of {', '.join(self.phases)}")
+
+        self.engine = engine
+        self.numtaps = int(numtaps)
+        self.phase = phase
+        self.window = window
+
+        if isinstance(engine, SumEngine):
+            self.branch_engines = list(engine.input_engines)
+        else:
+            self.branch_engines = [engine]
+
+        if any(branch_engine.needs_compute() for branch_engine in self.branch_engines + [engine]):
+            raise ValueError("The engine must be computed before exporting it")
+
+        # Fine enough for the truncation to matter more than the aliasing
+        longest_taps = max(len(branch_engine.taps) for branch_engine in self.branch_engines)
+        self.nfft = 2 ** int(np.ceil(np.log2(max(8 * self.numtaps, 4 * longest_taps, 2 ** 14))))
+
+        self.taps = None
+        self.report = None
+
+    def compute_response(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: The complex response of the engine at the nfft // 2 + 1 FFT frequencies
+        """
+
+        omega = np.linspace(0, np.pi, self.nfft // 2 + 1)
+        z1 = np.exp(-1j * omega)
+        z2 = z1 * z1
+
+        # The sum has no filter of its own, only its delay
+        sum_delay = self.engine.get_delay() if isinstance(self.engine, SumEngine) else 0
+
+        response = np.zeros(len(omega), dtype=complex)
+
+        for branch_engine in self.branch_engines:
+            sos = np.array(branch_engine.sos, dtype=float)
+
+            branch = np.fft.rfft(branch_engine.taps, self.nfft)
+
+            for b0, b1, b2, a0, a1, a2 in sos:
+                branch *= (b0 + b1 * z1 + b2 * z2) / (a0 + a1 * z1 + a2 * z2)
+
+            # The bulk delay of linear phase taps is part of the taps themselves
+            delay = branch_engine.get_total_delay() - branch_engine.taps_delay + sum_delay
+
+            response += branch * np.exp(-1j * omega * delay)
+
+        return response
+
+    def design(self) -> np.ndarray:
+        """
+        Computes the taps and the approximation error, see get_report()
+
+        Returns:
+            np.ndarray: The taps
+        """
+
+        from scipy.signal import get_window
+
+        response = self.compute_response()
+        omega = np.linspace(0, np.pi, len(response))
+
+        magnitude = np.abs(response)
+        magnitude = np.maximum(magnitude, magnitude.max() * 10 ** (self.floor_db / 20))
+
+        if self.phase == "linear":
+            self.latency = (self.numtaps - 1) / 2
+
+            ideal = magnitude * np.exp(-1j * omega * self.latency)
+            window = get_window(self.window, self.numtaps, fftbins=False)
+
+        else:
+            self.latency = 0
+
+            # Folding the real cepstrum onto positive quefrencies
+            # gives the log spectrum of the minimum phase response
+            cepstrum = np.fft.irfft(np.log(magnitude), self.nfft)
+            cepstrum[1:self.nfft // 2] *= 2
+            cepstrum[self.nfft // 2 + 1:] = 0
+
+            ideal = np.exp(np.fft.rfft(cepstrum))
+
+            # Decaying half of the window, the energy being at the start
+            window = get_window(self.window, 2 * self.numtaps, fftbins=False)[self.numtaps:]
+
+        self.taps = np.fft.irfft(ideal, self.nfft)[:self.numtaps] * window
+
+        self.report = self.compute_report(magnitude, ideal)
+
+        return self.taps
+
+    def compute_report(self, magnitude: np.ndarray, ideal: np.ndarray) -> dict[str, float]:
+        """
+        Args:
+            magnitude (np.ndarray): The magnitude of the engine on the FFT grid
+            ideal (np.ndarray): The response the taps approximate on the FFT grid
+
+        Returns:
+            dict[str, float]: See get_report()
+        """
+
+        fir_response = np.fft.rfft(self.taps, self.nfft)
+        fir_magnitude = np.maximum(np.abs(fir_response), magnitude.min())
+
+        error_db = np.abs(20 * np.log10(fir_magnitude / magnitude))
+
+        # Deep stopbands would dominate the errors in dB
+        relevant = magnitude >= magnitude.max() * 10 ** (-60 / 20)
+
+        return {
+            "numtaps": self.numtaps,
+            "phase": self.phase,
+            "latency": self.latency,
+            "max_error_db": float(error_db[relevant].max()),
+            "rms_error_db": float(np.sqrt(np.mean(error_db[relevant] ** 2))),
+            "relative_error": float(np.linalg.norm(fir_response - ideal) / np.linalg.norm(ideal))
+        }
+
+    def get_taps(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: The taps, designed on first call
+        """
+
+        if self.taps is None:
+            self.design()
+
+        return self.taps
+
+    def get_report(self) -> dict[str, float]:
+        """
+        Returns:
+            dict[str, float]:
+                The amount of taps, the phase, the latency in samples, the
+                maximum and RMS magnitude errors in dB where the magnitude
+                is within 60 dB of its peak, and the norm of the complex error
+                relative to the ideal response, over the whole FFT grid
+        """
+
+        if self.report is None:
+            self.design()
+
+        return self.report
+
+    def save(self, path: str | Path) -> None:
+        """
+        Writes the taps as a 32 bits float WAV file, as text with one
+        tap per line, or as a NumPy array, depending on the suffix
+
+        Args:
+            path (str | Path): The .wav, .txt, .csv or .npy file to write
+
+        Raises:
+            ValueError: In case of an unknown suffix
+        """
+
+        from scipy.io import wavfile
+
+        suffix = Path(path).suffix.lower()
+
+        if suffix == ".wav":
+            wavfile.write(path, int(self.engine.get_sample_frequency()), self.get_taps().astype(np.float32))
+        elif suffix in [".txt", ".csv"]:
+            np.savetxt(path, self.get_taps(), fmt="%.10e")
+        elif suffix == ".npy":
+            np.save(path, self.get_taps())
+        else:
+            raise ValueError("The file must be a .wav, .txt, .csv or .npy file")
@@ -0,0 +1,56 @@
+import numpy as np
+
+from lib.Engine.AudioFileWriter import AudioFileWriter
+from lib.Engine.NullAudioBackend import NullAudioBackend
+
+class FileAudioBackend(NullAudioBackend):
+    """
+    Audio output writing the samples to a 32 bits float WAV or raw
+    file, to listen to or check the monitored signal afterwards.
+
+    Unlike a sound card, it requests the blocks as fast as they are
+    processed by default, see NullAudioBackend.
+    """
+
+    def __init__(self,
+        path:               str,
+        sample_frequency:   float = 48000,
+        channels:           int = 2,
+        block_size:         int = 256,
+        realtime:           bool = False,
+        duration:           float = None
+    ) -> None:
+        """
+        Args:
+            path (str): The file to write, WAV if it ends with .wav, raw otherwise
+            sample_frequency (float, optional): The sample frequency in Hertz. Defaults to 48000.
+            channels (int, optional): Amount of output channels. Defaults to 2.
+            block_size (int, optional): Amount of frames requested per callback. Defaults to 256.
+            realtime (bool, optional): Request the blocks at the pace of a sound card. Defaults to False.
+            duration (float, optional): Seconds of audio after which the output stops by itself. Defaults to None.
+
+        Raises:
+            ValueError: In case of a zero or negative parameter
+        """
+
+        super().__init__(sample_frequency, channels, block_size, realtime, duration)
+
+        self.path = path
+        self.writer = None
+
+    def open_output(self) -> None:
+
+        try:
+            self.writer = AudioFileWriter(self.path, self.sample_frequency, self.channels)
+        except OSError as e:
+            raise ValueError(f"Can't write {self.path}: {e}")
+
+    def play(self, block: np.ndarray) -> None:
+
+        self.writer.write(block)
+
+    def close_output(self) -> None:
+
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
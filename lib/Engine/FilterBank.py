@@ -0,0 +1,227 @@
+import copy
+
+import numpy as np
+
+from lib.Engine.GraphEngine import GraphEngine
+from lib.Engine.SumEngine import SumEngine
+from lib.Engine.FrequencyGrid import FrequencyGrid
+from lib.Engine.EngineScheduler import EngineScheduler
+
+class FilterBank:
+    """
+    Responses of many channels sharing the same topology, for instance
+    the cells, cascades or sums driving each speaker of an array.
+
+    The SOS of all the channels are stored in a single array padded
+    with unity sections, and the FIR taps in a single array padded with
+    zeros, so that all the responses are evaluated at once instead of
+    computing every engine of every channel.
+    """
+
+    def __init__(self, engines: list[GraphEngine], frequency_grid: FrequencyGrid = None) -> None:
+        """
+        Args:
+            engines (list[GraphEngine]):
+                One cell, cascade or sum per channel. Copies of them are
+                designed by the filter bank, the engines themselves are
+                left untouched and their own response is not computed.
+            frequency_grid (FrequencyGrid, optional):
+                The frequencies to evaluate at.
+                Defaults to the grid of the first engine.
+
+        Raises:
+            ValueError: If the channels don't share their topology or sample frequency
+        """
+
+        if not engines:
+            raise ValueError("A filter bank needs at least one channel")
+
+        self.sample_frequency = engines[0].get_sample_frequency()
+        self.frequency_grid = frequency_grid or engines[0].get_frequency_grid()
+
+        # Each cascade of a sum is a branch, any other engine is a single one
+        branch_engines = []
+        self.sum_delays = np.zeros(len(engines))
+
+        for channel, engine in enumerate(engines):
+            if engine.get_sample_frequency() != self.sample_frequency:
+                raise ValueError("All the channels must have the same sample frequency")
+
+            engine = self.design_copy(engine)
+
+            if isinstance(engine, SumEngine):
+                branch_engines.append(engine.input_engines)
+                self.sum_delays[channel] = engine.get_delay()
+            else:
+                branch_engines.append([engine])
+
+        self.branches = len(branch_engines[0])
+
+        if any(len(branches) != self.branches for branches in branch_engines):
+            raise ValueError("All the channels must have the same amount of cascades")
+
+        filters = [branch_engine for branches in branch_engines for branch_engine in branches]
+
+        sos = [np.array(engine.sos, dtype=float) for engine in filters]
+        taps = [np.asarray(engine.taps, dtype=float) for engine in filters]
+
+        # Shape (channels * branches, sections, 6), padded with unity sections
+        self.sos = np.zeros((len(filters), max(len(s) for s in sos), 6))
+        self.sos[:, :, 0] = 1
+        self.sos[:, :, 3] = 1
+
+        # Shape (channels * branches, taps), padded with zeros
+        self.taps = np.zeros((len(filters), max(len(t) for t in taps)))
+
+        self.taps_delays = np.zeros(len(filters))
+
+        for i in range(len(filters)):
+            self.sos[i, :len(sos[i])] = sos[i]
+            self.taps[i, :len(taps[i])] = taps[i]
+
+            # Like GraphEngine.compute_frequency_response()
+            if len(taps[i]) > 1 and np.allclose(taps[i], taps[i][::-1]):
+                self.taps_delays[i] = (len(taps[i]) - 1) / 2
+
+        # Own delays of each branch, the bulk delay of the taps excluded
+        self.delays = np.array([
+            engine.get_delay() + sum(input_engine.get_delay() for input_engine in engine.input_engines)
+            for engine in filters
+        ])
+
+        self.channels = len(engines)
+        self.responses = None
+
+    @staticmethod
+    def design_copy(engine: GraphEngine) -> GraphEngine:
+        """
+        Designs shallow copies of an engine and of its inputs, like
+        ComputeTask does, so that the SOS, taps and revisions of the
+        engines stay consistent with their computed results
+
+        Args:
+            engine (GraphEngine): A cell, cascade or sum
+
+        Returns:
+            GraphEngine: The designed copy of the engine
+        """
+
+        copies = {}
+
+        for designed_engine in EngineScheduler(engine).get_sorted_engines():
+            engine_copy = copy.copy(designed_engine)
+            engine_copy.input_engines = [
+                copies.get(id(input_engine), input_engine)
+                for input_engine in designed_engine.input_engines
+            ]
+            engine_copy.design()
+
+            copies[id(designed_engine)] = engine_copy
+
+        return copies[id(engine)]
+
+    def evaluate(self) -> None:
+        """
+        Evaluates the responses of all the channels
+        """
+
+        self.frequencies = self.frequency_grid.get_frequencies(self.sample_frequency)
+
+        omega = 2 * np.pi * self.frequencies / self.sample_frequency
+        z1 = np.exp(-1j * omega)
+        z2 = z1 * z1
+
+        # Shape (channels * branches, sections, frequencies)
+        numerators = self.sos[:, :, 0, None] + self.sos[:, :, 1, None] * z1 + self.sos[:, :, 2, None] * z2
+        denominators = self.sos[:, :, 3, None] + self.sos[:, :, 4, None] * z1 + self.sos[:, :, 5, None] * z2
+
+        responses = np.prod(numerators / denominators, axis=1)
+
+        if self.taps.shape[1] > 1:
+            fir_responses = self.taps @ np.exp(-1j * np.outer(np.arange(self.taps.shape[1]), omega))
+
+            # The bulk delay is handled like the delays, see below
+            responses *= fir_responses * np.exp(1j * np.outer(self.taps_delays, omega))
+
+        # Total delay of each branch, the delay common to the branches
+        # of a channel is applied after summing them, as SumEngine does
+        total_delays = (self.delays + self.taps_delays).reshape(self.channels, self.branches)
+        common_delays = np.min(total_delays, axis=1)
+
+        branch_delays = (total_delays - common_delays[:, None]).reshape(-1)
+        responses *= np.exp(-1j * np.outer(branch_delays, omega))
+
+        self.undelayed_responses = responses.reshape(self.channels, self.branches, -1).sum(axis=1)
+        self.total_delays = common_delays + self.sum_delays
+
+        self.responses = self.undelayed_responses * np.exp(-1j * np.outer(self.total_delays, omega))
+
+    def get_channels(self) -> int:
+        """
+        Returns:
+            int: Amount of channels of the bank
+        """
+
+        return self.channels
+
+    def get_frequencies(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: The frequencies the responses are evaluated at
+        """
+
+        return self.frequencies
+
+    def get_responses(self, channel: int = None) -> np.ndarray:
+        """
+        Args:
+            channel (int, optional): The channel to return. Defaults to all of them.
+
+        Returns:
+            np.ndarray:
+                Complex response of shape (frequencies,) for a single
+                channel, or (channels, frequencies) for all of them
+        """
+
+        return self.responses if channel is None else self.responses[channel]
+
+    def get_magnitude_db(self, channel: int = None) -> np.ndarray:
+        """
+        Args:
+            channel (int, optional): The channel to return. Defaults to all of them.
+
+        Returns:
+            np.ndarray: Magnitude in dB, shaped like get_responses()
+        """
+
+        return 20 * np.log10(np.abs(self.get_responses(channel)))
+
+    def get_phase_deg(self, channel: int = None) -> np.ndarray:
+        """
+        Args:
+            channel (int, optional): The channel to return. Defaults to all of them.
+
+        Returns:
+            np.ndarray: Phase in degrees between -180 and 180, shaped like get_responses()
+        """
+
+        return np.angle(self.get_responses(channel), deg=True)
+
+    def get_group_delay_ms(self, channel: int = None) -> np.ndarray:
+        """
+        Args:
+            channel (int, optional): The channel to return. Defaults to all of them.
+
+        Returns:
+            np.ndarray:
+                Group delay in milliseconds, with one point less than
+                the frequencies, shaped like get_responses() otherwise
+        """
+
+        # Unwrapped without the delays, which are added analytically
+        phase_rad = np.unwrap(np.angle(self.undelayed_responses), axis=-1)
+
+        group_delay = -np.diff(phase_rad, axis=-1) / np.diff(2 * np.pi * self.frequencies)
+        group_delay_ms = group_delay * 1000 + self.total_delays[:, None] / self.sample_frequency * 1000
+
+        return group_delay_ms if channel is None else group_delay_ms[channel]
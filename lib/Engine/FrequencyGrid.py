@@ -0,0 +1,256 @@
+import numpy as np
+
+class FrequencyGrid:
+    """
+    Frequencies at which the engines evaluate their response.
+
+    One instance is shared by all the engines so that the responses
+    of the cells, cascades and sum can be combined point by point.
+    """
+
+    def __init__(self,
+        spacing:            str = "log",
+        points:             int = 500,
+        points_per_octave:  int = 48,
+        minimum_frequency:  float = 10,
+        maximum_frequency:  float = None,
+        frequencies:        list[float] = None
+    ) -> None:
+        """
+        Args:
+            spacing (str, optional):
+                "linear", "log", "octave" or "custom".
+                Defaults to "log".
+            points (int, optional):
+                Amount of points for the linear and log spacings.
+                Defaults to 500.
+            points_per_octave (int, optional):
+                Amount of points per octave for the octave spacing.
+                Defaults to 48.
+            minimum_frequency (float, optional):
+                Lowest frequency for the log and octave spacings in Hertz.
+                Defaults to 10.
+            maximum_frequency (float, optional):
+                Highest frequency in Hertz, capped to fs/2.
+                Defaults to fs/2.
+            frequencies (list[float], optional):
+                Frequencies in Hertz for the custom spacing.
+                Defaults to None.
+        """
+
+        self.set_spacing(spacing)
+        self.set_points(points)
+        self.set_points_per_octave(points_per_octave)
+        self.set_minimum_frequency(minimum_frequency)
+        self.set_maximum_frequency(maximum_frequency)
+        self.set_custom_frequencies(frequencies)
+
+        if self.get_spacing() == "custom" and frequencies is None:
+            raise ValueError("A custom grid needs a list of frequencies")
+
+    def set_spacing(self, spacing: str) -> None:
+        """
+        Args:
+            spacing (str): "linear", "log", "octave" or "custom"
+
+        Raises:
+            ValueError: Raised in case of an invalid string
+        """
+
+        self.cache = {}
+
+        if spacing.casefold() not in ["linear", "log", "octave", "custom"]:
+            self.spacing = "log"
+            raise ValueError("Incorrect frequency spacing")
+        else:
+            self.spacing = spacing.casefold()
+
+    def get_spacing(self) -> str:
+        """
+        Returns:
+            str: The current frequency spacing
+        """
+
+        return self.spacing
+
+    def set_points(self, points: int) -> None:
+        """
+        Args:
+            points (int): Amount of points for the linear and log spacings
+
+        Raises:
+            ValueError: In case of less than 2 points
+        """
+
+        self.cache = {}
+
+        if points < 2:
+            self.points = 500
+            raise ValueError("A grid needs at least 2 points")
+        else:
+            self.points = points
+
+    def set_points_per_octave(self, points_per_octave: int) -> None:
+        """
+        Args:
+            points_per_octave (int): Amount of points per octave for the octave spacing
+
+        Raises:
+            ValueError: In case of a zero or negative number
+        """
+
+        self.cache = {}
+
+        if points_per_octave <= 0:
+            self.points_per_octave = 48
+            raise ValueError("Points per octave must be a positive integer")
+        else:
+            self.points_per_octave = points_per_octave
+
+    def set_minimum_frequency(self, minimum_frequency: float) -> None:
+        """
+        Args:
+            minimum_frequency (float): Lowest frequency in Hertz
+
+        Raises:
+            ValueError: In case of a zero or negative number
+        """
+
+        self.cache = {}
+
+        if minimum_frequency <= 0:
+            self.minimum_frequency = 10
+            raise ValueError("Minimum frequency must be a positive value")
+        else:
+            self.minimum_frequency = minimum_frequency
+
+    def set_maximum_frequency(self, maximum_frequency: float) -> None:
+        """
+        Args:
+            maximum_frequency (float): Highest frequency in Hertz, None for fs/2
+
+        Raises:
+            ValueError: In case of a zero or negative number
+        """
+
+        self.cache = {}
+
+        if maximum_frequency is not None and maximum_frequency <= 0:
+            self.maximum_frequency = None
+            raise ValueError("Maximum frequency must be a positive value")
+        else:
+            self.maximum_frequency = maximum_frequency
+
+    def get_maximum_frequency(self) -> float:
+        """
+        Returns:
+            float: The current highest frequency in Hertz, None for fs/2
+        """
+
+        return self.maximum_frequency
+
+    def set_custom_frequencies(self, frequencies: list[float]) -> None:
+        """
+        Args:
+            frequencies (list[float]): Frequencies in Hertz for the custom spacing, or None
+
+        Raises:
+            ValueError: In case of an empty list or a zero or negative frequency
+        """
+
+        self.cache = {}
+
+        if frequencies is not None and (len(frequencies) == 0 or min(frequencies) <= 0):
+            self.custom_frequencies = None
+            raise ValueError("Custom frequencies must be a non-empty list of positive values")
+        else:
+            self.custom_frequencies = None if frequencies is None else list(frequencies)
+
+    def get_custom_frequencies(self) -> list[float]:
+        """
+        Returns:
+            list[float]: The current frequencies of the custom spacing, or None
+        """
+
+        return self.custom_frequencies
+
+    def get_description(self) -> dict:
+        """
+        Returns:
+            dict: The settings of the grid, as accepted by the constructor
+        """
+
+        return {
+            "spacing": self.get_spacing(),
+            "points": self.points,
+            "points_per_octave": self.points_per_octave,
+            "minimum_frequency": self.minimum_frequency,
+            "maximum_frequency": self.maximum_frequency,
+            "frequencies": None if self.custom_frequencies is None else list(self.custom_frequencies)
+        }
+
+    def get_key(self, sample_frequency: float) -> tuple:
+        """
+        Args:
+            sample_frequency (float): The sample frequency in Hertz
+
+        Returns:
+            tuple:
+                Hashable summary of the settings, equal for
+                two grids giving the same frequencies
+        """
+
+        return (
+            self.get_spacing(),
+            self.points,
+            self.points_per_octave,
+            self.minimum_frequency,
+            self.maximum_frequency,
+            None if self.custom_frequencies is None else tuple(self.custom_frequencies),
+            sample_frequency
+        )
+
+    def get_frequencies(self, sample_frequency: float) -> np.ndarray:
+        """
+        The result is cached per sample frequency and
+        must not be modified in place.
+
+        Args:
+            sample_frequency (float): The sample frequency in Hertz
+
+        Returns:
+            np.ndarray: The frequencies in Hertz, all under fs/2
+
+        Raises:
+            ValueError: If none of the custom frequencies is under fs/2
+        """
+
+        if sample_frequency in self.cache:
+            return self.cache[sample_frequency]
+
+        nyquist = sample_frequency / 2
+        maximum_frequency = min(self.maximum_frequency or nyquist, nyquist)
+
+        match self.get_spacing():
+            case "linear":
+                # Same points as sosfreqz(worN=points)
+                frequencies = np.linspace(0, maximum_frequency, self.points, endpoint=False)
+
+            case "log":
+                frequencies = np.geomspace(self.minimum_frequency, maximum_frequency, self.points, endpoint=False)
+
+            case "octave":
+                octaves = np.log2(maximum_frequency / self.minimum_frequency)
+                points = max(int(np.ceil(octaves * self.points_per_octave)), 2)
+                frequencies = self.minimum_frequency * 2 ** (np.arange(points) / self.points_per_octave)
+
+            case "custom":
+                frequencies = np.sort(np.asarray(self.custom_frequencies, dtype=float))
+                frequencies = frequencies[frequencies < nyquist]
+
+                if len(frequencies) == 0:
+                    raise ValueError(f"No custom frequency is below the Nyquist frequency of {nyquist:g} Hz")
+
+        self.cache[sample_frequency] = frequencies
+
+        return frequencies
@@ -1,8 +1,12 @@
-from PyQt6.QtCore import QObject
 import numpy as np
-from scipy.signal import sos2zpk
+from lib.Engine.FrequencyGrid import FrequencyGrid
+from lib.Engine.Profiler import Profiler
 
-class GraphEngine(QObject):
+# scipy.signal takes longer to import than the whole GUI, so it is
+# imported by the methods using it. The first computation, which runs
+# in a worker thread, pays for it instead of the startup.
+
+class GraphEngine:
     """
     Base class for computing the data to display in a graph
 
@@ -10,17 +14,27 @@ class GraphEngine(QObject):
     virtual method(s)
     """
 
+    # Shared by all the engines unless set_frequency_grid() is used
+    frequency_grid = FrequencyGrid()
+
+    # Shared by all the engines and the graphs, see Profiler
+    profiler = Profiler()
+
+    # Attributes written by compute(), see get_results()
+    result_attributes = ["sos", "taps", "taps_delay", "filter", "zpk_delay"]
+
     def __init__(self,
         id:         int = 0,
         gain:       float = 0,
         flip_phase: bool = False,
-        delay:      int = 0,
+        delay:      float = 0,
         *args, **kwargs
     ) -> None:
         """
         Args:
             gain (float, optional): Overall gain to apply. Defaults to 0.
             flip_phase (bool, optional): Flip phase status. Defaults to False.
+            delay (float, optional): Delay in samples, can be fractional. Defaults to 0.
         """
 
         super().__init__(*args, **kwargs)
@@ -28,6 +42,7 @@ class GraphEngine(QObject):
         self.filter = {
             "frequencies": [],
             "magnitude": [],
+            "magnitude_undelayed": [],
             "magnitude_lin": [],
             "magnitude_db": [],
             "phase_rad": [],
@@ -37,8 +52,19 @@ class GraphEngine(QObject):
             "group_delay_ms": []
         }
 
+        self.taps = [1]
+        self.taps_delay = 0
+        self.zpk = None
+        self.zpk_delay = 0
+
+        # Bookkeeping for the EngineScheduler
+        self.input_engines = []
+        self.dirty = True
+        self.modifications = 0
+        self.revision = 0
+        self.input_revisions = []
+
         self.set_sample_frequency(48000)
-        self.frequency_points = 5000
         self.id = id
         self.set_gain(gain)
         self.set_flip_phase(flip_phase)
@@ -53,19 +79,105 @@ class GraphEngine(QObject):
 
         raise NotImplementedError
 
+    def design(self) -> None:
+        """
+        Computes the SOS and FIR taps from the parameters, without
+        evaluating the frequency response. The input engines must
+        have been designed before.
+
+        Nothing to do for engines without filters of their own.
+        """
+
+        pass
+
     def compute(self) -> None:
         """
         Computes the generic data after the specific data
         """
 
-        self.compute_specific()
+        with self.profiler.measure("compute_specific"):
+            self.compute_specific()
+
+        # The delays are computed before applying the delay term,
+        # so that unwrapping does not have to deal with its steep phase
+        with self.profiler.measure("compute_phase_delay"):
+            self.compute_phase_delay()
+
+        with self.profiler.measure("compute_group_delay"):
+            self.compute_group_delay()
+
+        with self.profiler.measure("process_delay"):
+            self.process_delay()
+
+        with self.profiler.measure("wrap_phase"):
+            self.wrap_phase()
+            self.remove_phase_discontinuities()
+
+        # Zeros, poles and gain are only computed once displayed, see get_zpk()
+        self.zpk = None
+        self.zpk_delay = int(self.get_total_delay() - self.taps_delay)
+
+        self.dirty = False
+        self.update_revisions()
+
+    def get_results(self) -> dict:
+        """
+        Returns:
+            dict: The data written by compute(), without the parameters
+        """
+
+        return {name: getattr(self, name) for name in self.result_attributes if hasattr(self, name)}
+
+    def set_results(self, results: dict, modifications: int) -> None:
+        """
+        Stores data computed somewhere else, for instance
+        by a copy of the engine in a worker thread.
 
-        self.wrap_phase()
-        self.remove_phase_discontinuities()
+        Args:
+            results (dict):
+                The data as returned by get_results()
+            modifications (int):
+                The modification count of the engine the results were
+                computed from. The engine stays dirty if it was
+                modified in the meantime.
+        """
 
-        self.generate_zpk()
-        self.compute_phase_delay()
-        self.compute_group_delay()
+        for name, value in results.items():
+            setattr(self, name, value)
+
+        # Computed again from the new SOS when needed
+        self.zpk = None
+
+        self.dirty = self.modifications != modifications
+        self.update_revisions()
+
+    def update_revisions(self) -> None:
+        """
+        Records that new data is available, and which
+        input data it was computed from
+        """
+
+        self.revision += 1
+        self.input_revisions = [engine.revision for engine in self.input_engines]
+
+    def mark_dirty(self) -> None:
+        """
+        Flags the engine as needing to be computed again,
+        to be called by every setter
+        """
+
+        self.dirty = True
+        self.modifications += 1
+
+    def needs_compute(self) -> bool:
+        """
+        Returns:
+            bool:
+                True if a parameter changed or if an input engine
+                was computed again since the last computation
+        """
+
+        return self.dirty or self.input_revisions != [engine.revision for engine in self.input_engines]
 
     def generate_title(self) -> str:
         """
@@ -92,6 +204,14 @@ class GraphEngine(QObject):
 
         return self.filter['magnitude']
 
+    def get_magnitude_undelayed(self) -> list[float]:
+        """
+        Returns:
+            list[float]: The Y axis complex magnitude values before applying the delay
+        """
+
+        return self.filter['magnitude_undelayed']
+
     def get_magnitude_lin(self) -> list[float]:
         """
         Returns:
@@ -154,7 +274,7 @@ class GraphEngine(QObject):
 
     def remove_phase_discontinuities(self) -> None:
         """
-        In a wrapped phase array, replaces the two points before
+        In a wrapped phase array, replaces the point before
         each wrap with NaN. This is useful to prevent matplotlib
         from plotting vertical lines at the wrap locations.
 
@@ -162,23 +282,17 @@ class GraphEngine(QObject):
         disabling the vertical lines
         """
 
-        # Get sign of each point
-        # Negative  gives -1
-        # Positive  gives 1
-        # Zero      gives 0
-        signs = np.sign(self.filter['phase_deg'])
-
-        # Split the list in adjacent pairs
-        pairs = []
-        for i in range(len(signs) - 1):
-            pairs.append( (signs[i], signs[i + 1]) )
+        phase_deg = np.asarray(self.filter['phase_deg'])
 
-        # A pair of (-1, 1) indicates a wrap: find out the indexes of such pairs
-        pairs_indexes = [index for index, element in enumerate(pairs) if element == (-1, 1) or element == (1, -1)]
+        # A wrap is a jump of more than half a turn between two
+        # points of opposite signs. Going through an exact zero
+        # gives a null sign product and is never a wrap.
+        signs = np.sign(phase_deg)
+        wraps = (signs[:-1] * signs[1:] < 0) & (np.abs(np.diff(phase_deg)) > 180)
 
         # Replace all points before the wraps with NaN
-        self.filter['phase_deg_nan'] = self.filter['phase_deg'].copy()
-        self.filter['phase_deg_nan'][pairs_indexes] = np.nan
+        self.filter['phase_deg_nan'] = phase_deg.copy()
+        self.filter['phase_deg_nan'][:-1][wraps] = np.nan
 
     def wrap_phase(self) -> None:
         """
@@ -188,17 +302,88 @@ class GraphEngine(QObject):
         self.filter['phase_deg'] = ((self.filter['phase_deg'] + 180) % 360) - 180
         self.filter['phase_rad'] = ((self.filter['phase_rad'] + np.pi) % (2 * np.pi)) - np.pi
 
-    def generate_zpk(self) -> None:
+    def generate_zpk(self) -> tuple[np.ndarray, np.ndarray, float]:
+        """
+        Generates zero, poles and gain from the current SOS and FIR taps.
+        Rooting a polynomial of several hundred taps is slow, see get_zpk().
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, float]:
+                The zeros, poles and gain of the whole transfer function
+        """
+
+        from scipy.signal import sos2zpk, tf2zpk
+
+        z, p, k = sos2zpk(self.sos)
+
+        # A pure delay of D samples is D poles at the origin,
+        # only the integer part of the delay can be displayed
+        p = np.concatenate([p, np.zeros(self.zpk_delay)])
+
+        if len(self.taps) > 1:
+            fir_z, _, fir_k = tf2zpk(self.taps, [1])
+
+            # A causal FIR of N taps has N - 1 poles at the origin
+            z = np.concatenate([z, fir_z])
+            p = np.concatenate([p, np.zeros(len(self.taps) - 1)])
+            k = k * fir_k
+
+        return z, p, k
+
+    def get_zpk(self) -> tuple[np.ndarray, np.ndarray, float]:
+        """
+        The zeros, poles and gain are generated on the first call
+        after a computation, as only the pole-zero map needs them.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, float]:
+                The zeros, poles and gain of the whole transfer function
+        """
+
+        if self.zpk is None:
+            with self.profiler.measure("generate_zpk"):
+                self.zpk = self.generate_zpk()
+
+        return self.zpk
+
+    def compute_frequency_response(self) -> tuple[np.ndarray, np.ndarray]:
         """
-        Generates zero, poles and gain from the transfer function
+        Evaluates the frequency response of the current SOS,
+        followed by the current FIR taps if there are any.
+
+        The bulk delay of linear phase taps is left out of the
+        response and handled like the delay term, otherwise its
+        phase would be too steep to unwrap on a log grid.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]:
+                The frequencies and the complex frequency response
         """
 
-        self.z, self.p, self.k = sos2zpk(self.sos)
+        from scipy.signal import sosfreqz, freqz
+
+        frequencies = self.frequency_grid.get_frequencies(self.get_sample_frequency())
+
+        _, magnitude = sosfreqz(self.sos, worN=frequencies, fs=self.get_sample_frequency())
+
+        self.taps_delay = 0
+
+        if len(self.taps) > 1:
+            # Evaluated straight from the taps, no need to factorize them
+            _, fir_magnitude = freqz(self.taps, worN=frequencies, fs=self.get_sample_frequency())
+
+            if np.allclose(self.taps, self.taps[::-1]):
+                self.taps_delay = (len(self.taps) - 1) / 2
+                fir_magnitude = fir_magnitude * np.exp(2j * np.pi * frequencies * self.taps_delay / self.get_sample_frequency())
+
+            magnitude = magnitude * fir_magnitude
+
+        return frequencies, magnitude
 
     def compute_phase_delay(self) -> None:
 
         phase_delay = -np.unwrap(self.get_phase_rad()) / (2 * np.pi * self.get_frequencies())
-        phase_delay_ms = phase_delay * 1000
+        phase_delay_ms = phase_delay * 1000 + self.convert_samples_to_msec(self.get_total_delay())
 
         self.filter['phase_delay_ms'] = phase_delay_ms
 
@@ -208,7 +393,7 @@ class GraphEngine(QObject):
             -np.diff(np.unwrap(self.get_phase_rad()))
             / np.diff(2 * np.pi * self.get_frequencies())
         )
-        group_delay_ms = group_delay * 1000
+        group_delay_ms = group_delay * 1000 + self.convert_samples_to_msec(self.get_total_delay())
 
         self.filter['group_delay_ms'] = group_delay_ms
 
@@ -218,6 +403,8 @@ class GraphEngine(QObject):
             sample_frequency (float): The sample frequency in Hertz
         """
 
+        self.mark_dirty()
+
         if sample_frequency <= 0:
             self.fs = 48000
             raise ValueError("Sample frequency must be a positive value")
@@ -238,6 +425,8 @@ class GraphEngine(QObject):
             flip_phase (bool): The flip phase status
         """
 
+        self.mark_dirty()
+
         self.flip_phase = flip_phase
 
     def get_flip_phase(self) -> bool:
@@ -254,6 +443,8 @@ class GraphEngine(QObject):
             gain (float): The filter gain in dB
         """
 
+        self.mark_dirty()
+
         self.gain = gain
 
     def get_gain(self) -> float:
@@ -264,22 +455,62 @@ class GraphEngine(QObject):
 
         return self.gain
 
-    def set_delay(self, delay: int) -> None:
+    def set_delay(self, delay: float) -> None:
         """
         Args:
-            delay (int): The delay in samples
+            delay (float): The delay in samples, can be fractional
+
+        Raises:
+            ValueError: In case of a negative number
         """
 
-        self.delay = delay
+        self.mark_dirty()
+
+        if delay < 0:
+            self.delay = 0
+            raise ValueError("Delay must be a positive value")
+        else:
+            self.delay = delay
 
-    def get_delay(self) -> int:
+    def get_delay(self) -> float:
         """
         Returns:
-            int: The current delay in samples
+            float: The current delay in samples
         """
 
         return self.delay
 
+    def get_total_delay(self) -> float:
+        """
+        Returns:
+            float:
+                The delay in samples to apply on top of the response
+                computed by compute_specific(), including the bulk
+                delay of linear phase taps
+        """
+
+        return self.get_delay() + self.taps_delay
+
+    def set_frequency_grid(self, frequency_grid: FrequencyGrid) -> None:
+        """
+        Args:
+            frequency_grid (FrequencyGrid):
+                The grid to use instead of the shared one.
+                All the engines combined together must use the same grid.
+        """
+
+        self.mark_dirty()
+
+        self.frequency_grid = frequency_grid
+
+    def get_frequency_grid(self) -> FrequencyGrid:
+        """
+        Returns:
+            FrequencyGrid: The current frequency grid
+        """
+
+        return self.frequency_grid
+
     def process_flip_phase(self) -> None:
         """
         Applies the phase flip to the current transfer function
@@ -304,52 +535,49 @@ class GraphEngine(QObject):
         self.sos[0][1] *= gain_offset_lin
         self.sos[0][2] *= gain_offset_lin
 
-    def convert_msec_to_samples(self, msec: float) -> int:
+    def convert_msec_to_samples(self, msec: float) -> float:
         """
         Converts a time delay in milliseconds into samples
         according to the current sample frequency
 
         Args:
-            msec (int): The delay in milliseconds to convert
+            msec (float): The delay in milliseconds to convert
 
         Returns:
-            int: The result in samples
+            float: The result in samples, can be fractional
         """
 
-        return round(msec * self.get_sample_frequency() / 1000)
+        return msec * self.get_sample_frequency() / 1000
 
-    def convert_samples_to_msec(self, samples: int) -> float:
+    def convert_samples_to_msec(self, samples: float) -> float:
         """
         Converts a time delay in samples into milliseconds
         according to the current sample frequency
 
         Args:
-            msec (int): The delay in samples to convert
+            samples (float): The delay in samples to convert
 
         Returns:
-            int: The result in milliseconds
+            float: The result in milliseconds
         """
 
         return samples * 1000 / self.get_sample_frequency()
 
-    def process_delay(self, delay_samples: int) -> None:
+    def process_delay(self) -> None:
         """
-        Applies a delay to the current transfer function
-
-        Args:
-            delay_samples (int): The delay to apply in samples
+        Applies the total delay to the computed data as an
+        exp(-jωD) phase factor, whatever the amount of samples
         """
 
-        sos_delay_1sample = [[0, 1, 0, 1, 0, 0]]
+        delay_samples = self.get_total_delay()
+
+        self.filter['magnitude_undelayed'] = self.filter['magnitude']
 
         if delay_samples == 0:
             return
 
-        else:
-            delay_sos = list(sos_delay_1sample)
-
-            for i in range(delay_samples - 1):
-                delay_sos.extend(sos_delay_1sample)
+        phase_offset_rad = -2 * np.pi * self.get_frequencies() * delay_samples / self.get_sample_frequency()
 
-            self.sos = list(self.sos)
-            self.sos.extend(delay_sos)
+        self.filter['magnitude'] = self.filter['magnitude'] * np.exp(1j * phase_offset_rad)
+        self.filter['phase_rad'] = self.filter['phase_rad'] + phase_offset_rad
+        self.filter['phase_deg'] = self.filter['phase_deg'] + np.degrees(phase_offset_rad)
@@ -0,0 +1,144 @@
+import math
+import threading
+import time
+from typing import Callable
+
+import numpy as np
+
+from lib.Engine.AudioBackend import AudioBackend
+
+class NullAudioBackend(AudioBackend):
+    """
+    Audio output discarding the samples, to measure the processing
+    without a sound card, in continuous integration for instance.
+
+    In real time, the blocks are requested at the pace of a sound card
+    holding one block in advance: a callback returning after the end of
+    the block being played is an underflow, reported to the next callback.
+    Otherwise the blocks are requested as fast as they are processed.
+    """
+
+    def __init__(self,
+        sample_frequency:   float = 48000,
+        channels:           int = 2,
+        block_size:         int = 256,
+        realtime:           bool = True,
+        duration:           float = None
+    ) -> None:
+        """
+        Args:
+            sample_frequency (float, optional): The sample frequency in Hertz. Defaults to 48000.
+            channels (int, optional): Amount of output channels. Defaults to 2.
+            block_size (int, optional): Amount of frames requested per callback. Defaults to 256.
+            realtime (bool, optional): Request the blocks at the pace of a sound card. Defaults to True.
+            duration (float, optional): Seconds of audio after which the output stops by itself. Defaults to None.
+
+        Raises:
+            ValueError: In case of a zero or negative parameter
+        """
+
+        super().__init__(sample_frequency, channels, block_size)
+
+        if duration is not None and duration <= 0:
+            raise ValueError("Duration must be a positive number")
+
+        self.realtime = realtime
+        self.duration = duration
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def start(self, callback: Callable[[int, bool], np.ndarray]) -> None:
+        """
+        Args:
+            callback (Callable[[int, bool], np.ndarray]): See AudioBackend
+
+        Raises:
+            ValueError: If the output is already running or can't be opened
+        """
+
+        if self.is_running():
+            raise ValueError("The audio output is already running")
+
+        self.open_output()
+
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, args=(callback,), daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+
+        self.stop_event.set()
+
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+
+    def is_running(self) -> bool:
+
+        return self.thread is not None and self.thread.is_alive()
+
+    def wait(self, timeout: float = None) -> None:
+        """
+        Waits for the output to stop, after its duration or stop()
+
+        Args:
+            timeout (float, optional): Seconds to wait at most. Defaults to None, forever.
+        """
+
+        if self.thread is not None:
+            self.thread.join(timeout)
+
+    def run(self, callback: Callable[[int, bool], np.ndarray]) -> None:
+        """
+        Requests and plays the blocks, in the thread of the output
+
+        Args:
+            callback (Callable[[int, bool], np.ndarray]): See AudioBackend
+        """
+
+        period = self.block_size / self.sample_frequency
+        blocks = None if self.duration is None else math.ceil(self.duration / period)
+
+        underflow = False
+        origin = time.perf_counter()
+        block = 0
+
+        try:
+            while not self.stop_event.is_set() and (blocks is None or block < blocks):
+                self.play(callback(self.block_size, underflow))
+                block += 1
+
+                if not self.realtime:
+                    continue
+
+                # End of the block played while this one was computed
+                deadline = origin + block * period
+                now = time.perf_counter()
+
+                underflow = now > deadline
+
+                if underflow:
+                    # Playback starts over after the gap, which counts once
+                    origin = now - block * period
+                else:
+                    self.stop_event.wait(deadline - now)
+        finally:
+            self.close_output()
+
+    def open_output(self) -> None:
+        """
+        Prepares the output before the first callback
+
+        Raises:
+            ValueError: If the output can't be opened
+        """
+
+    def play(self, block: np.ndarray) -> None:
+        """
+        Args:
+            block (np.ndarray): Samples of shape (frames, channels) returned by the callback
+        """
+
+    def close_output(self) -> None:
+        """
+        Releases the output after the last callback
+        """
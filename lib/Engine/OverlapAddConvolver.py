@@ -0,0 +1,52 @@
+import numpy as np
+
+class OverlapAddConvolver:
+    """
+    Streaming convolution of blocks of samples with FIR taps,
+    using FFT overlap-add within each block and carrying the
+    tail over to the next blocks
+    """
+
+    def __init__(self, taps: list[float], channels: int = 1) -> None:
+        """
+        Args:
+            taps (list[float]): The FIR taps
+            channels (int, optional): Amount of channels of the blocks. Defaults to 1.
+        """
+
+        self.taps = np.asarray(taps, dtype=float)
+        self.channels = channels
+
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Clears the tail, as if the past input was silence
+        """
+
+        self.tail = np.zeros((len(self.taps) - 1, self.channels))
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            block (np.ndarray): Samples of shape (frames, channels)
+
+        Returns:
+            np.ndarray: The filtered samples, same shape as the block
+        """
+
+        from scipy.signal import oaconvolve
+
+        frames = len(block)
+
+        if len(self.taps) == 1:
+            return block * self.taps[0]
+
+        output = oaconvolve(block, self.taps[:, np.newaxis], axes=0)
+
+        # The tail of the previous blocks overlaps the start of this one
+        output[:len(self.tail)] += self.tail
+
+        self.tail = output[frames:]
+
+        return output[:frames]
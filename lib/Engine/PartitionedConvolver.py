@@ -0,0 +1,161 @@
+import time
+
+import numpy as np
+
+class PartitionedConvolver:
+    """
+    Streaming convolution of blocks of samples with long FIR taps,
+    using uniformly partitioned overlap-save: the taps are split into
+    partitions of partition_size taps whose spectra are kept, and the
+    spectra of the past input partitions are kept in a frequency domain
+    delay line, so that each partition of input costs one FFT, one
+    inverse FFT and one product per partition of taps, whatever the
+    amount of taps.
+
+    Blocks of any size are accepted without added latency: a partition
+    that is not complete yet is convolved as it is, the contribution of
+    the past partitions being computed once per partition. Blocks of
+    partition_size frames are the most efficient.
+    """
+
+    def __init__(self, taps: list[float], channels: int = 1, partition_size: int = 256) -> None:
+        """
+        Args:
+            taps (list[float]): The FIR taps
+            channels (int, optional): Amount of channels of the blocks. Defaults to 1.
+            partition_size (int, optional):
+                Amount of taps per partition, the latency of a real-time
+                stream processing blocks of that size. Defaults to 256.
+
+        Raises:
+            ValueError: In case of a zero or negative partition size
+        """
+
+        if partition_size <= 0:
+            raise ValueError("Partition size must be a positive integer")
+
+        self.taps = np.asarray(taps, dtype=float)
+        self.channels = channels
+        self.partition_size = partition_size
+
+        partitions = -(-len(self.taps) // partition_size)
+
+        padded_taps = np.zeros(partitions * partition_size)
+        padded_taps[:len(self.taps)] = self.taps
+
+        # Shape (partitions, partition_size + 1)
+        self.taps_spectra = np.fft.rfft(padded_taps.reshape(partitions, partition_size), 2 * partition_size, axis=1)
+
+        self.reset()
+        self.reset_statistics()
+
+    def reset(self) -> None:
+        """
+        Clears the state, as if the past input was silence
+        """
+
+        # The previous partition of input followed by the current one
+        self.input_buffer = np.zeros((2 * self.partition_size, self.channels))
+        self.position = 0
+
+        # Spectra of the past input buffers, the newest first
+        self.input_spectra = np.zeros((len(self.taps_spectra), self.partition_size + 1, self.channels), dtype=complex)
+
+        # Contribution of the past partitions to the current one
+        self.past_spectrum = np.zeros((self.partition_size + 1, self.channels), dtype=complex)
+
+    def reset_statistics(self) -> None:
+        """
+        Forgets the processing times measured so far
+        """
+
+        self.blocks = 0
+        self.total_seconds = 0
+        self.max_seconds = 0
+
+    def get_partition_size(self) -> int:
+        """
+        Returns:
+            int: The amount of taps per partition
+        """
+
+        return self.partition_size
+
+    def get_statistics(self) -> dict:
+        """
+        Returns:
+            dict:
+                The amount of "blocks" processed, and the "mean_ms"
+                and "max_ms" processing time per block
+        """
+
+        return {
+            "blocks": self.blocks,
+            "mean_ms": self.total_seconds / self.blocks * 1000 if self.blocks else 0,
+            "max_ms": self.max_seconds * 1000
+        }
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            block (np.ndarray): Samples of shape (frames, channels)
+
+        Returns:
+            np.ndarray: The filtered samples, same shape as the block
+        """
+
+        start = time.perf_counter()
+
+        if len(self.taps) == 1:
+            output = block * self.taps[0]
+        else:
+            output = self.convolve(block)
+
+        duration = time.perf_counter() - start
+
+        self.blocks += 1
+        self.total_seconds += duration
+        self.max_seconds = max(self.max_seconds, duration)
+
+        return output
+
+    def convolve(self, block: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            block (np.ndarray): Samples of shape (frames, channels)
+
+        Returns:
+            np.ndarray: The samples convolved with more than one tap
+        """
+
+        size = self.partition_size
+        frames = len(block)
+        output = np.empty((frames, self.channels))
+
+        done = 0
+
+        while done < frames:
+            count = min(size - self.position, frames - done)
+
+            self.input_buffer[size + self.position:size + self.position + count] = block[done:done + count]
+
+            spectrum = np.fft.rfft(self.input_buffer, axis=0)
+            convolved = np.fft.irfft(spectrum * self.taps_spectra[0, :, np.newaxis] + self.past_spectrum, axis=0)
+
+            # Overlap-save: only the second half is free of circular aliasing
+            output[done:done + count] = convolved[size + self.position:size + self.position + count]
+
+            self.position += count
+            done += count
+
+            if self.position == size:
+                self.input_spectra[1:] = self.input_spectra[:-1]
+                self.input_spectra[0] = spectrum
+
+                self.past_spectrum = np.einsum("pf,pfc->fc", self.taps_spectra[1:], self.input_spectra[:-1])
+
+                self.input_buffer[:size] = self.input_buffer[size:]
+                self.input_buffer[size:] = 0
+                self.position = 0
+
+        return output
@@ -0,0 +1,265 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+class Profiler:
+    """
+    Timings of the stages of the computations and drawings,
+    counts of the computations of each engine, and an optional
+    cProfile capture, to find out where the time goes in a session.
+
+    Engines computed in another process, see ComputeService.set_parallel(),
+    are counted but their stages are timed by the profiler of that process.
+    """
+
+    def __init__(self, maxlen: int = 100000) -> None:
+        """
+        Args:
+            maxlen (int, optional):
+                Amount of timings kept for the trace export,
+                the oldest ones are dropped. Defaults to 100000.
+        """
+
+        # Measurements come from the worker threads as well as the GUI thread
+        self.lock = threading.Lock()
+        self.capture_lock = threading.Lock()
+
+        self.enabled = False
+        self.profile = None
+        self.events = deque(maxlen=maxlen)
+
+        self.reset()
+
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Args:
+            enabled (bool): The timing status, nothing is measured when disabled
+        """
+
+        self.enabled = enabled
+
+    def get_enabled(self) -> bool:
+        """
+        Returns:
+            bool: The current timing status
+        """
+
+        return self.enabled
+
+    def set_profiling(self, profiling: bool) -> None:
+        """
+        Args:
+            profiling (bool):
+                The cProfile capture status. The functions called
+                during the captured stages are profiled, see capture().
+                Disabling it keeps what was captured so far.
+        """
+
+        if profiling and self.profile is None:
+            self.profile = cProfile.Profile()
+
+        self.profiling = profiling
+
+    def get_profiling(self) -> bool:
+        """
+        Returns:
+            bool: The current cProfile capture status
+        """
+
+        return self.profiling
+
+    def reset(self) -> None:
+        """
+        Forgets all the measurements and the cProfile capture
+        """
+
+        with self.lock:
+            self.origin = time.perf_counter()
+            self.events.clear()
+            self.stages = {}
+            self.counts = weakref.WeakKeyDictionary()
+            self.profile = None
+            self.profiling = False
+
+    @contextmanager
+    def measure(self, stage: str, category: str = "engine"):
+        """
+        Times the code run in a with statement
+
+        Args:
+            stage (str): The name of the stage, such as "generate_zpk"
+            category (str, optional): "engine" or "graph". Defaults to "engine".
+        """
+
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+
+            with self.lock:
+                self.events.append((stage, category, start - self.origin, duration, threading.get_ident()))
+
+                statistics = self.stages.setdefault(stage, [category, 0, 0, 0])
+                statistics[1] += 1
+                statistics[2] += duration
+                statistics[3] = max(statistics[3], duration)
+
+    @contextmanager
+    def capture(self):
+        """
+        Profiles the functions called in a with statement with cProfile,
+        if the capture is enabled and no other thread is being captured
+        """
+
+        if not self.profiling or not self.capture_lock.acquire(blocking=False):
+            yield
+            return
+
+        profile = self.profile
+
+        try:
+            profile.enable()
+            yield
+        finally:
+            profile.disable()
+            self.capture_lock.release()
+
+    def count(self, engine: object) -> None:
+        """
+        Args:
+            engine (object): An engine that was computed
+        """
+
+        if not self.enabled:
+            return
+
+        with self.lock:
+            self.counts[engine] = self.counts.get(engine, 0) + 1
+
+    def get_stages(self) -> dict[str, dict]:
+        """
+        Returns:
+            dict[str, dict]:
+                "category", "count", "total_ms", "mean_ms" and "max_ms"
+                of each stage, the longest total first
+        """
+
+        with self.lock:
+            stages = sorted(self.stages.items(), key=lambda item: item[1][2], reverse=True)
+
+        return {
+            stage: {
+                "category": category,
+                "count": count,
+                "total_ms": total * 1000,
+                "mean_ms": total / count * 1000,
+                "max_ms": maximum * 1000
+            }
+            for stage, (category, count, total, maximum) in stages
+        }
+
+    def get_counts(self, names: dict[str, object]) -> dict[str, int]:
+        """
+        Args:
+            names (dict[str, object]): The engines by display name
+
+        Returns:
+            dict[str, int]: The amount of computations of each engine by display name
+        """
+
+        with self.lock:
+            return {name: self.counts.get(engine, 0) for name, engine in names.items()}
+
+    def get_profile_summary(self, limit: int = 30) -> str:
+        """
+        Args:
+            limit (int, optional): Amount of functions to list. Defaults to 30.
+
+        Returns:
+            str: The functions taking the most cumulative time, empty without a capture
+        """
+
+        if self.profile is None:
+            return ""
+
+        stream = io.StringIO()
+
+        with self.capture_lock:
+            try:
+                pstats.Stats(self.profile, stream=stream).sort_stats("cumulative").print_stats(limit)
+            except TypeError:
+                # Nothing was captured yet
+                return ""
+
+        return stream.getvalue()
+
+    def export_json(self, path: str | Path, names: dict[str, object] = {}) -> None:
+        """
+        Writes the statistics of the stages and the computation counts
+
+        Args:
+            path (str | Path): The file to write
+            names (dict[str, object], optional): The engines to count by display name. Defaults to {}.
+        """
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"stages": self.get_stages(), "counts": self.get_counts(names)}, file, indent=4)
+
+    def export_chrome_trace(self, path: str | Path) -> None:
+        """
+        Writes the timings in the Trace Event Format, to be
+        opened in chrome://tracing or https://ui.perfetto.dev
+
+        Args:
+            path (str | Path): The file to write
+        """
+
+        with self.lock:
+            events = list(self.events)
+
+        trace_events = [
+            {
+                "name": stage,
+                "cat": category,
+                "ph": "X",
+                "ts": start * 1e6,
+                "dur": duration * 1e6,
+                "pid": os.getpid(),
+                "tid": thread
+            }
+            for stage, category, start, duration, thread in events
+        ]
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, file)
+
+    def export_profile(self, path: str | Path) -> None:
+        """
+        Writes the cProfile capture, to be read by pstats or snakeviz
+
+        Args:
+            path (str | Path): The file to write
+
+        Raises:
+            ValueError: If nothing was captured
+        """
+
+        if self.profile is None:
+            raise ValueError("Nothing was captured with cProfile")
+
+        with self.capture_lock:
+            self.profile.dump_stats(path)
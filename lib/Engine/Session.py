@@ -0,0 +1,242 @@
+import json
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+from lib.Engine.GraphEngine import GraphEngine
+from lib.Engine.SumEngine import SumEngine
+from lib.Engine.FrequencyGrid import FrequencyGrid
+from lib.Engine.Topology import Topology
+
+class Session:
+    """
+    Everything needed to reopen a project: the topology and parameters
+    of the cells, cascades and sum, and optionally their computed results
+    so that the engines don't have to be computed again.
+
+    A session file is a compressed NumPy archive holding the description
+    of the sum as JSON, in the format of Topology, and one array per
+    result of each engine, with keys such as "results/Cascade A 1/sos"
+    or "results/Sum/filter/magnitude_db".
+    """
+
+    suffix = ".fpsession"
+    version = 1
+
+    def __init__(self, description: dict, results: dict[str, dict] = None) -> None:
+        """
+        Args:
+            description (dict): The description of the sum, see Topology
+            results (dict[str, dict], optional):
+                The results of the engines by display name, as returned
+                by GraphEngine.get_results(). Defaults to None.
+        """
+
+        self.description = description
+        self.results = results or {}
+
+    @classmethod
+    def from_engine(cls, sum_engine: SumEngine, name: str = "session", results: bool = True) -> "Session":
+        """
+        Args:
+            sum_engine (SumEngine): The sum of cascades of cells to save
+            name (str, optional): The name of the session. Defaults to "session".
+            results (bool, optional):
+                Also keep the results of the engines that are up to date.
+                Defaults to True.
+
+        Returns:
+            Session: The session of the sum
+        """
+
+        engine_results = {}
+
+        if results:
+            for engine_name, engine in Topology.get_engine_names(sum_engine).items():
+                if not engine.needs_compute():
+                    engine_results[engine_name] = engine.get_results()
+
+        return cls(Topology.describe(sum_engine, name), engine_results)
+
+    def get_description(self) -> dict:
+        """
+        Returns:
+            dict: The description of the sum, see Topology
+        """
+
+        return self.description
+
+    def get_sample_frequency(self) -> float:
+        """
+        Returns:
+            float: The sample frequency of the session in Hertz
+        """
+
+        return float(self.description.get("sample_frequency", 48000))
+
+    def save(self, path: str | Path) -> None:
+        """
+        Args:
+            path (str | Path): The file to write
+        """
+
+        header = {"version": self.version} | self.description
+
+        # Values set from NumPy arrays are saved as plain numbers
+        arrays = {"description": np.array(json.dumps(header, default=lambda value: value.item()))}
+
+        for engine_name, results in self.results.items():
+            engine_arrays = {}
+
+            for name, value in results.items():
+                values = value.items() if isinstance(value, dict) else [(None, value)]
+
+                for key, item in values:
+                    array = np.asarray(item)
+                    engine_arrays["/".join(filter(None, ["results", engine_name, name, key]))] = array
+
+            # Results that would need pickling are computed again instead
+            if all(array.dtype != object for array in engine_arrays.values()):
+                arrays |= engine_arrays
+
+        # A file object, savez_compressed() would append .npz to a path
+        with open(path, "wb") as file:
+            np.savez_compressed(file, **arrays)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Session":
+        """
+        Args:
+            path (str | Path): The file to read
+
+        Raises:
+            ValueError: In case of an invalid or newer file
+
+        Returns:
+            Session: The session saved in the file
+        """
+
+        try:
+            archive = np.load(path, allow_pickle=False)
+        except (ValueError, EOFError, zipfile.BadZipFile) as e:
+            raise ValueError(f"Not a session file: {e}") from e
+
+        # A single .npy array
+        if not isinstance(archive, np.lib.npyio.NpzFile):
+            raise ValueError("Not a session file")
+
+        with archive:
+            if "description" not in archive.files:
+                raise ValueError("Not a session file")
+
+            description = json.loads(archive["description"].item())
+
+            if not isinstance(description, dict) or not isinstance(description.get("cascades"), list) \
+                or not all(isinstance(cascade, dict) and "cells" in cascade for cascade in description["cascades"]):
+                raise ValueError("Not a session file: no cascades of cells in the description")
+
+            if description.pop("version", cls.version) > cls.version:
+                raise ValueError("The session was saved by a newer version")
+
+            results = {}
+
+            for key in archive.files:
+                if not key.startswith("results/"):
+                    continue
+
+                _, engine_name, name, *item = key.split("/")
+                array = archive[key]
+
+                # Scalars such as taps_delay were saved as 0-d arrays
+                value = array.item() if array.ndim == 0 else array
+
+                engine_results = results.setdefault(engine_name, {})
+
+                if item:
+                    engine_results.setdefault(name, {})[item[0]] = value
+                else:
+                    engine_results[name] = value
+
+        return cls(description, results)
+
+    def set_parameters(self, sum_engine: SumEngine) -> None:
+        """
+        Sets the sample frequency, the frequency grid and the parameters of
+        the session to the engines of a sum having the same amount of cascades
+        and cells. The grid is only replaced if it gives other frequencies.
+
+        Args:
+            sum_engine (SumEngine): The sum of cascades of cells to set
+
+        Raises:
+            ValueError: In case of a different topology or an invalid parameter
+        """
+
+        cascades = self.description["cascades"]
+
+        if len(sum_engine.input_engines) != len(cascades) or any(
+            len(cascade_engine.input_engines) != len(cascade_description["cells"])
+            for cascade_engine, cascade_description in zip(sum_engine.input_engines, cascades)
+        ):
+            raise ValueError("The session has a different amount of cascades or cells")
+
+        sample_frequency = self.get_sample_frequency()
+        frequency_grid = FrequencyGrid(**self.description.get("frequency_grid", {}))
+
+        replace_grid = sum_engine.get_frequency_grid().get_key(sample_frequency) != frequency_grid.get_key(sample_frequency)
+
+        for engine in Topology.get_engine_names(sum_engine).values():
+            engine.set_sample_frequency(sample_frequency)
+
+            if replace_grid:
+                engine.set_frequency_grid(frequency_grid)
+
+        for cascade_engine, cascade_description in zip(sum_engine.input_engines, cascades):
+            for cell_engine, cell_description in zip(cascade_engine.input_engines, cascade_description["cells"]):
+                Topology.set_parameters(cell_engine, cell_description)
+
+            Topology.set_parameters(cascade_engine, cascade_description)
+
+        Topology.set_parameters(sum_engine, self.description.get("sum", {}))
+
+    def restore_results(self, engines: dict[str, GraphEngine]) -> list[GraphEngine]:
+        """
+        Gives the saved results back to the engines whose parameters,
+        sample frequency and frequency grid match the session, so that
+        they are not computed again. The other ones stay outdated.
+
+        Args:
+            engines (dict[str, GraphEngine]):
+                The engines by display name in topological order,
+                see Topology.get_engine_names()
+
+        Returns:
+            list[GraphEngine]: The engines that got their results back
+        """
+
+        sample_frequency = self.get_sample_frequency()
+        grid_key = FrequencyGrid(**self.description.get("frequency_grid", {})).get_key(sample_frequency)
+
+        saved_engines = Topology.get_engine_names(Topology(self.description).sum_engine)
+
+        restored_engines = []
+
+        for name, engine in engines.items():
+            if name not in self.results or name not in saved_engines:
+                continue
+
+            if engine.get_sample_frequency() != sample_frequency \
+                or engine.get_frequency_grid().get_key(sample_frequency) != grid_key \
+                or Topology.get_parameters(engine) != Topology.get_parameters(saved_engines[name]) \
+                or len(engine.input_engines) != len(saved_engines[name].input_engines):
+                continue
+
+            # compute() adds its own entries to the filter dictionary
+            results = dict(self.results[name])
+            results["filter"] = dict(results.get("filter", {}))
+
+            engine.set_results(results, engine.modifications)
+            restored_engines.append(engine)
+
+        return restored_engines
@@ -0,0 +1,207 @@
+import numpy as np
+
+from lib.Engine.AudioFileReader import AudioFileReader
+
+class SignalGenerator:
+    """
+    Endless source of test signals, in blocks of float samples:
+    white or pink noise, a sine, a logarithmic sweep, or an audio
+    file played in a loop.
+
+    The same signal is sent to every channel, except for a file
+    having as many channels as the generator.
+    """
+
+    kinds = ["white noise", "pink noise", "sine", "sweep", "file"]
+
+    # Filter of -3 dB/octave turning a white noise into a pink one,
+    # down to about 10 Hz at 44.1 kHz
+    pink_b = [0.049922035, -0.095993537, 0.050612699, -0.004408786]
+    pink_a = [1, -2.494956002, 2.017265875, -0.522189400]
+
+    # RMS of the pinking filter output for a white noise of unit RMS
+    pink_rms = 0.0861
+
+    # Frequency range and duration of the sweep in seconds
+    sweep_range = (20, 20000)
+    sweep_duration = 10
+
+    def __init__(self,
+        kind:               str = "pink noise",
+        sample_frequency:   float = 48000,
+        channels:           int = 1,
+        level:              float = -20,
+        frequency:          float = 1000,
+        path:               str = None
+    ) -> None:
+        """
+        Args:
+            kind (str, optional): One of the kinds. Defaults to "pink noise".
+            sample_frequency (float, optional): The sample frequency in Hertz. Defaults to 48000.
+            channels (int, optional): Amount of channels of the blocks. Defaults to 1.
+            level (float, optional): RMS level of the noises and peak level of the others, in dBFS. Defaults to -20.
+            frequency (float, optional): Frequency of the sine in Hertz. Defaults to 1000.
+            path (str, optional): The WAV file played by the "file" kind. Defaults to None.
+
+        Raises:
+            ValueError:
+                In case of an invalid parameter, or a file that
+                can't be read or whose sample frequency differs
+        """
+
+        if kind not in self.kinds:
+            raise ValueError(f"Signal must be one of {', '.join(self.kinds)}")
+
+        if sample_frequency <= 0:
+            raise ValueError("Sample frequency must be a positive number")
+
+        if channels <= 0:
+            raise ValueError("Amount of channels must be a positive integer")
+
+        if level > 0:
+            raise ValueError("Level must be 0 dBFS or lower")
+
+        if not 0 < frequency < sample_frequency / 2:
+            raise ValueError("Frequency must be between 0 Hz and the Nyquist frequency")
+
+        self.kind = kind
+        self.sample_frequency = sample_frequency
+        self.channels = channels
+        self.gain = 10 ** (level / 20)
+        self.frequency = frequency
+        self.reader = None
+
+        if kind == "file":
+            if path is None:
+                raise ValueError("A file must be given to play it")
+
+            try:
+                self.reader = AudioFileReader(path)
+            except OSError as e:
+                raise ValueError(f"Can't read {path}: {e}")
+
+            if self.reader.frames == 0:
+                self.close()
+                raise ValueError("The file holds no samples")
+
+            if self.reader.sample_frequency != sample_frequency:
+                message = f"The file is sampled at {self.reader.sample_frequency} Hz, the output at {sample_frequency:g} Hz"
+                self.close()
+                raise ValueError(message)
+
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Starts the signal over
+        """
+
+        self.random = np.random.default_rng(0)
+        self.pink_zi = np.zeros(len(self.pink_a) - 1)
+        self.phase = 0
+        self.position = 0
+
+    def get_sample_frequency(self) -> float:
+        """
+        Returns:
+            float: The sample frequency in Hertz
+        """
+
+        return self.sample_frequency
+
+    def get_channels(self) -> int:
+        """
+        Returns:
+            int: The amount of channels of the blocks
+        """
+
+        return self.channels
+
+    def generate(self, frames: int) -> np.ndarray:
+        """
+        Args:
+            frames (int): Amount of frames
+
+        Returns:
+            np.ndarray: The next samples, of shape (frames, channels)
+        """
+
+        from scipy.signal import lfilter
+
+        match self.kind:
+            case "white noise":
+                signal = self.random.standard_normal(frames)
+            case "pink noise":
+                signal, self.pink_zi = lfilter(
+                    self.pink_b, self.pink_a, self.random.standard_normal(frames), zi=self.pink_zi
+                )
+                signal /= self.pink_rms
+            case "sine":
+                signal = self.oscillate(np.full(frames, self.frequency))
+            case "sweep":
+                start, stop = self.sweep_range
+                stop = min(stop, 0.45 * self.sample_frequency)
+
+                times = (self.position + np.arange(frames)) / self.sample_frequency % self.sweep_duration
+                self.position += frames
+
+                signal = self.oscillate(start * (stop / start) ** (times / self.sweep_duration))
+            case "file":
+                return self.read_loop(frames) * self.gain
+
+        return np.repeat(signal[:, np.newaxis] * self.gain, self.channels, axis=1)
+
+    def oscillate(self, frequencies: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            frequencies (np.ndarray): Instantaneous frequency of each frame in Hertz
+
+        Returns:
+            np.ndarray: A sine continuing the phase of the previous blocks
+        """
+
+        phases = self.phase + np.cumsum(2 * np.pi * frequencies / self.sample_frequency)
+
+        if len(phases):
+            self.phase = phases[-1] % (2 * np.pi)
+
+        return np.sin(phases)
+
+    def read_loop(self, frames: int) -> np.ndarray:
+        """
+        Args:
+            frames (int): Amount of frames
+
+        Returns:
+            np.ndarray:
+                The next samples of the file, starting over at its end,
+                of shape (frames, channels)
+        """
+
+        blocks = []
+        remaining = frames
+
+        while remaining > 0:
+            block = self.reader.read(self.position, remaining)
+
+            self.position = (self.position + len(block)) % self.reader.frames
+            remaining -= len(block)
+
+            blocks.append(block)
+
+        samples = np.concatenate(blocks) if blocks else np.zeros((0, self.reader.channels))
+
+        if samples.shape[1] == self.channels:
+            return samples
+
+        # Other layouts are mixed down to mono and sent to every channel
+        return np.repeat(samples.mean(axis=1, keepdims=True), self.channels, axis=1)
+
+    def close(self) -> None:
+        """
+        Closes the file played, if any
+        """
+
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
@@ -0,0 +1,93 @@
+from typing import Callable
+
+import numpy as np
+
+try:
+    import sounddevice
+except (ImportError, OSError):
+    # OSError when the PortAudio library itself is missing
+    sounddevice = None
+
+from lib.Engine.AudioBackend import AudioBackend
+
+class SoundDeviceAudioBackend(AudioBackend):
+    """
+    Audio output to a sound card through PortAudio, with the optional
+    sounddevice package. The callbacks are called from the PortAudio
+    thread, which reports the underflows of the sound card.
+    """
+
+    def __init__(self,
+        sample_frequency:   float = 48000,
+        channels:           int = 2,
+        block_size:         int = 256,
+        device:             int | str = None
+    ) -> None:
+        """
+        Args:
+            sample_frequency (float, optional): The sample frequency in Hertz. Defaults to 48000.
+            channels (int, optional): Amount of output channels. Defaults to 2.
+            block_size (int, optional): Amount of frames requested per callback. Defaults to 256.
+            device (int | str, optional): Index or name of the output device. Defaults to None, the default one.
+
+        Raises:
+            ValueError: In case of a zero or negative parameter
+        """
+
+        super().__init__(sample_frequency, channels, block_size)
+
+        self.device = device
+        self.stream = None
+
+    @staticmethod
+    def is_available() -> bool:
+        """
+        Returns:
+            bool: True if sounddevice and PortAudio are installed
+        """
+
+        return sounddevice is not None
+
+    def start(self, callback: Callable[[int, bool], np.ndarray]) -> None:
+        """
+        Args:
+            callback (Callable[[int, bool], np.ndarray]): See AudioBackend
+
+        Raises:
+            ValueError: If sounddevice is missing, or the device can't be opened
+        """
+
+        if sounddevice is None:
+            raise ValueError("Audio output requires sounddevice")
+
+        if self.is_running():
+            raise ValueError("The audio output is already running")
+
+        def stream_callback(outdata, frames, time, status) -> None:
+
+            outdata[:] = callback(frames, bool(status.output_underflow))
+
+        try:
+            self.stream = sounddevice.OutputStream(
+                samplerate=self.sample_frequency,
+                blocksize=self.block_size,
+                device=self.device,
+                channels=self.channels,
+                dtype="float32",
+                callback=stream_callback
+            )
+            self.stream.start()
+        except sounddevice.PortAudioError as e:
+            self.stream = None
+            raise ValueError(f"Can't open the audio output: {e}")
+
+    def stop(self) -> None:
+
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+
+    def is_running(self) -> bool:
+
+        return self.stream is not None and self.stream.active
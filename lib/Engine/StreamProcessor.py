@@ -0,0 +1,416 @@
+import time
+
+import numpy as np
+
+from lib.Engine.GraphEngine import GraphEngine
+from lib.Engine.SumEngine import SumEngine
+from lib.Engine.DelayLine import DelayLine
+from lib.Engine.OverlapAddConvolver import OverlapAddConvolver
+from lib.Engine.PartitionedConvolver import PartitionedConvolver
+
+class StreamProcessor:
+    """
+    Runs blocks of samples through the filters of a computed engine,
+    keeping the filter state from one block to the next.
+
+    Each cascade, or the engine itself if it is not a sum, is a branch
+    made of its SOS, its FIR taps and its delay. The branches of a sum
+    are added together, like SumEngine does with their responses.
+
+    Fractional delays are applied by a windowed sinc, accurate up to
+    about 80% of the Nyquist frequency, which delays the whole output
+    by get_latency() samples more than the engine.
+
+    FIR taps are convolved by FFT overlap-add within each block, which
+    suits large blocks, or with a partition size by a uniformly
+    partitioned overlap-save, whose cost per block does not grow with
+    the amount of taps, for real-time processing of small blocks.
+
+    The SOS can be moved to those of another processor of the same
+    structure without resetting the state, see interpolate(), for
+    parameter changes without clicks while playing.
+    """
+
+    # Half length of the windowed sinc for fractional delays
+    fractional_delay_half_length = 16
+
+    # Frames filtered with the same coefficients during an interpolation,
+    # one call per step and branch, so one per block of the usual size
+    interpolation_step = 256
+
+    def __init__(self, engine: GraphEngine, channels: int = 1, partition_size: int = None) -> None:
+        """
+        Args:
+            engine (GraphEngine): A computed cell, cascade or sum
+            channels (int, optional): Amount of channels of the blocks. Defaults to 1.
+            partition_size (int, optional):
+                Amount of taps per partition of the partitioned convolution,
+                usually the block size. Defaults to None, for overlap-add.
+
+        Raises:
+            ValueError:
+                If the engine or one of its inputs is not computed,
+                or in case of a zero or negative partition size
+        """
+
+        if partition_size is not None and partition_size <= 0:
+            raise ValueError("Partition size must be a positive integer")
+
+        self.engine = engine
+        self.partition_size = partition_size
+
+        if isinstance(engine, SumEngine):
+            self.branch_engines = list(engine.input_engines)
+        else:
+            self.branch_engines = [engine]
+
+        if any(branch_engine.needs_compute() for branch_engine in self.branch_engines + [engine]):
+            raise ValueError("The engine must be computed before processing samples")
+
+        # The sum has no filter of its own, only its delay
+        sum_delay = engine.get_delay() if isinstance(engine, SumEngine) else 0
+
+        # The bulk delay of linear phase taps is part of the taps themselves
+        delays = [
+            branch_engine.get_total_delay() - branch_engine.taps_delay + sum_delay
+            for branch_engine in self.branch_engines
+        ]
+
+        if any(delay % 1 for delay in delays):
+            self.latency = self.fractional_delay_half_length
+        else:
+            self.latency = 0
+
+        self.branch_sos = []
+        self.branch_taps = []
+        self.branch_delays = []
+
+        for branch_engine, delay in zip(self.branch_engines, delays):
+            taps = np.asarray(branch_engine.taps, dtype=float)
+
+            if delay % 1:
+                taps = np.convolve(taps, self.generate_fractional_delay(delay % 1))
+                delay = int(delay)
+            else:
+                delay = int(delay) + self.latency
+
+            self.branch_sos.append(np.array(branch_engine.sos, dtype=float))
+            self.branch_taps.append(taps)
+            self.branch_delays.append(delay)
+
+        # SOS being interpolated, see interpolate()
+        self.start_sos = None
+        self.target_sos = None
+        self.ramp_frames = 0
+        self.ramp_position = 0
+
+        self.set_channels(channels)
+
+    def generate_fractional_delay(self, fraction: float) -> np.ndarray:
+        """
+        Args:
+            fraction (float): The fractional delay, between 0 and 1 sample
+
+        Returns:
+            np.ndarray:
+                Kaiser windowed sinc delaying by the fraction
+                plus the latency of the processor
+        """
+
+        length = 2 * self.fractional_delay_half_length + 1
+        positions = np.arange(length) - self.fractional_delay_half_length - fraction
+
+        window = np.i0(8 * np.sqrt(1 - (positions / (self.fractional_delay_half_length + 1)) ** 2)) / np.i0(8)
+        kernel = np.sinc(positions) * window
+
+        return kernel / np.sum(kernel)
+
+    def set_channels(self, channels: int) -> None:
+        """
+        Sets the amount of channels of the blocks and clears the state.
+
+        Args:
+            channels (int): Amount of channels
+
+        Raises:
+            ValueError: In case of a zero or negative number
+        """
+
+        if channels <= 0:
+            raise ValueError("Amount of channels must be a positive integer")
+
+        self.channels = channels
+
+        if self.partition_size is None:
+            self.convolvers = [OverlapAddConvolver(taps, channels) for taps in self.branch_taps]
+        else:
+            self.convolvers = [
+                PartitionedConvolver(taps, channels, self.partition_size) for taps in self.branch_taps
+            ]
+
+        self.delay_lines = [DelayLine(delay, channels) for delay in self.branch_delays]
+
+        self.reset()
+
+    def get_channels(self) -> int:
+        """
+        Returns:
+            int: The current amount of channels
+        """
+
+        return self.channels
+
+    def get_latency(self) -> int:
+        """
+        Returns:
+            int: Samples of delay added on top of the engine's own delay
+        """
+
+        return self.latency
+
+    def can_interpolate(self, processor: "StreamProcessor") -> bool:
+        """
+        Args:
+            processor (StreamProcessor): The processor whose filters should replace these ones
+
+        Returns:
+            bool:
+                True if only the SOS coefficients differ, the amount of
+                sections, the taps, the delays and the channels being the same
+        """
+
+        return (
+            processor.channels == self.channels
+            and processor.partition_size == self.partition_size
+            and processor.latency == self.latency
+            and processor.branch_delays == self.branch_delays
+            and len(processor.branch_sos) == len(self.branch_sos)
+            and all(new.shape == old.shape for new, old in zip(processor.branch_sos, self.branch_sos))
+            and all(np.array_equal(new, old) for new, old in zip(processor.branch_taps, self.branch_taps))
+        )
+
+    def interpolate(self, processor: "StreamProcessor", frames: int) -> None:
+        """
+        Moves the SOS coefficients linearly to those of another processor
+        over the next frames, keeping the filter state. The coefficients
+        change every interpolation_step frames.
+
+        The stable denominators of second order sections form a triangle,
+        so the coefficients in between two stable sections are stable too.
+
+        Args:
+            processor (StreamProcessor): A processor of the same structure, see can_interpolate()
+            frames (int): Duration of the transition
+
+        Raises:
+            ValueError: If the structures differ
+        """
+
+        if not self.can_interpolate(processor):
+            raise ValueError("Only the coefficients of filters of the same structure can be interpolated")
+
+        # An interpolation in progress continues from where it is
+        self.start_sos = [sos.copy() for sos in self.branch_sos]
+        self.target_sos = [sos.copy() for sos in processor.branch_sos]
+        self.ramp_frames = max(int(frames), 1)
+        self.ramp_position = 0
+
+    def is_interpolating(self) -> bool:
+        """
+        Returns:
+            bool: True while the SOS are moving to those of another processor
+        """
+
+        return self.target_sos is not None
+
+    def reset(self) -> None:
+        """
+        Clears the filter state, as if the past input was silence
+        """
+
+        self.branch_zi = [np.zeros((len(sos), 2, self.channels)) for sos in self.branch_sos]
+
+        for convolver in self.convolvers:
+            convolver.reset()
+
+        for delay_line in self.delay_lines:
+            delay_line.reset()
+
+        self.reset_statistics()
+
+    def reset_statistics(self) -> None:
+        """
+        Forgets the processing times measured so far
+        """
+
+        self.blocks = 0
+        self.frames = 0
+        self.total_seconds = 0
+        self.max_seconds = 0
+        self.max_load = 0
+
+    def get_statistics(self) -> dict:
+        """
+        Returns:
+            dict:
+                The amount of "blocks" processed, the "mean_ms" and
+                "max_ms" processing time per block, and the "load" and
+                "max_load", the processing time over the duration of
+                the blocks, above 1 if they can't be processed in real time
+        """
+
+        duration = self.frames / self.engine.get_sample_frequency()
+
+        return {
+            "blocks": self.blocks,
+            "mean_ms": self.total_seconds / self.blocks * 1000 if self.blocks else 0,
+            "max_ms": self.max_seconds * 1000,
+            "load": self.total_seconds / duration if duration else 0,
+            "max_load": self.max_load
+        }
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            block (np.ndarray):
+                Samples of shape (frames,) for a single channel
+                or (frames, channels)
+
+        Raises:
+            ValueError: If the amount of channels does not match
+
+        Returns:
+            np.ndarray: The processed samples, same shape as the block
+        """
+
+        from scipy.signal import sosfilt
+
+        start = time.perf_counter()
+
+        samples = np.asarray(block, dtype=float)
+        mono = samples.ndim == 1
+
+        if mono:
+            samples = samples[:, np.newaxis]
+
+        if samples.shape[1] != self.channels:
+            raise ValueError(f"Expected {self.channels} channels, got {samples.shape[1]}")
+
+        output = np.zeros_like(samples)
+
+        if self.target_sos is None:
+            branches = []
+
+            for i, sos in enumerate(self.branch_sos):
+                branch, self.branch_zi[i] = sosfilt(sos, samples, axis=0, zi=self.branch_zi[i])
+                branches.append(branch)
+        else:
+            branches = self.filter_interpolated(samples)
+
+        for i, branch in enumerate(branches):
+            branch = self.convolvers[i].process(branch)
+            output += self.delay_lines[i].process(branch)
+
+        seconds = time.perf_counter() - start
+
+        self.blocks += 1
+        self.frames += len(samples)
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+        if len(samples):
+            self.max_load = max(self.max_load, seconds * self.engine.get_sample_frequency() / len(samples))
+
+        return output[:, 0] if mono else output
+
+    def filter_interpolated(self, samples: np.ndarray) -> list[np.ndarray]:
+        """
+        Runs the samples through the SOS of each branch while
+        they are interpolated, see interpolate()
+
+        Args:
+            samples (np.ndarray): Samples of shape (frames, channels)
+
+        Returns:
+            list[np.ndarray]: The filtered samples of each branch
+        """
+
+        from scipy.signal import sosfilt
+
+        branches = [np.empty_like(samples) for _ in self.branch_sos]
+
+        for start in range(0, len(samples), self.interpolation_step):
+            stop = min(start + self.interpolation_step, len(samples))
+
+            self.ramp_position = min(self.ramp_position + stop - start, self.ramp_frames)
+            fraction = self.ramp_position / self.ramp_frames
+
+            for i, (start_sos, target_sos) in enumerate(zip(self.start_sos, self.target_sos)):
+                self.branch_sos[i] = start_sos + (target_sos - start_sos) * fraction
+
+                branches[i][start:stop], self.branch_zi[i] = sosfilt(
+                    self.branch_sos[i], samples[start:stop], axis=0, zi=self.branch_zi[i]
+                )
+
+        if self.ramp_position == self.ramp_frames:
+            self.branch_sos = self.target_sos
+            self.start_sos = None
+            self.target_sos = None
+
+        return branches
+
+    def process_wav(self, input_path: str, output_path: str, block_size: int = 8192) -> None:
+        """
+        Processes a whole WAV file block by block, from a clean state,
+        and writes the result as a 32 bits float WAV file.
+
+        Args:
+            input_path (str): The file to read
+            output_path (str): The file to write
+            block_size (int, optional): Amount of frames per block. Defaults to 8192.
+
+        Raises:
+            ValueError: If the sample frequency of the file does not match the engine's
+        """
+
+        from scipy.io import wavfile
+
+        sample_frequency, samples = wavfile.read(input_path)
+
+        if sample_frequency != self.engine.get_sample_frequency():
+            raise ValueError(
+                f"The file is sampled at {sample_frequency} Hz, "
+                f"the filters at {self.engine.get_sample_frequency():g} Hz"
+            )
+
+        samples = self.convert_to_float(samples)
+
+        if samples.ndim == 1:
+            samples = samples[:, np.newaxis]
+
+        self.set_channels(samples.shape[1])
+
+        output = np.empty(samples.shape, dtype=np.float32)
+
+        for start in range(0, len(samples), block_size):
+            output[start:start + block_size] = self.process(samples[start:start + block_size])
+
+        wavfile.write(output_path, sample_frequency, output if output.shape[1] > 1 else output[:, 0])
+
+    @staticmethod
+    def convert_to_float(samples: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            samples (np.ndarray): Integer or float samples as read from a WAV file
+
+        Returns:
+            np.ndarray: The samples as floats, full scale being 1
+        """
+
+        if samples.dtype == np.uint8:
+            return (samples.astype(float) - 128) / 128
+
+        if np.issubdtype(samples.dtype, np.integer):
+            return samples.astype(float) / -np.iinfo(samples.dtype).min
+
+        return samples.astype(float)
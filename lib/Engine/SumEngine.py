@@ -21,7 +21,7 @@ class SumEngine(GraphEngine):
 
         self.input_engines = input_engines
 
-        self.compute()
+        self.mark_dirty()
 
     def compute_specific(self) -> None:
         """
@@ -29,10 +29,16 @@ class SumEngine(GraphEngine):
         """
 
         frequencies = self.input_engines[0].get_frequencies()
-        magnitude = np.array(self.input_engines[0].get_magnitude().copy())
+
+        # Remove the delay common to all the inputs, it is
+        # applied back afterwards by process_delay()
+        common_delay = min(engine.get_total_delay() for engine in self.input_engines)
+        common_delay_factor = np.exp(2j * np.pi * frequencies * common_delay / self.get_sample_frequency())
+
+        magnitude = np.array(self.input_engines[0].get_magnitude()) * common_delay_factor
 
         for engine in self.input_engines[1:]:
-            magnitude += np.array(engine.get_magnitude())
+            magnitude += np.array(engine.get_magnitude()) * common_delay_factor
 
         mag_lin = np.abs(magnitude)
         mag_db = 20 * np.log10(mag_lin)
@@ -48,6 +54,16 @@ class SumEngine(GraphEngine):
             "phase_deg": phase_deg
         }
 
+    def get_total_delay(self) -> float:
+        """
+        Returns:
+            float:
+                The delay of the sum itself plus the
+                delay common to all the input cascades
+        """
+
+        return self.get_delay() + min(engine.get_total_delay() for engine in self.input_engines)
+
     def generate_title(self) -> str:
         """
         Create a string to display as graph title.
@@ -62,6 +78,8 @@ class SumEngine(GraphEngine):
 
         self.input_engines.append(engine)
 
+        self.mark_dirty()
+
     def remove_last_engine(self) -> None:
         """
         Remove the last input engine in the list
@@ -69,12 +87,15 @@ class SumEngine(GraphEngine):
 
         del self.input_engines[-1]
 
-    def generate_zpk(self) -> None:
+        self.mark_dirty()
+
+    def generate_zpk(self) -> tuple[list, list, list]:
         """
         Does nothing on purpose because the SumEngine doesn't deal
         with transfer functions but rather with data directly
+
+        Returns:
+            tuple[list, list, list]: Empty zeros, poles and gain
         """
 
-        self.z = []
-        self.p = []
-        self.k = []
\ No newline at end of file
+        return [], [], []
\ No newline at end of file
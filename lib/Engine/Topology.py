@@ -0,0 +1,375 @@
+import json
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+from lib.Engine.GraphEngine import GraphEngine
+from lib.Engine.BiquadEngine import BiquadEngine
+from lib.Engine.CascadeEngine import CascadeEngine
+from lib.Engine.SumEngine import SumEngine
+from lib.Engine.FrequencyGrid import FrequencyGrid
+from lib.Engine.EngineScheduler import EngineScheduler
+
+class Topology:
+    """
+    Sum of cascades of input cells built from a description,
+    to evaluate filters without the GUI.
+
+    A description is a dictionary such as:
+
+        {
+            "name": "crossover",
+            "sample_frequency": 48000,
+            "frequency_grid": {"spacing": "log", "points": 500},
+            "sum": {"gain": 0, "flip_phase": false, "delay": 0},
+            "cascades": [
+                {
+                    "gain": 0,
+                    "cells": [
+                        {"filtertype": "butterworth lowpass", "order": 4, "frequency": 2000}
+                    ]
+                }
+            ]
+        }
+
+    Only "cascades" and their "cells" are mandatory, everything
+    else defaults to the same values as the GUI.
+    """
+
+    # Parameters common to all the engines, in the order they are set
+    engine_setters = {
+        "gain":         "set_gain",
+        "flip_phase":   "set_flip_phase",
+        "delay":        "set_delay"
+    }
+
+    # The filter type is set after the frequency and transition band,
+    # whose FIR constraints are checked again once it is known
+    cell_setters = {
+        "order":                "set_order",
+        "frequency":            "set_frequency",
+        "Q":                    "set_Q",
+        "passband_ripple":      "set_passband_ripple",
+        "stopband_attenuation": "set_stopband_attenuation",
+        "transband_width":      "set_transband_width",
+        "slope":                "set_slope",
+        "bandwidth":            "set_bandwidth",
+        "matched":              "set_matched",
+        "filtertype":           "set_filtertype"
+    } | engine_setters
+
+    def __init__(self, description: dict) -> None:
+        """
+        Args:
+            description (dict): The description of the sum, see the class docstring
+
+        Raises:
+            ValueError: In case of an invalid description
+        """
+
+        self.name = str(description.get("name", "topology"))
+        self.sample_frequency = float(description.get("sample_frequency", 48000))
+
+        self.frequency_grid = FrequencyGrid(**description.get("frequency_grid", {}))
+
+        if not description.get("cascades"):
+            raise ValueError("A description needs at least one cascade")
+
+        cascade_engines = []
+
+        for cascade_index, cascade_description in enumerate(description["cascades"]):
+            cascade_name = f"Cascade {chr(ord('A') + cascade_index)}"
+
+            if not cascade_description.get("cells"):
+                raise ValueError(f"{cascade_name} needs at least one cell")
+
+            cell_engines = [
+                self.create_engine(BiquadEngine, cell_description)
+                for cell_description in cascade_description["cells"]
+            ]
+
+            cascade_engine = self.create_engine(CascadeEngine, cascade_description)
+            cascade_engine.set_input_engines(cell_engines)
+
+            cascade_engines.append(cascade_engine)
+
+        self.sum_engine = self.create_engine(SumEngine, description.get("sum", {}))
+        self.sum_engine.set_input_engines(cascade_engines)
+
+        # Engines by display name, in topological order
+        self.engines = self.get_engine_names(self.sum_engine)
+
+        self.scheduler = EngineScheduler(self.sum_engine)
+
+    def create_engine(self, engine_class: type, description: dict) -> GraphEngine:
+        """
+        Args:
+            engine_class (type): The GraphEngine child class to instantiate
+            description (dict): The parameters of the engine
+
+        Raises:
+            ValueError: In case of an unknown or invalid parameter
+
+        Returns:
+            GraphEngine: The engine with its parameters set
+        """
+
+        engine = engine_class()
+        engine.set_frequency_grid(self.frequency_grid)
+        engine.set_sample_frequency(self.sample_frequency)
+
+        self.set_parameters(engine, description)
+
+        return engine
+
+    @classmethod
+    def set_parameters(cls, engine: GraphEngine, description: dict) -> None:
+        """
+        Args:
+            engine (GraphEngine): A cell, cascade or sum
+            description (dict): The parameters of the engine, the missing ones are left as is
+
+        Raises:
+            ValueError: In case of an unknown or invalid parameter
+        """
+
+        setters = cls.get_setters(engine)
+
+        # Cascades hold the description of their cells
+        ignored_keys = {"cells"} if isinstance(engine, CascadeEngine) else set()
+        unknown_keys = set(description) - set(setters) - ignored_keys
+
+        if unknown_keys:
+            raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown_keys))}")
+
+        for key, setter in setters.items():
+            if key in description:
+                getattr(engine, setter)(description[key])
+
+        if isinstance(engine, BiquadEngine):
+            # Make sure the FIR constraints are met with the final filter type
+            engine.set_frequency(engine.get_frequency())
+            engine.set_transband_width(engine.get_transband_width())
+
+    @classmethod
+    def get_parameters(cls, engine: GraphEngine) -> dict:
+        """
+        Args:
+            engine (GraphEngine): A cell, cascade or sum
+
+        Returns:
+            dict: The parameters of the engine, as accepted by set_parameters()
+        """
+
+        return {
+            key: getattr(engine, setter.replace("set_", "get_", 1))()
+            for key, setter in cls.get_setters(engine).items()
+        }
+
+    @classmethod
+    def get_setters(cls, engine: GraphEngine) -> dict[str, str]:
+        """
+        Args:
+            engine (GraphEngine): A cell, cascade or sum
+
+        Returns:
+            dict[str, str]: The setter of each parameter of the engine
+        """
+
+        return cls.cell_setters if isinstance(engine, BiquadEngine) else cls.engine_setters
+
+    @staticmethod
+    def get_engine_names(sum_engine: SumEngine) -> dict[str, GraphEngine]:
+        """
+        Args:
+            sum_engine (SumEngine): The sum of cascades of cells
+
+        Returns:
+            dict[str, GraphEngine]:
+                The cells, cascades and sum by display name,
+                such as "Cascade A 1", "Cascade A" and "Sum",
+                in topological order
+        """
+
+        engines = {}
+
+        for cascade_index, cascade_engine in enumerate(sum_engine.input_engines):
+            cascade_name = f"Cascade {chr(ord('A') + cascade_index)}"
+
+            for cell_index, cell_engine in enumerate(cascade_engine.input_engines):
+                engines[f"{cascade_name} {cell_index + 1}"] = cell_engine
+
+            engines[cascade_name] = cascade_engine
+
+        engines["Sum"] = sum_engine
+
+        return engines
+
+    @classmethod
+    def describe(cls, sum_engine: SumEngine, name: str = "topology") -> dict:
+        """
+        Args:
+            sum_engine (SumEngine): The sum of cascades of cells to describe
+            name (str, optional): The name of the description. Defaults to "topology".
+
+        Returns:
+            dict: The description of the sum, see the class docstring
+        """
+
+        return {
+            "name": name,
+            "sample_frequency": sum_engine.get_sample_frequency(),
+            "frequency_grid": sum_engine.get_frequency_grid().get_description(),
+            "sum": cls.get_parameters(sum_engine),
+            "cascades": [
+                cls.get_parameters(cascade_engine) | {
+                    "cells": [cls.get_parameters(cell_engine) for cell_engine in cascade_engine.input_engines]
+                }
+                for cascade_engine in sum_engine.input_engines
+            ]
+        }
+
+    @classmethod
+    def load(cls, path: str | Path) -> list["Topology"]:
+        """
+        Reads a JSON or YAML file holding a description,
+        or a list of descriptions to evaluate several variants,
+        or a session file saved by the GUI.
+
+        Args:
+            path (str | Path):
+                The file to read, YAML if its suffix is .yaml or .yml,
+                a session if it is .fpsession
+
+        Raises:
+            ValueError: In case of an invalid file
+
+        Returns:
+            list[Topology]: One topology per description
+        """
+
+        # Imported here, Session builds on Topology
+        from lib.Engine.Session import Session
+
+        path = Path(path)
+
+        if path.suffix.lower() == Session.suffix:
+            session = Session.load(path)
+
+            topology = cls({"name": path.stem} | session.get_description())
+
+            # Only the engines without saved results get computed
+            session.restore_results(topology.engines)
+
+            return [topology]
+
+        with open(path, encoding="utf-8") as file:
+            if path.suffix.lower() in [".yaml", ".yml"]:
+                if yaml is None:
+                    raise ValueError("Reading YAML files requires PyYAML")
+
+                descriptions = yaml.safe_load(file)
+            else:
+                descriptions = json.load(file)
+
+        if isinstance(descriptions, dict):
+            descriptions = [descriptions]
+
+        topologies = []
+
+        for index, description in enumerate(descriptions):
+            # Variants without a name are numbered after the file
+            description.setdefault("name", path.stem if len(descriptions) == 1 else f"{path.stem}_{index}")
+            topologies.append(cls(description))
+
+        return topologies
+
+    def compute(self) -> None:
+        """
+        Computes all the engines
+        """
+
+        self.scheduler.compute()
+
+    def get_responses(self, all_engines: bool = False) -> dict[str, dict[str, np.ndarray]]:
+        """
+        Args:
+            all_engines (bool, optional):
+                Also return the responses of the cascades and cells.
+                Defaults to False.
+
+        Returns:
+            dict[str, dict[str, np.ndarray]]:
+                Magnitude, phase, phase delay and group delay of each engine
+                by display name. The group delay has one point less than the
+                frequencies, it is padded with a NaN to keep them aligned.
+        """
+
+        engines = self.engines if all_engines else {"Sum": self.sum_engine}
+
+        return {
+            name: {
+                "magnitude_db": np.asarray(engine.get_magnitude_db()),
+                "phase_deg": np.asarray(engine.get_phase_deg()),
+                "phase_delay_ms": np.asarray(engine.get_phase_delay_ms()),
+                "group_delay_ms": np.append(engine.get_group_delay_ms(), np.nan)
+            }
+            for name, engine in engines.items()
+        }
+
+    def export_csv(self, path: str | Path, all_engines: bool = False) -> None:
+        """
+        Writes the computed responses to a CSV file,
+        one column per frequency, quantity and engine.
+
+        Args:
+            path (str | Path): The file to write
+            all_engines (bool, optional):
+                Also write the responses of the cascades and cells.
+                Defaults to False.
+        """
+
+        headers = ["Frequency [Hz]"]
+        columns = [self.sum_engine.get_frequencies()]
+
+        units = {
+            "magnitude_db": "Magnitude [dB]",
+            "phase_deg": "Phase [deg]",
+            "phase_delay_ms": "Phase delay [ms]",
+            "group_delay_ms": "Group delay [ms]"
+        }
+
+        for name, response in self.get_responses(all_engines).items():
+            for key, unit in units.items():
+                headers.append(f"{name} {unit}")
+                columns.append(response[key])
+
+        np.savetxt(path, np.column_stack(columns), delimiter=",", header=",".join(headers), comments="")
+
+    def export_npz(self, path: str | Path, all_engines: bool = False) -> None:
+        """
+        Writes the computed responses to a compressed NumPy archive,
+        with keys such as "frequencies", "sum_magnitude_db"
+        or "cascade_a_1_group_delay_ms".
+
+        Args:
+            path (str | Path): The file to write
+            all_engines (bool, optional):
+                Also write the responses of the cascades and cells.
+                Defaults to False.
+        """
+
+        arrays = {"frequencies": np.asarray(self.sum_engine.get_frequencies())}
+
+        for name, response in self.get_responses(all_engines).items():
+            prefix = name.lower().replace(" ", "_")
+
+            for key, values in response.items():
+                arrays[f"{prefix}_{key}"] = values
+
+        np.savez_compressed(path, **arrays)
@@ -1,6 +1,10 @@
-from matplotlib.ticker import ScalarFormatter
+import logging
+
+from PyQt6.QtCore import QTimer, pyqtSignal
 
 from lib.Graph.GraphWidget import GraphWidget
+from lib.Engine.GraphEngine import GraphEngine
+from lib.Engine.BiquadEngine import BiquadEngine
 
 import numpy as np
 
@@ -10,18 +14,75 @@ class BodeGraphWidget(GraphWidget):
 
     Must be inherited by a child class implementing the
     virtual method(s)
+
+    The curves and dotted lines are animated artists: they are
+    blitted over a cached background holding everything else,
+    which is only redrawn when the axes limits, the title or
+    the Nyquist frequency change.
+
+    The cells displayed have a handle on the magnitude curve:
+    dragging it changes their frequency and gain, scrolling over
+    it changes their Q. The new parameters are applied at most
+    once per display refresh, the positions in between are dropped.
     """
 
+    # Set to False to redraw the whole figure on every update
+    blitting = True
+
+    # Emitted with the cell whose parameters were changed with its handle
+    parameters_edited = pyqtSignal(object)
+
+    # Filter types whose gain, or Q, can be changed with the handle
+    gain_types = [
+        "highpass", "lowpass", "peak", "lowshelf", "highshelf",
+        "butterworth highpass", "butterworth lowpass",
+        "bessel highpass", "bessel lowpass",
+        "chebyshev i highpass", "chebyshev i lowpass",
+        "chebyshev ii highpass", "chebyshev ii lowpass",
+        "elliptic highpass", "elliptic lowpass",
+        "fir highpass", "fir lowpass", "tilt"
+    ]
+    Q_types = ["highpass", "lowpass", "allpass", "peak", "lowshelf", "highshelf"]
+
+    # Distance from a handle to grab it, in pixels
+    handle_radius = 10
+
+    # True while a handle is dragged on any graph: the delay axes
+    # keep their limits until it is dropped, to blit every frame
+    dragging = False
+
     def __init__(self, *args, **kwargs) -> None:
 
         super().__init__(*args, **kwargs)
 
+        self.handles = []
+        self.dragged_handle = None
+        self.pending_edit = None
+
+        self.edit_timer = QTimer()
+        self.edit_timer.setSingleShot(True)
+        self.edit_timer.timeout.connect(self.apply_edit)
+
+    def init_figure(self) -> None:
+        """
+        Creates the magnitude/phase and delay axes
+        """
+
         self.axs = self.figure.subplots(2, 1, sharex=True)
-        self.axvspans = [None, None]
-        self.axvspan_texts = [None, None]
+        self.axvspans = []
+        self.axvspan_texts = []
+        self.nyquist_frequency = None
+        self.title = None
+        self.background = None
 
         self.init_graph()
 
+        self.canvas.mpl_connect('draw_event', self.handle_draw)
+        self.canvas.mpl_connect('button_press_event', self.handle_press)
+        self.canvas.mpl_connect('motion_notify_event', self.handle_motion)
+        self.canvas.mpl_connect('button_release_event', self.handle_release)
+        self.canvas.mpl_connect('scroll_event', self.handle_scroll)
+
     def init_graph(self,
             frequency_range:    list[float] = [20, 20e3],
             magnitude_range:    list[float] = [-30, 30],
@@ -39,8 +100,10 @@ class BodeGraphWidget(GraphWidget):
                 Range to display on the Y axis of the phase plot in degrees. Defaults to [-200, 200].
         """
 
+        from matplotlib.ticker import ScalarFormatter
+
         # Magnitude
-        self.magnitude_graph, = self.axs[0].semilogx([], [])
+        self.magnitude_graph, = self.axs[0].semilogx([], [], animated=True)
         self.axs[0].set_xlim(frequency_range)
         self.axs[0].set_ylabel('Gain [dB]')
         self.axs[0].set_ylim(magnitude_range)
@@ -55,17 +118,17 @@ class BodeGraphWidget(GraphWidget):
         self.phase_ax = self.axs[0].twinx()
         self.phase_ax.set_ylabel("Phase [°]")
         self.phase_ax.set_ylim(phase_range)
-        self.phase_graph, = self.phase_ax.semilogx([], [], color=phase_color)
+        self.phase_graph, = self.phase_ax.semilogx([], [], color=phase_color, animated=True)
         self.phase_ax.tick_params(axis='y', colors=phase_color)
         self.phase_ax.yaxis.label.set_color(phase_color)
 
         self.axline_top = [
-            self.axs[0].axvline(0, linestyle='--', color='red')
+            self.axs[0].axvline(0, linestyle='--', color='red', animated=True)
         ]
 
         # Phase delay
         phase_delay_color = 'xkcd:coral pink'
-        self.phase_delay_graph, = self.axs[1].semilogx([], [], color=phase_delay_color)
+        self.phase_delay_graph, = self.axs[1].semilogx([], [], color=phase_delay_color, animated=True)
         self.phase_delay_ax = self.axs[1]
         self.phase_delay_ax.set_xlabel('Frequency [Hz]')
         self.phase_delay_ax.set_xlim(frequency_range)
@@ -80,25 +143,31 @@ class BodeGraphWidget(GraphWidget):
         self.group_delay_ax = self.axs[1].twinx()
         self.group_delay_ax.set_ylabel("Group delay [ms]")
         self.group_delay_ax.set_ylim([0, 10])
-        self.group_delay_graph, = self.group_delay_ax.semilogx([], [], color=group_delay_color)
+        self.group_delay_graph, = self.group_delay_ax.semilogx([], [], color=group_delay_color, animated=True)
         self.group_delay_ax.tick_params(axis='y', colors=group_delay_color)
         self.group_delay_ax.yaxis.label.set_color(group_delay_color)
 
         self.axline_bottom = [
-            self.axs[1].axvline(0, linestyle='--', color='red')
+            self.axs[1].axvline(0, linestyle='--', color='red', animated=True)
         ]
 
         # Disable scientific notation on the frequency axis
         self.axs[1].xaxis.set_major_formatter(ScalarFormatter())
         self.axs[1].ticklabel_format(axis='x', style='plain')
 
-    def update_graph(self) -> None:
+    def draw_graph(self) -> None:
         """
-        Updates the graph with the data currently stored in the object.
-        Usually called after self.engine.compute()
+        Draws the data currently stored in the engine
         """
 
-        self.update_title()
+        full_redraw = not self.blitting or self.background is None
+
+        title = self.engine.generate_title()
+
+        if title != self.title:
+            self.title = title
+            self.update_title()
+            full_redraw = True
 
         self.magnitude_graph.set_data(
             self.engine.get_frequencies(),
@@ -120,35 +189,84 @@ class BodeGraphWidget(GraphWidget):
         phase_delay_max =  np.max(np.ma.masked_invalid(self.engine.get_phase_delay_ms()[1:]))
         ylim_phase_delay_max = phase_delay_max + (phase_delay_max / 10)
 
-        self.phase_delay_ax.set_ylim(0, ylim_phase_delay_max)
+        if not BodeGraphWidget.dragging:
+            full_redraw |= self.update_ylim(self.phase_delay_ax, ylim_phase_delay_max)
 
         # Drop first group delay point for determining the maximum
         # as it is garbage and can be way too high
         group_delay_max =  np.max(np.ma.masked_invalid(self.engine.get_group_delay_ms()[1:]))
         ylim_group_delay_max = group_delay_max + (group_delay_max / 10)
 
-        self.group_delay_ax.set_ylim(0, ylim_group_delay_max)
+        if not BodeGraphWidget.dragging:
+            full_redraw |= self.update_ylim(self.group_delay_ax, ylim_group_delay_max)
 
         self.update_axvlines()
+        self.update_handles()
+
+        if self.engine.get_sample_frequency() / 2 != self.nyquist_frequency:
+            self.update_axvspans()
+            full_redraw = True
+
+        if full_redraw:
+            # The background is captured again by handle_draw()
+            with GraphEngine.profiler.measure("canvas_draw", "graph"):
+                self.canvas.draw()
+        else:
+            with GraphEngine.profiler.measure("blit", "graph"):
+                self.blit()
+
+    def update_ylim(self, ax, ylim_max: float) -> bool:
+        """
+        Sets the upper limit of a delay axis, if it really changed.
+
+        The current limit is kept as long as the curve fits
+        without leaving more than 20% of the axis empty, so that
+        small parameter changes don't redraw the background.
+        A new limit leaves some room for the curve to grow.
+
+        Args:
+            ax (Axes): The axis to update
+            ylim_max (float): The new upper limit
+
+        Returns:
+            bool: True if the limits changed and the background must be redrawn
+        """
+
+        ylim_min_current, ylim_max_current = ax.get_ylim()
+
+        # The limit is negative when the delay is, e.g. a highpass phase delay
+        if (
+            ylim_min_current == 0
+            and np.sign(ylim_max) == np.sign(ylim_max_current)
+            and 0.8 * abs(ylim_max_current) <= abs(ylim_max) <= abs(ylim_max_current)
+        ):
+            return False
+
+        # Some more room so that the curve can grow a little
+        ax.set_ylim(0, ylim_max * 1.1)
+
+        return True
+
+    def update_axvspans(self) -> None:
+        """
+        Greys out the area above the Nyquist frequency
+        """
+
+        self.nyquist_frequency = self.engine.get_sample_frequency() / 2
 
-        # Grey out the area above Nyquist frequency
         for axvspan in self.axvspans:
-            if axvspan:
-                axvspan.remove()
-        del self.axvspans
+            axvspan.remove()
         self.axvspans = []
 
         for axvspan_text in self.axvspan_texts:
-            if axvspan_text:
-                axvspan_text.remove()
-        del self.axvspan_texts
+            axvspan_text.remove()
         self.axvspan_texts = []
 
         for ax in self.axs:
-            self.axvspans.append(ax.axvspan(self.engine.get_sample_frequency() / 2, 1e12, color='gray'))
+            self.axvspans.append(ax.axvspan(self.nyquist_frequency, 1e12, color='gray'))
             self.axvspan_texts.append(
                 ax.text(
-                    (self.engine.get_sample_frequency() / 2) * 1.1,
+                    self.nyquist_frequency * 1.1,
                     0,
                     "Harry Nyquist\nis watching you",
                     fontsize=10,
@@ -160,7 +278,48 @@ class BodeGraphWidget(GraphWidget):
                 )
             )
 
-        self.canvas.draw()
+    def get_animated_artists(self) -> list:
+        """
+        Returns:
+            list: The artists drawn over the cached background
+        """
+
+        return [
+            self.magnitude_graph,
+            self.phase_graph,
+            self.phase_delay_graph,
+            self.group_delay_graph,
+            *self.axline_top,
+            *self.axline_bottom,
+            *self.handles
+        ]
+
+    def handle_draw(self, event) -> None:
+        """
+        Matplotlib callback called after each full redraw,
+        to cache the background and draw the animated artists over it
+        """
+
+        # The saved figure draws the animated artists by itself
+        if self.canvas.is_saving():
+            return
+
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+
+        for artist in self.get_animated_artists():
+            self.figure.draw_artist(artist)
+
+    def blit(self) -> None:
+        """
+        Redraws only the animated artists over the cached background
+        """
+
+        self.canvas.restore_region(self.background)
+
+        for artist in self.get_animated_artists():
+            self.figure.draw_artist(artist)
+
+        self.canvas.blit(self.figure.bbox)
 
     def update_axvlines(self) -> None:
         """
@@ -170,4 +329,214 @@ class BodeGraphWidget(GraphWidget):
         To be implemented by child classes.
         """
 
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def get_handle_engines(self) -> list[BiquadEngine]:
+        """
+        Returns:
+            list[BiquadEngine]: The cells having a handle on the graph, none by default
+        """
+
+        return []
+
+    def update_handles(self) -> None:
+        """
+        Places the handles on the magnitude curve, at the
+        frequency of their cell. The dragged one follows the mouse.
+        """
+
+        engines = self.get_handle_engines()
+
+        while len(self.handles) < len(engines):
+            self.handles.append(
+                self.axs[0].plot([], [], 'o', color='red', markersize=8, animated=True)[0]
+            )
+
+        while len(self.handles) > len(engines):
+            self.handles.pop().remove()
+
+        frequencies = self.engine.get_frequencies()
+        magnitude_db = self.engine.get_magnitude_db()
+
+        for i, engine in enumerate(engines):
+            if i == self.dragged_handle:
+                continue
+
+            self.handles[i].set_data(
+                [engine.get_frequency()],
+                [np.interp(engine.get_frequency(), frequencies, magnitude_db)]
+            )
+
+    def get_handle_at(self, event) -> int | None:
+        """
+        Args:
+            event (MouseEvent): A matplotlib mouse event
+
+        Returns:
+            int | None: The index of the handle under the mouse, if any
+        """
+
+        # Not while panning or zooming with the toolbar
+        if not self.canvas.widgetlock.available(self) or event.x is None:
+            return None
+
+        for i, handle in enumerate(self.handles):
+            if not len(handle.get_xdata()):
+                continue
+
+            x, y = self.axs[0].transData.transform((handle.get_xdata()[0], handle.get_ydata()[0]))
+
+            if np.hypot(x - event.x, y - event.y) <= self.handle_radius:
+                return i
+
+        return None
+
+    def get_magnitude_position(self, event) -> tuple[float, float]:
+        """
+        Args:
+            event (MouseEvent): A matplotlib mouse event
+
+        Returns:
+            tuple[float, float]:
+                The frequency and magnitude under the mouse,
+                whichever twin axes the event was reported in
+        """
+
+        return self.axs[0].transData.inverted().transform((event.x, event.y))
+
+    def handle_press(self, event) -> None:
+        """
+        Matplotlib callback starting to drag the handle under the mouse
+        """
+
+        if event.button != 1:
+            return
+
+        handle = self.get_handle_at(event)
+
+        if handle is None:
+            return
+
+        self.dragged_handle = handle
+        BodeGraphWidget.dragging = True
+        self.drag_engine = self.get_handle_engines()[handle]
+        self.drag_gain = self.drag_engine.get_gain()
+        _, self.drag_magnitude = self.get_magnitude_position(event)
+
+        # Apply the edits as fast as the display refreshes
+        refresh_rate = self.screen().refreshRate() or 60
+        self.edit_timer.setInterval(max(int(1000 / refresh_rate), 1))
+
+    def handle_motion(self, event) -> None:
+        """
+        Matplotlib callback moving the dragged handle with the mouse
+        """
+
+        if self.dragged_handle is None or event.x is None:
+            return
+
+        frequency, magnitude = self.get_magnitude_position(event)
+
+        self.handles[self.dragged_handle].set_data([frequency], [magnitude])
+
+        if self.background is not None:
+            self.blit()
+
+        parameters = {"frequency": frequency}
+
+        if self.drag_engine.get_filtertype().lower() in self.gain_types:
+            parameters["gain"] = self.drag_gain + magnitude - self.drag_magnitude
+
+        self.request_edit(self.drag_engine, parameters)
+
+    def handle_release(self, event) -> None:
+        """
+        Matplotlib callback dropping the dragged handle
+        """
+
+        if self.dragged_handle is None:
+            return
+
+        self.dragged_handle = None
+        BodeGraphWidget.dragging = False
+
+        # The last position is applied right away
+        self.edit_timer.stop()
+        self.apply_edit()
+
+    def handle_scroll(self, event) -> None:
+        """
+        Matplotlib callback changing the Q of the cell
+        whose handle is under the mouse
+        """
+
+        handle = self.get_handle_at(event)
+
+        if handle is None:
+            return
+
+        engine = self.get_handle_engines()[handle]
+
+        if engine.get_filtertype().lower() not in self.Q_types:
+            return
+
+        self.request_edit(engine, {"Q": engine.get_Q() * 1.1 ** event.step})
+
+    def request_edit(self, engine: BiquadEngine, parameters: dict[str, float]) -> None:
+        """
+        Applies new parameters to a cell at the next display refresh.
+        Parameters requested in the meantime replace them.
+
+        Args:
+            engine (BiquadEngine): The cell to edit
+            parameters (dict[str, float]): The new "frequency", "gain" or "Q"
+        """
+
+        if self.pending_edit is not None and self.pending_edit[0] is engine:
+            parameters = self.pending_edit[1] | parameters
+
+        self.pending_edit = (engine, parameters)
+
+        if not self.edit_timer.isActive():
+            self.edit_timer.start()
+
+    def apply_edit(self) -> None:
+        """
+        Sets the pending parameters, rounded and kept in the
+        ranges of the toolbar fields, and notifies the edit.
+        The engine is left as it was if a parameter is refused.
+        """
+
+        if self.pending_edit is None:
+            return
+
+        engine, parameters = self.pending_edit
+        self.pending_edit = None
+
+        limits = {
+            "frequency": (1, min(100000, engine.get_sample_frequency() / 2 - 1)),
+            "gain": (-100, 100),
+            "Q": (0.01, 100)
+        }
+
+        # Setters fall back to a default before raising, so the
+        # whole engine is restored if any parameter is refused
+        previous_state = dict(vars(engine))
+
+        try:
+            for name, value in parameters.items():
+                value = float(np.clip(value, *limits[name]))
+                value = int(round(value)) if name == "frequency" else round(value, 2)
+
+                getattr(engine, f"set_{name}")(value)
+
+        except ValueError as e:
+            # E.g. a FIR stopband narrower than its transition band
+            logging.info(e)
+
+            vars(engine).clear()
+            vars(engine).update(previous_state)
+            return
+
+        self.parameters_edited.emit(engine)
+
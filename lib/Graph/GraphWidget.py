@@ -2,8 +2,7 @@ from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout
 )
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolbar2QT as NavigationToolbar
-from matplotlib.figure import Figure
+from PyQt6.QtCore import QTimer
 
 from lib.Engine.GraphEngine import GraphEngine
 
@@ -13,14 +12,45 @@ class GraphWidget(QWidget):
 
     Must be inherited by a child class implementing the
     virtual method(s)
+
+    The canvas is only created, and the graph only drawn, when
+    the widget is shown. Matplotlib itself gets imported when
+    the first canvas is created, which keeps the startup fast.
     """
 
+    # Matplotlib style applied before creating the first canvas
+    style = "default"
+    style_applied = False
+
     def __init__(self, *args, **kwargs) -> None:
 
         super().__init__(*args, **kwargs)
 
         self.setLayout(QVBoxLayout())
 
+        # Same size as the canvas until it gets created
+        self.setMinimumHeight(250)
+        self.setMinimumWidth(600)
+
+        self.canvas = None
+        self.figure = None
+        self.graph_outdated = False
+
+    def create_canvas(self) -> None:
+        """
+        Creates the canvas and its toolbar, then lets
+        the child class prepare the empty graph
+        """
+
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg, NavigationToolbar2QT as NavigationToolbar
+        from matplotlib.figure import Figure
+
+        if not GraphWidget.style_applied:
+            import matplotlib.style as mpls
+
+            mpls.use(GraphWidget.style)
+            GraphWidget.style_applied = True
+
         self.canvas = FigureCanvasQTAgg(Figure())
         self.canvas.setMinimumHeight(250)
         self.canvas.setMinimumWidth(600)
@@ -31,6 +61,45 @@ class GraphWidget(QWidget):
         self.layout().addWidget(NavigationToolbar(self.canvas))
         self.layout().addWidget(self.canvas)
 
+        self.init_figure()
+
+    def init_figure(self) -> None:
+        """
+        Creates the axes and artists of the empty graph.
+
+        Must be implemented by child classes.
+        """
+
+        raise NotImplementedError
+
+    def showEvent(self, event) -> None:
+
+        super().showEvent(event)
+
+        # Let the window appear before creating the canvas
+        QTimer.singleShot(0, self.handle_shown)
+
+    def handle_shown(self) -> None:
+        """
+        Creates the canvas the first time the widget is shown,
+        and draws the graph if it changed while it was hidden
+        """
+
+        if not self.isVisible():
+            return
+
+        # Wait for the window to be on screen, the first
+        # canvas takes a while to create as it imports matplotlib
+        if not self.window().windowHandle().isExposed():
+            QTimer.singleShot(10, self.handle_shown)
+            return
+
+        if self.canvas is None:
+            self.create_canvas()
+
+        if self.graph_outdated:
+            self.update_graph()
+
     def set_engine(self, engine: GraphEngine) -> None:
         """
         Set the computing engine. Has to be done outside of constructor
@@ -51,6 +120,23 @@ class GraphWidget(QWidget):
         Updates the graph with the data currently stored in the engine.
         Usually called after self.engine.compute()
 
+        A hidden graph is only updated once it gets shown.
+        """
+
+        if not self.isVisible() or self.canvas is None:
+            self.graph_outdated = True
+            return
+
+        self.graph_outdated = False
+
+        with GraphEngine.profiler.measure(f"{type(self).__name__}.draw_graph", "graph"), \
+            GraphEngine.profiler.capture():
+            self.draw_graph()
+
+    def draw_graph(self) -> None:
+        """
+        Draws the data currently stored in the engine.
+
         Must be implemented by child classes.
         """
 
@@ -1,7 +1,6 @@
 from lib.Graph.GraphWidget import GraphWidget
 from lib.Engine.GraphEngine import GraphEngine
 
-import matplotlib.patches as patch
 from numpy import real, imag
 
 class PolezeroGraphWidget(GraphWidget):
@@ -13,6 +12,11 @@ class PolezeroGraphWidget(GraphWidget):
 
         super().__init__(*args, **kwargs)
 
+    def init_figure(self) -> None:
+        """
+        Creates the axes of the map
+        """
+
         self.axs = self.figure.gca()
 
         self.init_graph()
@@ -34,6 +38,8 @@ class PolezeroGraphWidget(GraphWidget):
         Prepares an empty graph to host filter data later on.
         """
 
+        import matplotlib.patches as patch
+
         self.axs.grid(which='both', axis='both')
         self.axs.set_xlim(-1.5, 1.5)
         self.axs.set_xlabel("Real part")
@@ -44,15 +50,16 @@ class PolezeroGraphWidget(GraphWidget):
         self.scatter_zero = self.axs.plot([], [], '.c')
         self.scatter_pole = self.axs.plot([], [], 'xr')
 
-    def update_graph(self) -> None:
+    def draw_graph(self) -> None:
         """
-        Updates the graph with the data currently stored in the object.
-        Usually called after self.engine.compute()
+        Draws the data currently stored in the engine
         """
 
         self.update_title()
 
-        self.scatter_zero[0].set_data(real(self.engine.z), imag(self.engine.z))
-        self.scatter_pole[0].set_data(real(self.engine.p), imag(self.engine.p))
+        z, p, _ = self.engine.get_zpk()
+
+        self.scatter_zero[0].set_data(real(z), imag(z))
+        self.scatter_pole[0].set_data(real(p), imag(p))
 
         self.canvas.draw()
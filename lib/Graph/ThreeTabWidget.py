@@ -5,6 +5,7 @@ from PyQt6.QtWidgets import (
     QWidget,
     QMessageBox
 )
+from PyQt6.QtCore import pyqtSignal
 from lib.Engine.GraphEngine import GraphEngine
 from lib.Graph.PolezeroGraphWidget import PolezeroGraphWidget
 from lib.Graph.BodeGraphWidget import BodeGraphWidget
@@ -15,6 +16,12 @@ class ThreeTabWidget(QTabWidget):
     Bode plot and pole-zero map.
     """
 
+    # Emitted when the user asks for the graphs to be computed
+    compute_requested = pyqtSignal()
+
+    # Emitted with a cell edited with its handle on the Bode plot
+    parameters_edited = pyqtSignal(object)
+
     def __init__(self,
         first_tab_widget: QWidget,
         first_tab_label: str,
@@ -38,6 +45,8 @@ class ThreeTabWidget(QTabWidget):
         self.addTab(self.bode_graph, "Bode plot")
         self.addTab(self.polezero_graph, "Pole-zero map")
 
+        self.bode_graph.parameters_edited.connect(self.parameters_edited)
+
         self.popup = QMessageBox()
 
     def set_engine(self, engine: GraphEngine) -> None:
@@ -68,16 +77,29 @@ class ThreeTabWidget(QTabWidget):
 
         self.popup.exec()
 
-    def compute_and_update(self) -> None:
+    def update_graphs(self) -> None:
+        """
+        Updates the graph of the tab currently displayed. The other
+        one is only marked as outdated and gets updated when its tab
+        is selected, so that the zeros, poles and gain are only
+        generated while the pole-zero map is displayed.
         """
-        Convenience method to wrap computing the filter
-        and updating the two graphs in one go
+
+        for graph in [self.bode_graph, self.polezero_graph]:
+            if graph is self.currentWidget():
+                graph.update_graph()
+            else:
+                graph.graph_outdated = True
+
+    def update_fields(self) -> None:
         """
+        Displays the parameters of the engine in the first tab,
+        after they were set without the widgets.
 
-        self.engine.compute()
+        Nothing to do for widgets without parameter fields.
+        """
 
-        self.bode_graph.update_graph()
-        self.polezero_graph.update_graph()
+        pass
 
     def handle_sample_frequency(self, sample_frequency: str) -> None:
         """
@@ -87,8 +109,6 @@ class ThreeTabWidget(QTabWidget):
 
         self.engine.set_sample_frequency(float(sample_frequency or 48000))
 
-        self.compute_and_update()
-
     def handle_flip_phase(self, flip_phase: bool) -> None:
         """
         Qt slot to update the filter phase flip according
@@ -109,7 +129,7 @@ class ThreeTabWidget(QTabWidget):
             logging.warning(e)
             self.popup_invalid_data(str(e))
 
-    def handle_delay_samples(self, delay_samples: int) -> None:
+    def handle_delay_samples(self, delay_samples: float) -> None:
         """
         Qt slot to update the filter delay according
         to the spinbox in the toolbar
@@ -125,11 +145,11 @@ class ThreeTabWidget(QTabWidget):
 
         self.update_delay_msec_spinbox(delay_msec)
 
-    def update_delay_msec_spinbox(self, delay_samples: int) -> None:
+    def update_delay_msec_spinbox(self, delay_msec: float) -> None:
 
         raise NotImplementedError
 
-    def update_delay_samples_spinbox(self, delay_samples: int) -> None:
+    def update_delay_samples_spinbox(self, delay_samples: float) -> None:
 
         raise NotImplementedError
 
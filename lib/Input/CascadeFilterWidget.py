@@ -35,12 +35,40 @@ class CascadeFilterWidget(ThreeTabWidget):
         self.cascade_toolbar.field_flip_phase.stateChanged.connect(self.handle_flip_phase)
         self.cascade_toolbar.field_delay_samples.valueChanged.connect(self.handle_delay_samples)
         self.cascade_toolbar.field_delay_msec.valueChanged.connect(self.handle_delay_msec)
-        self.cascade_toolbar.compute_button.clicked.connect(self.compute_and_update)
+        self.cascade_toolbar.compute_button.clicked.connect(self.compute_requested)
 
-    def update_delay_samples_spinbox(self, delay_samples: int) -> None:
+    def update_fields(self) -> None:
+        """
+        Displays the parameters of the engine in the toolbar,
+        without setting them again
+        """
+
+        fields = [
+            self.cascade_toolbar.field_gain,
+            self.cascade_toolbar.field_flip_phase,
+            self.cascade_toolbar.field_delay_samples,
+            self.cascade_toolbar.field_delay_msec
+        ]
+
+        for field in fields:
+            field.blockSignals(True)
+
+        self.cascade_toolbar.field_gain.setValue(self.engine.get_gain())
+        self.cascade_toolbar.field_flip_phase.setChecked(self.engine.get_flip_phase())
+        self.cascade_toolbar.field_delay_samples.setValue(self.engine.get_delay())
+        self.cascade_toolbar.field_delay_msec.setValue(self.engine.convert_samples_to_msec(self.engine.get_delay()))
+
+        for field in fields:
+            field.blockSignals(False)
+
+    def update_delay_samples_spinbox(self, delay_samples: float) -> None:
 
         self.cascade_toolbar.field_delay_samples.setValue(delay_samples)
 
     def update_delay_msec_spinbox(self, delay_msec: float) -> None:
 
-        self.cascade_toolbar.field_delay_msec.setValue(delay_msec)
\ No newline at end of file
+        # The delay is already set in the engine: don't let
+        # the msec spinbox convert it back into samples
+        self.cascade_toolbar.field_delay_msec.blockSignals(True)
+        self.cascade_toolbar.field_delay_msec.setValue(delay_msec)
+        self.cascade_toolbar.field_delay_msec.blockSignals(False)
\ No newline at end of file
@@ -71,9 +71,11 @@ class CascadeToolbarWidget(QWidget):
         self.parameters_groupbox.layout().addWidget(self.field_flip_phase, 1, 1)
 
         label_delay_samples = QLabel("Delay (samples):")
-        self.field_delay_samples = QSpinBox()
+        self.field_delay_samples = QDoubleSpinBox()
+        self.field_delay_samples.setLocale(locale)
         self.field_delay_samples.setMinimum(0)
         self.field_delay_samples.setMaximum(2147483647)
+        self.field_delay_samples.setDecimals(2)
         self.field_delay_samples.setValue(0)
         self.field_delay_samples.setFixedWidth(spinbox_width)
         self.field_delay_samples.setAccelerated(True)
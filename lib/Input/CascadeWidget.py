@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets import (
     QTabWidget,
 )
+from PyQt6.QtCore import pyqtSignal
 from lib.Engine.CascadeEngine import CascadeEngine
 from lib.Engine.BiquadEngine import BiquadEngine
 from lib.Input.InputFilterWidget import InputFilterWidget
@@ -16,6 +17,12 @@ class CascadeWidget(QTabWidget):
     Qt widget for the the cascade of input filters
     """
 
+    # Emitted when the cells or the cascade need to be computed
+    compute_requested = pyqtSignal()
+
+    # Emitted with a cell edited with its handle on a Bode plot
+    parameters_edited = pyqtSignal(object)
+
     def __init__(self,
         id: int,
         output_widget: OutputWidget,
@@ -57,16 +64,15 @@ class CascadeWidget(QTabWidget):
         # Show Bode plot on load
         self.cascade_filter_widget.setCurrentIndex(1)
 
-        self.cascade_filter_widget.cascade_toolbar.compute_button.clicked.connect(
-            self.output_widget.sum_output_widget.compute_and_update
-        )
+        self.cascade_filter_widget.compute_requested.connect(self.compute_requested)
+        self.cascade_filter_widget.parameters_edited.connect(self.parameters_edited)
 
         currentTab = 1
         for filter_widget in self.input_filter_widgets:
             self.addTab(filter_widget, f"{currentTab}")
 
-            filter_widget.filter_toolbar.filter_type.compute_button.clicked.connect(self.cascade_filter_widget.compute_and_update)
-            filter_widget.filter_toolbar.filter_type.compute_button.clicked.connect(self.output_widget.sum_output_widget.compute_and_update)
+            filter_widget.compute_requested.connect(self.compute_requested)
+            filter_widget.parameters_edited.connect(self.parameters_edited)
 
             currentTab += 1
 
@@ -123,8 +129,8 @@ class CascadeWidget(QTabWidget):
                 else:
                     input_filter_widget = self.add_input_filter_widget(i)
 
-                    input_filter_widget.filter_toolbar.filter_type.compute_button.clicked.connect(self.cascade_filter_widget.compute_and_update)
-                    input_filter_widget.filter_toolbar.filter_type.compute_button.clicked.connect(self.output_widget.sum_output_widget.compute_and_update)
+                    input_filter_widget.compute_requested.connect(self.compute_requested)
+                    input_filter_widget.parameters_edited.connect(self.parameters_edited)
 
                     self.addTab(input_filter_widget, f"{i}")
                     widget = input_filter_widget
@@ -132,9 +138,7 @@ class CascadeWidget(QTabWidget):
                 # Focus on the newly appeared tab
                 #self.setCurrentIndex(i)
 
-                self.output_widget.sum_output_widget.bode_graph.update_axvlines()
                 self.cascade_filter_widget.engine.add_engine(widget.engine)
-                self.cascade_filter_widget.bode_graph.add_axvline()
 
         elif new_amount < current_amount:
             # +1 for the cascade tab
@@ -142,23 +146,9 @@ class CascadeWidget(QTabWidget):
                 self.setTabVisible(i, False)
                 self.hidden_filters += 1
 
-                self.output_widget.sum_output_widget.bode_graph.update_axvlines()
                 self.cascade_filter_widget.engine.remove_last_engine()
-                self.cascade_filter_widget.bode_graph.remove_last_axvline()
-
-        self.cascade_filter_widget.compute_and_update()
-        self.output_widget.sum_output_widget.compute_and_update()
-
-    def compute_and_update(self) -> None:
-        """
-        Convenience method to wrap computing all the
-        filters and updating their graphs in one go
-        """
-
-        for widget in self.input_filter_widgets:
-            widget.compute_and_update()
 
-        self.cascade_filter_widget.compute_and_update()
+        self.compute_requested.emit()
 
     def handle_sample_frequency(self, sample_frequency: str) -> None:
         """
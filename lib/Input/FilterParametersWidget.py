@@ -23,6 +23,8 @@ class FilterParametersWidget(QGroupBox):
         passband_ripple: float,
         stopband_attenuation: float,
         transband_width: int,
+        slope: float,
+        bandwidth: float,
         *args, **kwargs
     ) -> None:
         """
@@ -34,6 +36,8 @@ class FilterParametersWidget(QGroupBox):
             passband_ripple (float): The default passband ripple
             stopband_attenuation (float): The default stopband attenuation
             transband_width (int): The default transition band width
+            slope (float): The default tilt slope
+            bandwidth (float): The default tilt bandwidth
         """
 
         super().__init__(*args, **kwargs)
@@ -133,8 +137,11 @@ class FilterParametersWidget(QGroupBox):
         self.layout().addWidget(self.field_flip_phase, 3, 3, 1, 1)
 
         label_delay_samples = QLabel("Delay (samples):")
-        self.field_delay_samples = QSpinBox()
+        self.field_delay_samples = QDoubleSpinBox()
+        self.field_delay_samples.setLocale(locale)
         self.field_delay_samples.setMinimum(0)
+        self.field_delay_samples.setMaximum(2147483647)
+        self.field_delay_samples.setDecimals(2)
         self.field_delay_samples.setValue(0)
         self.field_delay_samples.setFixedWidth(spinbox_width)
         self.field_delay_samples.setAccelerated(True)
@@ -155,7 +162,43 @@ class FilterParametersWidget(QGroupBox):
         self.layout().addWidget(label_delay_msec, 4, 2, 1, 1)
         self.layout().addWidget(self.field_delay_msec, 4, 3, 1, 1)
 
+        label_slope = QLabel("Slope (dB/octave):")
+        self.field_slope = QDoubleSpinBox()
+        self.field_slope.setLocale(locale)
+        self.field_slope.setMinimum(-6)
+        self.field_slope.setMaximum(6)
+        self.field_slope.setSingleStep(0.5)
+        self.field_slope.setValue(slope)
+        self.field_slope.setFixedWidth(spinbox_width)
+        self.field_slope.setAccelerated(True)
+
+        self.layout().addWidget(label_slope, 5, 0, 1, 1)
+        self.layout().addWidget(self.field_slope, 5, 1, 1, 1)
+
+        label_bandwidth = QLabel("Bandwidth (octaves):")
+        self.field_bandwidth = QDoubleSpinBox()
+        self.field_bandwidth.setLocale(locale)
+        self.field_bandwidth.setMinimum(0.1)
+        self.field_bandwidth.setMaximum(20)
+        self.field_bandwidth.setValue(bandwidth)
+        self.field_bandwidth.setFixedWidth(spinbox_width)
+        self.field_bandwidth.setAccelerated(True)
+
+        self.layout().addWidget(label_bandwidth, 5, 2, 1, 1)
+        self.layout().addWidget(self.field_bandwidth, 5, 3, 1, 1)
+
+        label_matched = QLabel("Matched response:")
+        self.field_matched = QCheckBox()
+        self.field_matched.setChecked(False)
+        self.field_matched.setToolTip(
+            "Designed at a higher sample frequency and fitted back,\n"
+            "to follow the analog response up to fs/2"
+        )
+
+        self.layout().addWidget(label_matched, 6, 0, 1, 1)
+        self.layout().addWidget(self.field_matched, 6, 1, 1, 1)
+
         self.layout().addItem(
             QSpacerItem(1, 1, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding),
-            5, 3, 1, 1
+            7, 3, 1, 1
         )
\ No newline at end of file
@@ -30,7 +30,8 @@ class FilterTypeWidget(QGroupBox):
             "Elliptic Highpass",
             "Elliptic Lowpass",
             "FIR Highpass",
-            "FIR Lowpass"
+            "FIR Lowpass",
+            "Tilt"
         ],
         *args, **kwargs
     ) -> None:
@@ -31,3 +31,11 @@ class InputBodeGraphWidget(BodeGraphWidget):
 
         self.axline_top[0].set_xdata([self.engine.get_frequency()])
         self.axline_bottom[0].set_xdata([self.engine.get_frequency()])
+
+    def get_handle_engines(self) -> list[BiquadEngine]:
+        """
+        Returns:
+            list[BiquadEngine]: The cell itself
+        """
+
+        return [self.engine]
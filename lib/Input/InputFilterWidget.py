@@ -3,9 +3,8 @@ import logging
 from lib.Graph.ThreeTabWidget import ThreeTabWidget
 from lib.Engine.BiquadEngine import BiquadEngine
 
-from PyQt6.QtWidgets import QSizePolicy, QMessageBox, QApplication
-
-from PyQt6.QtCore import QThread
+from PyQt6.QtWidgets import QSizePolicy, QWidget
+from PyQt6.QtCore import Qt
 
 class InputFilterWidget(ThreeTabWidget):
     """
@@ -25,14 +24,6 @@ class InputFilterWidget(ThreeTabWidget):
 
         super().__init__(*args, **kwargs)
 
-        self.worker_thread = QThread()
-        self.worker_popup = QMessageBox()
-        self.worker_popup.setStandardButtons(QMessageBox.StandardButton.Cancel)
-        self.worker_popup.setIcon(QMessageBox.Icon.Information)
-        self.worker_popup.setWindowTitle("Please wait")
-        self.worker_popup.setText("Computing the filter takes some time...")
-        self.worker_popup.buttonClicked.connect(self.handle_worker_thread_cancelled)
-
         self.id = id
         self.set_engine(engine)
 
@@ -50,53 +41,16 @@ class InputFilterWidget(ThreeTabWidget):
         self.filter_toolbar.filter_parameters.field_passband_ripple.valueChanged.connect(self.handle_passband_ripple)
         self.filter_toolbar.filter_parameters.field_stopband_attenuation.valueChanged.connect(self.handle_stopband_attenuation)
         self.filter_toolbar.filter_parameters.field_transband_width.valueChanged.connect(self.handle_transband_width)
+        self.filter_toolbar.filter_parameters.field_slope.valueChanged.connect(self.handle_slope)
+        self.filter_toolbar.filter_parameters.field_bandwidth.valueChanged.connect(self.handle_bandwidth)
+        self.filter_toolbar.filter_parameters.field_matched.toggled.connect(self.handle_matched)
         self.filter_toolbar.filter_parameters.field_delay_samples.valueChanged.connect(self.handle_delay_samples)
         self.filter_toolbar.filter_parameters.field_delay_msec.valueChanged.connect(self.handle_delay_msec)
 
-        self.filter_toolbar.filter_type.compute_button.clicked.connect(self.compute_and_update)
+        self.filter_toolbar.filter_type.compute_button.clicked.connect(self.compute_requested)
 
         self.disable_unused_fields()
 
-    def set_engine(self, engine: BiquadEngine) -> None:
-        """
-        Set the computing engine. Has to be done outside of constructor
-        otherwise the input widget and the output widget are inter-dependent.
-
-        Args:
-            engine (GraphEngine): The engine to use to compute the graph
-        """
-
-        super().set_engine(engine)
-
-        self.engine.moveToThread(self.worker_thread)
-        self.worker_thread.started.connect(self.engine.compute_thread)
-        self.engine.finished.connect(self.handle_worker_thread_finished)
-
-    def handle_worker_thread_finished(self) -> None:
-
-        self.worker_popup.done(0)
-
-    def handle_worker_thread_cancelled(self, button_role: QMessageBox.ButtonRole) -> None:
-
-        if button_role == QMessageBox.ButtonRole.RejectRole:
-            self.worker_thread.terminate()
-
-    def compute_and_update(self) -> None:
-        """
-        Convenience method to wrap computing the filter
-        and updating the two graphs in one go
-        """
-
-        self.worker_thread.start()
-
-        result = self.worker_thread.wait(3 * 1000)
-
-        if not result:
-            self.worker_popup.exec()
-
-        self.bode_graph.update_graph()
-        self.polezero_graph.update_graph()
-
     def handle_type(self, filter_type: str) -> None:
         """
         Qt slot to update the filter type according to
@@ -183,6 +137,38 @@ class InputFilterWidget(ThreeTabWidget):
             logging.warning(e)
             self.popup_invalid_data(str(e))
 
+    def handle_slope(self, slope: float) -> None:
+        """
+        Qt slot to update the tilt slope according to
+        the spinbox in the toolbar
+        """
+
+        try:
+            self.engine.set_slope(slope)
+        except ValueError as e:
+            logging.warning(e)
+            self.popup_invalid_data(str(e))
+
+    def handle_bandwidth(self, bandwidth: float) -> None:
+        """
+        Qt slot to update the tilt bandwidth according to
+        the spinbox in the toolbar
+        """
+
+        try:
+            self.engine.set_bandwidth(bandwidth or 10)
+        except ValueError as e:
+            logging.warning(e)
+            self.popup_invalid_data(str(e))
+
+    def handle_matched(self, matched: bool) -> None:
+        """
+        Qt slot to update the matched response design mode
+        according to the checkbox in the toolbar
+        """
+
+        self.engine.set_matched(matched)
+
     def disable_unused_fields(self) -> None:
         """
         Disables the spinboxes that are not needed depending
@@ -201,6 +187,9 @@ class InputFilterWidget(ThreeTabWidget):
                 self.filter_toolbar.filter_parameters.field_stopband_attenuation.setValue(60)
                 self.filter_toolbar.filter_parameters.field_stopband_attenuation.setDisabled(True)
                 self.filter_toolbar.filter_parameters.field_transband_width.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_slope.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_bandwidth.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_matched.setDisabled(False)
 
             case "allpass":
                 self.filter_toolbar.filter_parameters.field_order.setDisabled(False)
@@ -213,6 +202,9 @@ class InputFilterWidget(ThreeTabWidget):
                 self.filter_toolbar.filter_parameters.field_stopband_attenuation.setValue(60)
                 self.filter_toolbar.filter_parameters.field_stopband_attenuation.setDisabled(True)
                 self.filter_toolbar.filter_parameters.field_transband_width.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_slope.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_bandwidth.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_matched.setDisabled(False)
 
             case "peak" | "highshelf" | "lowshelf":
                 self.filter_toolbar.filter_parameters.field_order.setValue(2)
@@ -225,6 +217,9 @@ class InputFilterWidget(ThreeTabWidget):
                 self.filter_toolbar.filter_parameters.field_stopband_attenuation.setValue(60)
                 self.filter_toolbar.filter_parameters.field_stopband_attenuation.setDisabled(True)
                 self.filter_toolbar.filter_parameters.field_transband_width.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_slope.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_bandwidth.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_matched.setDisabled(False)
 
             case "bessel highpass" | "bessel lowpass" \
                 | "butterworth highpass" | "butterworth lowpass":
@@ -238,6 +233,9 @@ class InputFilterWidget(ThreeTabWidget):
                 self.filter_toolbar.filter_parameters.field_stopband_attenuation.setValue(60)
                 self.filter_toolbar.filter_parameters.field_stopband_attenuation.setDisabled(True)
                 self.filter_toolbar.filter_parameters.field_transband_width.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_slope.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_bandwidth.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_matched.setDisabled(False)
 
             case "chebyshev i highpass" | "chebyshev i lowpass":
                 self.filter_toolbar.filter_parameters.field_order.setDisabled(False)
@@ -249,6 +247,9 @@ class InputFilterWidget(ThreeTabWidget):
                 self.filter_toolbar.filter_parameters.field_stopband_attenuation.setValue(60)
                 self.filter_toolbar.filter_parameters.field_stopband_attenuation.setDisabled(True)
                 self.filter_toolbar.filter_parameters.field_transband_width.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_slope.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_bandwidth.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_matched.setDisabled(False)
 
             case "chebyshev ii highpass" | "chebyshev ii lowpass":
                 self.filter_toolbar.filter_parameters.field_order.setDisabled(False)
@@ -260,6 +261,9 @@ class InputFilterWidget(ThreeTabWidget):
                 self.filter_toolbar.filter_parameters.field_passband_ripple.setDisabled(True)
                 self.filter_toolbar.filter_parameters.field_stopband_attenuation.setDisabled(False)
                 self.filter_toolbar.filter_parameters.field_transband_width.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_slope.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_bandwidth.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_matched.setDisabled(False)
 
             case "elliptic highpass" | "elliptic lowpass":
                 self.filter_toolbar.filter_parameters.field_order.setDisabled(False)
@@ -270,6 +274,9 @@ class InputFilterWidget(ThreeTabWidget):
                 self.filter_toolbar.filter_parameters.field_passband_ripple.setDisabled(False)
                 self.filter_toolbar.filter_parameters.field_stopband_attenuation.setDisabled(False)
                 self.filter_toolbar.filter_parameters.field_transband_width.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_slope.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_bandwidth.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_matched.setDisabled(False)
 
             case "fir highpass" | "fir lowpass":
                 self.filter_toolbar.filter_parameters.field_order.setValue(2)
@@ -282,14 +289,73 @@ class InputFilterWidget(ThreeTabWidget):
                 self.filter_toolbar.filter_parameters.field_passband_ripple.setDisabled(True)
                 self.filter_toolbar.filter_parameters.field_stopband_attenuation.setDisabled(False)
                 self.filter_toolbar.filter_parameters.field_transband_width.setDisabled(False)
+                self.filter_toolbar.filter_parameters.field_slope.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_bandwidth.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_matched.setChecked(False)
+                self.filter_toolbar.filter_parameters.field_matched.setDisabled(True)
+
+            case "tilt":
+                self.filter_toolbar.filter_parameters.field_order.setDisabled(False)
+                self.filter_toolbar.filter_parameters.field_frequency.setDisabled(False)
+                self.filter_toolbar.filter_parameters.field_gain.setDisabled(False)
+                self.filter_toolbar.filter_parameters.field_Q.setValue(0.71)
+                self.filter_toolbar.filter_parameters.field_Q.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_passband_ripple.setValue(3)
+                self.filter_toolbar.filter_parameters.field_passband_ripple.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_stopband_attenuation.setValue(60)
+                self.filter_toolbar.filter_parameters.field_stopband_attenuation.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_transband_width.setDisabled(True)
+                self.filter_toolbar.filter_parameters.field_slope.setDisabled(False)
+                self.filter_toolbar.filter_parameters.field_bandwidth.setDisabled(False)
+                self.filter_toolbar.filter_parameters.field_matched.setDisabled(False)
 
             case _:
                 raise ValueError("Unknown filter type")
 
-    def update_delay_samples_spinbox(self, delay_samples: int) -> None:
+    def update_fields(self) -> None:
+        """
+        Displays the parameters of the engine in the toolbar,
+        without setting them again
+        """
+
+        combo_box = self.filter_toolbar.filter_type.combo_box
+        parameters = self.filter_toolbar.filter_parameters
+
+        fields = [combo_box] + parameters.findChildren(QWidget)
+
+        for field in fields:
+            field.blockSignals(True)
+
+        # The drop-down list displays the types capitalized
+        combo_box.setCurrentIndex(combo_box.findText(self.engine.get_filtertype(), Qt.MatchFlag.MatchFixedString))
+
+        self.disable_unused_fields()
+
+        parameters.field_order.setValue(self.engine.get_order())
+        parameters.field_frequency.setValue(self.engine.get_frequency())
+        parameters.field_gain.setValue(self.engine.get_gain())
+        parameters.field_Q.setValue(self.engine.get_Q())
+        parameters.field_flip_phase.setChecked(self.engine.get_flip_phase())
+        parameters.field_passband_ripple.setValue(self.engine.get_passband_ripple())
+        parameters.field_stopband_attenuation.setValue(self.engine.get_stopband_attenuation())
+        parameters.field_transband_width.setValue(self.engine.get_transband_width())
+        parameters.field_slope.setValue(self.engine.get_slope())
+        parameters.field_bandwidth.setValue(self.engine.get_bandwidth())
+        parameters.field_matched.setChecked(self.engine.get_matched())
+        parameters.field_delay_samples.setValue(self.engine.get_delay())
+        parameters.field_delay_msec.setValue(self.engine.convert_samples_to_msec(self.engine.get_delay()))
+
+        for field in fields:
+            field.blockSignals(False)
+
+    def update_delay_samples_spinbox(self, delay_samples: float) -> None:
 
         self.filter_toolbar.filter_parameters.field_delay_samples.setValue(delay_samples)
 
     def update_delay_msec_spinbox(self, delay_msec: float) -> None:
 
-        self.filter_toolbar.filter_parameters.field_delay_msec.setValue(delay_msec)
\ No newline at end of file
+        # The delay is already set in the engine: don't let
+        # the msec spinbox convert it back into samples
+        self.filter_toolbar.filter_parameters.field_delay_msec.blockSignals(True)
+        self.filter_toolbar.filter_parameters.field_delay_msec.setValue(delay_msec)
+        self.filter_toolbar.filter_parameters.field_delay_msec.blockSignals(False)
\ No newline at end of file
@@ -1,7 +1,7 @@
 from PyQt6.QtWidgets import (
     QSplitter
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSignal
 
 from lib.Input.CascadeWidget import CascadeWidget
 from lib.Output.OutputWidget import OutputWidget
@@ -12,6 +12,12 @@ class InputWidget(QSplitter):
     that contains the inputs
     """
 
+    # Emitted when some engines need to be computed
+    compute_requested = pyqtSignal()
+
+    # Emitted with a cell edited with its handle on a Bode plot
+    parameters_edited = pyqtSignal(object)
+
     def __init__(self,
         output_widget: OutputWidget,
         *args, **kwargs
@@ -53,7 +59,8 @@ class InputWidget(QSplitter):
 
         self.addWidget(self.cascade_widgets[-1])
 
-        self.cascade_widgets[-1].compute_and_update()
+        self.cascade_widgets[-1].compute_requested.connect(self.compute_requested)
+        self.cascade_widgets[-1].parameters_edited.connect(self.parameters_edited)
 
         return self.cascade_widgets[-1]
 
@@ -85,7 +92,6 @@ class InputWidget(QSplitter):
                     widget = self.add_cascade_widget(i)
 
                 self.output_widget.sum_output_widget.engine.add_engine(widget.cascade_filter_widget.engine)
-                self.output_widget.sum_output_widget.bode_graph.update_axvlines()
 
         elif new_amount < current_amount:
             for i in range(new_amount, current_amount):
@@ -96,18 +102,7 @@ class InputWidget(QSplitter):
 
                 self.output_widget.sum_output_widget.engine.remove_last_engine()
 
-                self.output_widget.sum_output_widget.bode_graph.update_axvlines()
-
-        self.output_widget.sum_output_widget.compute_and_update()
-
-    def compute_and_update(self) -> None:
-        """
-        Convenience method to wrap computing all the
-        cascades and filters and updating their graphs in one go
-        """
-
-        for widget in self.cascade_widgets:
-            widget.compute_and_update()
+        self.compute_requested.emit()
 
     def handle_sample_frequency(self, sample_frequency: str) -> None:
         """
@@ -1,4 +1,5 @@
 import logging
+from pathlib import Path
 
 from PyQt6.QtWidgets import (
     QScrollArea,
@@ -7,7 +8,13 @@ from PyQt6.QtWidgets import (
 )
 
 from lib.Output.OutputWidget import OutputWidget
+from lib.Engine.GraphEngine import GraphEngine
 from lib.Engine.SumEngine import SumEngine
+from lib.Engine.EngineScheduler import EngineScheduler
+from lib.Engine.Session import Session
+from lib.Engine.Topology import Topology
+from lib.ComputeService import ComputeService
+from lib.Graph.ThreeTabWidget import ThreeTabWidget
 from lib.Input.InputWidget import InputWidget
 
 class MainWidget(QSplitter):
@@ -33,6 +40,16 @@ class MainWidget(QSplitter):
         engine.set_input_engines(input_engines)
         self.output_widget.sum_output_widget.set_engine(engine)
 
+        self.scheduler = EngineScheduler(engine)
+
+        self.compute_service = ComputeService(self.scheduler)
+        self.compute_service.computed.connect(self.update_graphs)
+        self.compute_service.failed.connect(self.popup_invalid_data)
+
+        self.input_widget.compute_requested.connect(self.request_compute)
+        self.input_widget.parameters_edited.connect(self.handle_parameters_edited)
+        self.output_widget.sum_output_widget.parameters_edited.connect(self.handle_parameters_edited)
+
         self.input_scroll_area = QScrollArea()
         self.input_scroll_area.setWidget(self.input_widget)
         self.input_scroll_area.setWidgetResizable(True)
@@ -45,18 +62,145 @@ class MainWidget(QSplitter):
         self.addWidget(self.output_scroll_area)
         self.setOpaqueResize(False)
 
+        # Set by MainWindow while the filters are being listened to
+        self.audio_monitor = None
+
         self.popup = QMessageBox()
         self.popup.setWindowTitle("Invalid data")
         self.popup.setIcon(QMessageBox.Icon.Warning)
 
-    def compute_and_update(self) -> None:
+    def get_three_tab_widgets(self) -> list[ThreeTabWidget]:
+        """
+        Returns:
+            list[ThreeTabWidget]:
+                All the widgets displaying an engine, cells,
+                cascades and sum, hidden ones included
+        """
+
+        widgets = []
+
+        for cascade_widget in self.input_widget.cascade_widgets:
+            widgets.extend(cascade_widget.input_filter_widgets)
+            widgets.append(cascade_widget.cascade_filter_widget)
+
+        widgets.append(self.output_widget.sum_output_widget)
+
+        return widgets
+
+    def request_compute(self) -> None:
         """
-        Convenience method to wrap computing all the
-        data and updating all the graph in one go
+        Qt slot to compute the outdated engines in the background
+        once the current user action has been handled
         """
 
-        self.input_widget.compute_and_update()
-        self.output_widget.compute_and_update()
+        self.compute_service.request()
+
+    def handle_parameters_edited(self, engine: GraphEngine) -> None:
+        """
+        Qt slot displaying the new parameters of a cell edited
+        with its handle on a Bode plot, and computing it
+        """
+
+        for widget in self.get_three_tab_widgets():
+            if widget.engine is engine:
+                widget.update_fields()
+
+        self.request_compute()
+
+    def update_graphs(self, computed_engines: list[GraphEngine]) -> None:
+        """
+        Qt slot to update the graphs of the engines
+        that received new data
+        """
+
+        for widget in self.get_three_tab_widgets():
+            if widget.engine in computed_engines:
+                widget.update_graphs()
+
+        if self.audio_monitor is not None and self.output_widget.sum_output_widget.engine in computed_engines:
+            try:
+                self.audio_monitor.update()
+            except ValueError as e:
+                # Edited again meanwhile, the next computation brings the filters
+                logging.info(e)
+
+    def save_session(self, path: str, results: bool = True) -> None:
+        """
+        Args:
+            path (str): The session file to write
+            results (bool, optional):
+                Also save the results of the engines that are up to date,
+                so that they are not computed again when opening the session.
+                Defaults to True.
+        """
+
+        engine = self.output_widget.sum_output_widget.engine
+
+        Session.from_engine(engine, Path(path).stem, results).save(path)
+
+    def load_session(self, session: Session) -> None:
+        """
+        Rebuilds the cascades and cells of a session and sets their parameters.
+        Only the engines whose results were not saved get computed.
+
+        Args:
+            session (Session): The session to open
+
+        Raises:
+            ValueError: In case of an invalid session
+        """
+
+        cascades = session.get_description()["cascades"]
+
+        cascade_amount_spinbox = self.output_widget.sum_output_widget.sum_toolbar.cascade_amount_spinbox
+
+        if not 1 <= len(cascades) <= cascade_amount_spinbox.maximum():
+            raise ValueError(f"A session must have between 1 and {cascade_amount_spinbox.maximum()} cascades")
+
+        # The spinboxes show, hide or create the widgets and their engines
+        cascade_amount_spinbox.setValue(len(cascades))
+
+        for cascade_widget, cascade_description in zip(self.input_widget.cascade_widgets, cascades):
+            input_amount_spinbox = cascade_widget.cascade_filter_widget.cascade_toolbar.field_input_amount
+
+            if not 1 <= len(cascade_description["cells"]) <= input_amount_spinbox.maximum():
+                raise ValueError(f"A cascade must have between 1 and {input_amount_spinbox.maximum()} cells")
+
+            input_amount_spinbox.setValue(len(cascade_description["cells"]))
+
+        engine = self.output_widget.sum_output_widget.engine
+
+        try:
+            session.set_parameters(engine)
+        finally:
+            for widget in self.get_three_tab_widgets():
+                widget.update_fields()
+
+        frequency_grid = engine.get_frequency_grid()
+
+        if frequency_grid is not GraphEngine.frequency_grid:
+            # The hidden engines and the ones created later must be combinable with the sum
+            GraphEngine.frequency_grid = frequency_grid
+
+            for widget in self.get_three_tab_widgets():
+                if widget.engine.get_frequency_grid() is not frequency_grid:
+                    widget.engine.set_frequency_grid(frequency_grid)
+
+        restored_engines = session.restore_results(Topology.get_engine_names(engine))
+
+        self.update_graphs(restored_engines)
+        self.request_compute()
+
+    def popup_invalid_data(self, message: str) -> None:
+        """
+        Displays a popup for ValueError exceptions
+
+        Args:
+            message (str): The message to display inside the popup window
+        """
+
+        self.popup.setText(message)
+        self.popup.exec()
 
     def handle_sample_frequency(self, sample_frequency: str) -> None:
         """
@@ -68,5 +212,6 @@ class MainWidget(QSplitter):
             self.output_widget.handle_sample_frequency(sample_frequency)
         except ValueError as e:
             logging.warning(e)
-            self.popup.setText(str(e))
-            self.popup.exec()
\ No newline at end of file
+            self.popup_invalid_data(str(e))
+
+        self.request_compute()
\ No newline at end of file
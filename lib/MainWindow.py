@@ -1,9 +1,26 @@
-from PyQt6.QtWidgets import QMainWindow, QToolBar, QComboBox, QLabel
+import logging
+
+from PyQt6.QtWidgets import (
+    QMainWindow,
+    QToolBar,
+    QComboBox,
+    QLabel,
+    QCheckBox,
+    QFileDialog,
+    QInputDialog,
+    QMessageBox
+)
 from PyQt6.QtGui import QIcon, QGuiApplication
 from PyQt6.QtCore import Qt
 from lib.MainWidget import MainWidget
-
-import matplotlib.style as mpls
+from lib.DiagnosticsWidget import DiagnosticsWidget
+from lib.Graph.GraphWidget import GraphWidget
+from lib.Engine.Session import Session
+from lib.Engine.Topology import Topology
+from lib.Engine.FIRExporter import FIRExporter
+from lib.Engine.AudioMonitor import AudioMonitor
+from lib.Engine.SignalGenerator import SignalGenerator
+from lib.Engine.SoundDeviceAudioBackend import SoundDeviceAudioBackend
 
 class MainWindow(QMainWindow):
     """
@@ -14,13 +31,14 @@ class MainWindow(QMainWindow):
 
         super().__init__(*args, **kwargs)
 
-        # Detecting the current color scheme for matplotlib theming
+        # Detecting the current color scheme for matplotlib theming,
+        # applied when the first graph gets displayed
         if QGuiApplication.styleHints().colorScheme() == Qt.ColorScheme.Light:
             self.color_scheme = "light"
-            mpls.use("default")
+            GraphWidget.style = "default"
         else:
             self.color_scheme = "dark"
-            mpls.use("./lib/custom_dark.mplstyle")
+            GraphWidget.style = "./lib/custom_dark.mplstyle"
 
         self.setWindowTitle("Filter Playground")
         self.setWindowIcon(QIcon('images/frequency.png'))
@@ -36,9 +54,33 @@ class MainWindow(QMainWindow):
         self.fs_combobox.setEditable(True)
         self.fs_combobox.setCurrentText("48000")
 
+        self.parallel_checkbox = QCheckBox("Compute on all CPU cores")
+        self.parallel_checkbox.setChecked(False)
+
+        self.results_checkbox = QCheckBox("Save computed results")
+        self.results_checkbox.setChecked(True)
+
+        self.monitor_source_combobox = QComboBox()
+        self.monitor_source_combobox.addItems([kind.capitalize() for kind in SignalGenerator.kinds])
+        self.monitor_source_combobox.setToolTip("Signal played through the sum when monitoring")
+
         self.toolbar = QToolBar()
+        self.open_action = self.toolbar.addAction("📂 Open session")
+        self.save_action = self.toolbar.addAction("💾 Save session")
+        self.toolbar.addWidget(self.results_checkbox)
+        self.toolbar.addSeparator()
+        self.export_fir_action = self.toolbar.addAction("🎛 Export FIR")
+        self.toolbar.addSeparator()
+        self.monitor_action = self.toolbar.addAction("🔊 Monitor")
+        self.monitor_action.setCheckable(True)
+        self.toolbar.addWidget(self.monitor_source_combobox)
+        self.toolbar.addSeparator()
         self.toolbar.addWidget(self.fs_label)
         self.toolbar.addWidget(self.fs_combobox)
+        self.toolbar.addSeparator()
+        self.toolbar.addWidget(self.parallel_checkbox)
+        self.toolbar.addSeparator()
+        self.diagnostics_action = self.toolbar.addAction("📊 Diagnostics")
         self.toolbar.setMovable(False)
 
         self.addToolBar(self.toolbar)
@@ -47,7 +89,211 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(self.main_widget)
 
         self.fs_combobox.currentTextChanged.connect(self.main_widget.handle_sample_frequency)
+        self.parallel_checkbox.toggled.connect(self.main_widget.compute_service.set_parallel)
+        self.open_action.triggered.connect(self.handle_open_session)
+        self.save_action.triggered.connect(self.handle_save_session)
+        self.export_fir_action.triggered.connect(self.handle_export_fir)
+        self.monitor_action.triggered.connect(self.handle_monitor)
+        self.monitor_source_combobox.currentTextChanged.connect(self.handle_monitor_source)
+        # The audio output is opened at the sample frequency of the filters
+        self.fs_combobox.currentTextChanged.connect(self.stop_monitor)
+
+        self.diagnostics_widget = DiagnosticsWidget(self.main_widget.output_widget.sum_output_widget.engine)
+        self.diagnostics_action.triggered.connect(self.handle_diagnostics)
+
+        self.main_widget.request_compute()
+
+        self.show()
+
+    def open_session(self, path: str) -> None:
+        """
+        Args:
+            path (str): The session file to read
+
+        Raises:
+            ValueError: In case of an invalid session
+        """
+
+        session = Session.load(path)
+
+        # Sets the sample frequency of all the engines, hidden ones included
+        self.fs_combobox.setCurrentText(f"{session.get_sample_frequency():g}")
+
+        self.main_widget.load_session(session)
+
+        self.setWindowTitle(f"Filter Playground - {session.get_description().get('name', '')}")
+
+    def handle_open_session(self) -> None:
+        """
+        Qt slot to open the session picked in a file dialog
+        """
+
+        path, _ = QFileDialog.getOpenFileName(self, "Open session", "", f"Sessions (*{Session.suffix})")
+
+        if not path:
+            return
+
+        try:
+            self.open_session(path)
+        except (OSError, ValueError) as e:
+            logging.warning(e)
+            self.main_widget.popup_invalid_data(str(e))
+
+    def handle_save_session(self) -> None:
+        """
+        Qt slot to save the session to the file picked in a file dialog
+        """
+
+        path, _ = QFileDialog.getSaveFileName(self, "Save session", "", f"Sessions (*{Session.suffix})")
+
+        if not path:
+            return
+
+        if not path.endswith(Session.suffix):
+            path += Session.suffix
+
+        try:
+            self.main_widget.save_session(path, self.results_checkbox.isChecked())
+        except OSError as e:
+            logging.warning(e)
+            self.main_widget.popup_invalid_data(str(e))
+
+    def handle_export_fir(self) -> None:
+        """
+        Qt slot to convert a cell, cascade or the sum into FIR taps,
+        with the parameters and file picked in dialogs
+        """
+
+        engines = Topology.get_engine_names(self.main_widget.output_widget.sum_output_widget.engine)
+
+        name, ok = QInputDialog.getItem(self, "Export FIR", "Filter:", list(engines), len(engines) - 1, False)
+
+        if not ok:
+            return
+
+        numtaps, ok = QInputDialog.getInt(self, "Export FIR", "Amount of taps:", 4096, 16, 1048576)
+
+        if not ok:
+            return
+
+        phase, ok = QInputDialog.getItem(self, "Export FIR", "Phase:", FIRExporter.phases, 0, False)
+
+        if not ok:
+            return
+
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export FIR", f"{name} {phase} phase FIR.wav",
+            "WAV (*.wav);;Text (*.txt *.csv);;NumPy (*.npy)"
+        )
+
+        if not path:
+            return
+
+        try:
+            exporter = FIRExporter(engines[name], numtaps, phase)
+            exporter.save(path)
+        except (OSError, ValueError) as e:
+            logging.warning(e)
+            self.main_widget.popup_invalid_data(str(e))
+            return
+
+        report = exporter.get_report()
+
+        QMessageBox.information(self, "Export FIR", (
+            f"{numtaps} taps, {phase} phase, latency {report['latency']:g} samples\n"
+            f"Magnitude error within 60 dB of the peak: {report['max_error_db']:.3f} dB max, "
+            f"{report['rms_error_db']:.3f} dB RMS\n"
+            f"Relative error: {report['relative_error']:.2e}"
+        ))
+
+    def start_monitor(self) -> None:
+        """
+        Plays the selected signal through the sum on the sound card
+
+        Raises:
+            ValueError:
+                If sounddevice is missing, the sum is not computed,
+                or the file or the audio output can't be opened
+        """
+
+        engine = self.main_widget.output_widget.sum_output_widget.engine
+        kind = SignalGenerator.kinds[self.monitor_source_combobox.currentIndex()]
+        path = None
+
+        if not SoundDeviceAudioBackend.is_available():
+            raise ValueError("Audio output requires sounddevice")
+
+        if kind == "file":
+            path, _ = QFileDialog.getOpenFileName(self, "Monitor file", "", "WAV (*.wav)")
+
+            if not path:
+                return
+
+        generator = SignalGenerator(kind, engine.get_sample_frequency(), 2, path=path)
+
+        try:
+            audio_monitor = AudioMonitor(engine, SoundDeviceAudioBackend(engine.get_sample_frequency(), 2), generator)
+            audio_monitor.start()
+        except ValueError:
+            generator.close()
+            raise
+
+        self.main_widget.audio_monitor = audio_monitor
+        self.diagnostics_widget.audio_monitor = audio_monitor
+
+    def stop_monitor(self) -> None:
+        """
+        Qt slot to stop playing, if playing
+        """
+
+        audio_monitor = self.main_widget.audio_monitor
+
+        self.main_widget.audio_monitor = None
+        self.diagnostics_widget.audio_monitor = None
+        self.monitor_action.setChecked(False)
+
+        if audio_monitor is not None:
+            audio_monitor.stop()
+            audio_monitor.generator.close()
+
+    def handle_monitor(self, checked: bool) -> None:
+        """
+        Qt slot to start or stop listening to the sum
+        """
+
+        self.stop_monitor()
+
+        if not checked:
+            return
+
+        try:
+            self.start_monitor()
+        except ValueError as e:
+            logging.warning(e)
+            self.main_widget.popup_invalid_data(str(e))
+
+        self.monitor_action.setChecked(self.main_widget.audio_monitor is not None)
+
+    def handle_monitor_source(self) -> None:
+        """
+        Qt slot to play the newly selected signal, if playing
+        """
+
+        if self.main_widget.audio_monitor is not None:
+            self.handle_monitor(True)
+
+    def handle_diagnostics(self) -> None:
+        """
+        Qt slot to display the diagnostics window
+        """
+
+        self.diagnostics_widget.show()
+        self.diagnostics_widget.raise_()
+
+    def closeEvent(self, event) -> None:
 
-        self.main_widget.compute_and_update()
+        self.stop_monitor()
+        self.diagnostics_widget.close()
+        self.main_widget.compute_service.shutdown()
 
-        self.show()
\ No newline at end of file
+        super().closeEvent(event)
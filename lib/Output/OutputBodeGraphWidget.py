@@ -1,5 +1,6 @@
 from lib.Graph.BodeGraphWidget import BodeGraphWidget
 from lib.Engine.CascadeEngine import CascadeEngine
+from lib.Engine.BiquadEngine import BiquadEngine
 
 class OutputBodeGraphWidget(BodeGraphWidget):
     """
@@ -21,28 +22,41 @@ class OutputBodeGraphWidget(BodeGraphWidget):
 
         self.engine = engine
 
-        for i in range(len(self.engine.input_engines) - 1):
-            self.add_axvline()
-
     def update_axvlines(self) -> None:
         """
         Updates the dotted vertical lines depending on
-        the computed filter.
+        the computed filter, one per input cell.
         """
 
+        engines = self.get_handle_engines()
+
+        while len(self.axline_top) < len(engines):
+            self.add_axvline()
+
+        while len(self.axline_top) > len(engines):
+            self.remove_last_axvline()
+
         i = 0
-        for engine in self.engine.input_engines:
+        for engine in engines:
             self.axline_top[i].set_xdata([engine.get_frequency()])
             self.axline_bottom[i].set_xdata([engine.get_frequency()])
             i += 1
 
+    def get_handle_engines(self) -> list[BiquadEngine]:
+        """
+        Returns:
+            list[BiquadEngine]: The cells of the cascade
+        """
+
+        return self.engine.input_engines
+
     def add_axvline(self, frequency: float = 0) -> None:
         """
         Adds a new dotted vertical line
         """
 
-        self.axline_top.append(self.axs[0].axvline(frequency, linestyle='--', color='red'))
-        self.axline_bottom.append(self.axs[1].axvline(frequency, linestyle='--', color='red'))
+        self.axline_top.append(self.axs[0].axvline(frequency, linestyle='--', color='red', animated=True))
+        self.axline_bottom.append(self.axs[1].axvline(frequency, linestyle='--', color='red', animated=True))
 
     def remove_last_axvline(self) -> None:
         """
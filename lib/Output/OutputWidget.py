@@ -24,14 +24,6 @@ class OutputWidget(QWidget):
 
         self.layout().addWidget(self.sum_output_widget)
 
-    def compute_and_update(self) -> None:
-        """
-        Convenience method to wrap computing the output
-        and updating its graph in one go
-        """
-
-        self.sum_output_widget.compute_and_update()
-
     def handle_sample_frequency(self, sample_frequency: str) -> None:
         """
         Convenience Qt slot to trigger all the engines's same slots
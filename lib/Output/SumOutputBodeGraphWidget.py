@@ -1,5 +1,6 @@
 from lib.Output.OutputBodeGraphWidget import OutputBodeGraphWidget
 from lib.Engine.SumEngine import SumEngine
+from lib.Engine.BiquadEngine import BiquadEngine
 
 class SumOutputBodeGraphWidget(OutputBodeGraphWidget):
     """
@@ -21,26 +22,14 @@ class SumOutputBodeGraphWidget(OutputBodeGraphWidget):
 
         self.engine = engine
 
-        for cascade_engine in self.engine.input_engines:
-            for engine in cascade_engine.input_engines:
-                self.add_axvline()
-
-    def update_axvlines(self) -> None:
+    def get_handle_engines(self) -> list[BiquadEngine]:
         """
-        Updates the dotted vertical lines depending on
-        the computed filter.
+        Returns:
+            list[BiquadEngine]: The cells of all the cascades
         """
 
-        for axline in self.axline_top:
-            axline.remove()
-        del self.axline_top
-        self.axline_top = []
-
-        for axline in self.axline_bottom:
-            axline.remove()
-        del self.axline_bottom
-        self.axline_bottom = []
-
-        for cascade_engine in self.engine.input_engines:
-            for engine in cascade_engine.input_engines:
-                self.add_axvline(engine.get_frequency())
+        return [
+            engine
+            for cascade_engine in self.engine.input_engines
+            for engine in cascade_engine.input_engines
+        ]
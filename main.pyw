@@ -26,4 +26,11 @@ if __name__ == '__main__':
 
     window = MainWindow()
 
+    # A session file can be given to open on launch
+    if len(sys.argv) > 1:
+        try:
+            window.open_session(sys.argv[1])
+        except (OSError, ValueError) as e:
+            window.main_widget.popup_invalid_data(str(e))
+
     sys.exit(app.exec())
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+Checks of AudioFileReader on valid, truncated and headerless files.
+"""
+
+import wave
+
+import numpy as np
+import pytest
+
+from lib.Engine.AudioFileReader import AudioFileReader
+
+def write_wav(path, samples: np.ndarray, sample_frequency: int = 48000) -> None:
+    """
+    Writes 16 bit mono samples, full scale being 1
+    """
+
+    with wave.open(str(path), "wb") as file:
+        file.setnchannels(1)
+        file.setsampwidth(2)
+        file.setframerate(sample_frequency)
+        file.writeframes((samples * 32768).astype("<i2").tobytes())
+
+def test_read(tmp_path):
+
+    samples = np.linspace(-1, 0.5, 1000)
+    write_wav(tmp_path / "test.wav", samples)
+
+    reader = AudioFileReader(tmp_path / "test.wav")
+
+    assert reader.frames == 1000
+    assert reader.channels == 1
+    assert reader.sample_frequency == 48000
+
+    np.testing.assert_allclose(reader.read(0, 2000)[:, 0], samples, atol=1 / 32768)
+
+    reader.close()
+
+@pytest.mark.parametrize("size", [4, 20, 30])
+def test_truncated_header(tmp_path, size):
+    """
+    Cut in the RIFF header, in the fmt chunk header and inside the fmt chunk
+    """
+
+    write_wav(tmp_path / "test.wav", np.zeros(100))
+
+    data = (tmp_path / "test.wav").read_bytes()
+    (tmp_path / "truncated.wav").write_bytes(data[:size])
+
+    with pytest.raises(ValueError, match="Truncated WAV header"):
+        AudioFileReader(tmp_path / "truncated.wav")
+
+def test_raw(tmp_path):
+
+    samples = np.linspace(-1, 1, 200, dtype="<f4")
+    (tmp_path / "test.raw").write_bytes(samples.tobytes())
+
+    reader = AudioFileReader(tmp_path / "test.raw", "<f4", 2)
+
+    assert reader.frames == 100
+    np.testing.assert_array_equal(reader.read(0, 100), samples.reshape(100, 2))
+
+    reader.close()
+
+    with pytest.raises(ValueError, match="Unknown sample type"):
+        AudioFileReader(tmp_path / "test.raw", "foo")
@@ -0,0 +1,58 @@
+"""
+Checks of the handover of the filters from AudioMonitor to the audio thread.
+"""
+
+import numpy as np
+
+from lib.Engine.Topology import Topology
+from lib.Engine.AudioMonitor import AudioMonitor
+from lib.Engine.NullAudioBackend import NullAudioBackend
+from lib.Engine.SignalGenerator import SignalGenerator
+from lib.Engine.StreamProcessor import StreamProcessor
+
+def create_audio_monitor(topology: Topology) -> AudioMonitor:
+    """
+    Returns:
+        AudioMonitor: Plays a white noise through the sum of the topology, without a sound card
+    """
+
+    return AudioMonitor(
+        topology.sum_engine,
+        NullAudioBackend(48000, 2, 256, realtime=False),
+        SignalGenerator("white noise", 48000, 2),
+        transition_time=0
+    )
+
+def test_first_callback_during_update():
+
+    topology = Topology({"cascades": [{"cells": [{"filtertype": "peak", "gain": 6}]}]})
+    topology.compute()
+
+    audio_monitor = create_audio_monitor(topology)
+
+    # An update in progress in another thread holds the lock
+    with audio_monitor.lock:
+        output = audio_monitor.callback(256, False)
+
+    processor = StreamProcessor(topology.sum_engine, 2, 256)
+    expected = processor.process(SignalGenerator("white noise", 48000, 2).generate(256))
+
+    np.testing.assert_allclose(output, expected, atol=1e-12)
+
+def test_update():
+
+    topology = Topology({"cascades": [{"cells": [{"filtertype": "peak", "gain": 6}]}]})
+    topology.compute()
+
+    audio_monitor = create_audio_monitor(topology)
+    first_processor = audio_monitor.processor
+
+    # A new order changes the structure, the filters are swapped
+    Topology.set_parameters(topology.engines["Cascade A 1"], {"filtertype": "butterworth lowpass", "order": 4})
+    topology.compute()
+
+    audio_monitor.update()
+    audio_monitor.callback(256, False)
+
+    assert audio_monitor.processor is not first_processor
+    assert audio_monitor.pending_processor is None
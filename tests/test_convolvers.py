@@ -0,0 +1,55 @@
+"""
+Checks of the convolvers against np.convolve.
+"""
+
+import numpy as np
+import pytest
+
+from lib.Engine.OverlapAddConvolver import OverlapAddConvolver
+from lib.Engine.PartitionedConvolver import PartitionedConvolver
+
+def process_in_blocks(process, samples: np.ndarray, block_sizes: list[int]) -> np.ndarray:
+    """
+    Returns:
+        np.ndarray: The samples processed in blocks of the sizes, repeated in turn
+    """
+
+    blocks = []
+    start = 0
+    i = 0
+
+    while start < len(samples):
+        stop = start + block_sizes[i % len(block_sizes)]
+        blocks.append(process(samples[start:stop]))
+
+        start = stop
+        i += 1
+
+    return np.concatenate(blocks)
+
+@pytest.mark.parametrize("numtaps", [1, 100, 1000])
+@pytest.mark.parametrize("convolver_class", [OverlapAddConvolver, PartitionedConvolver])
+def test_convolver(convolver_class, numtaps):
+
+    taps = np.random.default_rng(0).standard_normal(numtaps)
+    samples = np.random.default_rng(1).standard_normal((5000, 2))
+
+    if convolver_class is PartitionedConvolver:
+        convolver = PartitionedConvolver(taps, 2, 128)
+    else:
+        convolver = OverlapAddConvolver(taps, 2)
+
+    # Partial, whole and multiple partitions
+    output = process_in_blocks(convolver.process, samples, [100, 128, 300, 1])
+
+    for channel in range(2):
+        expected = np.convolve(samples[:, channel], taps)[:len(samples)]
+        np.testing.assert_allclose(output[:, channel], expected, atol=1e-9)
+
+def test_partitioned_convolver_statistics():
+
+    for taps in [[0.5], np.ones(300)]:
+        convolver = PartitionedConvolver(taps, 1, 64)
+        process_in_blocks(convolver.process, np.ones((640, 1)), [64])
+
+        assert convolver.get_statistics()["blocks"] == 10
@@ -0,0 +1,118 @@
+"""
+Checks of the split of the delays between the taps, the delay term
+and the pole-zero map, in the cells, the cascades and the sum.
+
+From the repository root:
+
+    python -m pytest tests
+"""
+
+import numpy as np
+import pytest
+from scipy.signal import freqz, sosfreqz
+
+from lib.Engine.BiquadEngine import BiquadEngine
+from lib.Engine.Topology import Topology
+
+def create_cell(**parameters) -> BiquadEngine:
+    """
+    Returns:
+        BiquadEngine: A computed cell with the parameters set, at 48 kHz
+    """
+
+    cell = BiquadEngine()
+    Topology.set_parameters(cell, {"frequency": 1000} | parameters)
+    cell.compute()
+
+    return cell
+
+def create_topology(cascade_delay: float = 0, sum_delay: float = 0) -> Topology:
+    """
+    Returns:
+        Topology: A computed sum of an IIR cascade and of a delayed FIR cascade
+    """
+
+    topology = Topology({
+        "sum": {"delay": sum_delay},
+        "cascades": [
+            {"cells": [
+                {"filtertype": "butterworth lowpass", "order": 4, "frequency": 2000},
+                {"filtertype": "peak", "frequency": 500, "gain": -3, "Q": 2, "delay": 2}
+            ]},
+            {"delay": cascade_delay, "cells": [
+                {"filtertype": "fir highpass", "frequency": 2000, "transband_width": 500}
+            ]}
+        ]
+    })
+    topology.compute()
+
+    return topology
+
+@pytest.mark.parametrize("delay", [0, 3, 10.5])
+def test_fir_cell_delays(delay):
+
+    cell = create_cell(filtertype="fir lowpass", frequency=2000, delay=delay)
+
+    numtaps = len(cell.taps)
+
+    assert cell.taps_delay == (numtaps - 1) / 2
+    assert cell.get_total_delay() == delay + cell.taps_delay
+    assert cell.zpk_delay == int(delay)
+
+    frequencies = np.asarray(cell.get_frequencies())
+    _, expected = freqz(cell.taps, worN=frequencies, fs=cell.get_sample_frequency())
+
+    # The bulk delay of the taps is left out of the undelayed response only
+    omega = 2 * np.pi * frequencies / cell.get_sample_frequency()
+
+    np.testing.assert_allclose(cell.get_magnitude_undelayed(), expected * np.exp(1j * omega * cell.taps_delay), atol=1e-9)
+    np.testing.assert_allclose(cell.get_magnitude(), expected * np.exp(-1j * omega * delay), atol=1e-9)
+
+def test_iir_cell_delays():
+
+    cell = create_cell(filtertype="butterworth lowpass", order=4, delay=7)
+
+    assert cell.taps_delay == 0
+    assert cell.get_total_delay() == 7
+    assert cell.zpk_delay == 7
+
+    z, p, k = cell.get_zpk()
+
+    # Two poles per section, and one at the origin per sample of delay
+    assert len(p) == 2 * len(cell.sos) + 7
+    assert np.count_nonzero(p == 0) >= 7
+
+def test_cascade_delays():
+
+    topology = create_topology(cascade_delay=4)
+    cascade = topology.engines["Cascade B"]
+    cell = topology.engines["Cascade B 1"]
+
+    assert cascade.taps_delay == cell.taps_delay
+    assert cascade.get_total_delay() == 4 + cell.get_total_delay()
+    assert cascade.zpk_delay == 4
+
+    # The sum is delayed by its shortest branch
+    sum_engine = topology.sum_engine
+    shortest = min(topology.engines["Cascade A"].get_total_delay(), cascade.get_total_delay())
+
+    assert sum_engine.get_total_delay() == shortest
+
+def test_sum_response():
+
+    topology = create_topology(cascade_delay=3, sum_delay=5)
+    sum_engine = topology.sum_engine
+
+    frequencies = np.asarray(sum_engine.get_frequencies())
+    omega = 2 * np.pi * frequencies / sum_engine.get_sample_frequency()
+
+    expected = np.zeros(len(frequencies), dtype=complex)
+
+    for cascade in sum_engine.input_engines:
+        _, response = sosfreqz(cascade.sos, worN=frequencies, fs=cascade.get_sample_frequency())
+        _, fir_response = freqz(cascade.taps, worN=frequencies, fs=cascade.get_sample_frequency())
+
+        delay = cascade.get_total_delay() - cascade.taps_delay + sum_engine.get_delay()
+        expected += response * fir_response * np.exp(-1j * omega * delay)
+
+    np.testing.assert_allclose(sum_engine.get_magnitude(), expected, atol=1e-9)
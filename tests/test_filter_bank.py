@@ -0,0 +1,63 @@
+"""
+Checks of FilterBank against the engines it evaluates at once.
+"""
+
+import numpy as np
+
+from lib.Engine.Topology import Topology
+from lib.Engine.FilterBank import FilterBank
+
+def create_topology(cascade_delay: float = 0, sum_delay: float = 0) -> Topology:
+    """
+    Returns:
+        Topology: A computed sum of an IIR cascade and of a delayed FIR cascade
+    """
+
+    topology = Topology({
+        "sum": {"delay": sum_delay},
+        "cascades": [
+            {"cells": [
+                {"filtertype": "butterworth lowpass", "order": 4, "frequency": 2000},
+                {"filtertype": "peak", "frequency": 500, "gain": -3, "Q": 2, "delay": 2}
+            ]},
+            {"delay": cascade_delay, "cells": [
+                {"filtertype": "fir highpass", "frequency": 2000, "transband_width": 500}
+            ]}
+        ]
+    })
+    topology.compute()
+
+    return topology
+
+def test_filter_bank():
+
+    topologies = [create_topology(cascade_delay=delay, sum_delay=2) for delay in [0, 3, 10.5]]
+
+    engine_names = ["Cascade A 1", "Cascade B", "Sum"]
+
+    for name in engine_names:
+        engines = [topology.engines[name] for topology in topologies]
+
+        bank = FilterBank(engines)
+        bank.evaluate()
+
+        for channel, engine in enumerate(engines):
+            np.testing.assert_allclose(bank.get_frequencies(), engine.get_frequencies())
+            np.testing.assert_allclose(bank.get_responses(channel), engine.get_magnitude(), atol=1e-9)
+
+def test_filter_bank_leaves_engines_untouched():
+
+    topology = create_topology()
+    cell = topology.engines["Cascade A 1"]
+
+    sos = np.array(cell.sos)
+    revision = cell.revision
+
+    # Edited but not computed again
+    Topology.set_parameters(cell, {"frequency": 3000})
+
+    FilterBank([topology.sum_engine]).evaluate()
+
+    np.testing.assert_array_equal(cell.sos, sos)
+    assert cell.revision == revision
+    assert cell.needs_compute()
@@ -0,0 +1,75 @@
+"""
+Checks of the FIR filters of FIRExporter against the engines they replace.
+"""
+
+import numpy as np
+import pytest
+from scipy.signal import freqz
+
+from lib.Engine.Topology import Topology
+from lib.Engine.FIRExporter import FIRExporter
+
+def create_topology() -> Topology:
+    """
+    Returns:
+        Topology: A computed sum of an IIR cascade and of a delayed FIR cascade
+    """
+
+    topology = Topology({
+        "cascades": [
+            {"cells": [
+                {"filtertype": "butterworth lowpass", "order": 4, "frequency": 2000},
+                {"filtertype": "peak", "frequency": 500, "gain": -3, "Q": 2}
+            ]},
+            {"delay": 5, "cells": [
+                {"filtertype": "fir highpass", "frequency": 2000, "transband_width": 500}
+            ]}
+        ]
+    })
+    topology.compute()
+
+    return topology
+
+# Largest magnitude error in dB on the grid of the engine and RMS error
+# of the report, the notch where the cascades cross over being the
+# hardest part to follow
+FIR_EXPORT_TOLERANCES = {
+    ("linear", 1024): (10, 1),
+    ("linear", 4096): (0.6, 0.5),
+    ("linear", 16384): (0.04, 0.25),
+    ("minimum", 1024): (1, 0.2),
+    ("minimum", 4096): (0.07, 0.02),
+    ("minimum", 16384): (0.005, 0.002)
+}
+
+@pytest.mark.parametrize("numtaps", [1024, 4096, 16384])
+@pytest.mark.parametrize("phase", FIRExporter.phases)
+def test_fir_export(phase, numtaps):
+
+    sum_engine = create_topology().sum_engine
+
+    exporter = FIRExporter(sum_engine, numtaps, phase)
+    taps = exporter.get_taps()
+    report = exporter.get_report()
+
+    assert len(taps) == numtaps
+
+    if phase == "linear":
+        assert report["latency"] == (numtaps - 1) / 2
+        np.testing.assert_allclose(taps, taps[::-1], atol=1e-12)
+    else:
+        assert report["latency"] == 0
+
+    # On the grid of the engine, within 60 dB of its peak
+    frequencies = np.asarray(sum_engine.get_frequencies())
+    expected = np.abs(np.asarray(sum_engine.get_magnitude()))
+
+    _, response = freqz(taps, worN=frequencies, fs=sum_engine.get_sample_frequency())
+
+    relevant = expected > expected.max() * 10 ** (-60 / 20)
+    error_db = np.abs(20 * np.log10(np.abs(response[relevant]) / expected[relevant]))
+
+    max_error_db, rms_error_db = FIR_EXPORT_TOLERANCES[phase, numtaps]
+
+    assert error_db.max() < max_error_db
+    assert report["rms_error_db"] < rms_error_db
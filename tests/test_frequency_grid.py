@@ -0,0 +1,41 @@
+"""
+Checks of the settings of FrequencyGrid and of the frequencies it caches.
+"""
+
+import numpy as np
+import pytest
+
+from lib.Engine.FrequencyGrid import FrequencyGrid
+
+def test_setters_clear_cache():
+
+    grid = FrequencyGrid(maximum_frequency=10000)
+    assert grid.get_frequencies(48000).max() < 10000
+
+    grid.set_maximum_frequency(None)
+    assert grid.get_frequencies(48000).max() > 20000
+
+    grid = FrequencyGrid("custom", frequencies=[100, 1000])
+    np.testing.assert_array_equal(grid.get_frequencies(48000), [100, 1000])
+
+    grid.set_custom_frequencies([50, 500, 5000])
+    np.testing.assert_array_equal(grid.get_frequencies(48000), [50, 500, 5000])
+
+@pytest.mark.parametrize("frequencies", [[], [0, 1000], [-10, 1000]])
+def test_invalid_custom_frequencies(frequencies):
+
+    grid = FrequencyGrid("custom", frequencies=[100])
+
+    with pytest.raises(ValueError):
+        grid.set_custom_frequencies(frequencies)
+
+    assert grid.get_custom_frequencies() is None
+
+def test_custom_frequencies_above_nyquist():
+
+    grid = FrequencyGrid("custom", frequencies=[30000, 40000])
+
+    with pytest.raises(ValueError, match="Nyquist"):
+        grid.get_frequencies(48000)
+
+    np.testing.assert_array_equal(grid.get_frequencies(96000), [30000, 40000])
@@ -0,0 +1,84 @@
+"""
+Checks of the graph widgets, on an offscreen Qt platform.
+"""
+
+import os
+import time
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from lib.Engine.BiquadEngine import BiquadEngine
+from lib.Engine.Topology import Topology
+from lib.Input.InputBodeGraphWidget import InputBodeGraphWidget
+from lib.Graph.ThreeTabWidget import ThreeTabWidget
+
+@pytest.fixture(scope="module")
+def application():
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    return QApplication.instance() or QApplication([])
+
+def test_pole_zero_map_waits_for_its_tab(application):
+
+    engine = BiquadEngine()
+    Topology.set_parameters(engine, {"filtertype": "peak", "frequency": 1000, "gain": 6})
+    engine.compute()
+
+    widget = ThreeTabWidget(QWidget(), "Parameters", InputBodeGraphWidget())
+    widget.set_engine(engine)
+    widget.setCurrentWidget(widget.bode_graph)
+    widget.show()
+
+    widget.update_graphs()
+
+    # The pole-zero map waits for its tab to be selected
+    assert widget.polezero_graph.graph_outdated
+    assert engine.zpk is None
+
+    widget.setCurrentWidget(widget.polezero_graph)
+
+    for _ in range(500):
+        application.processEvents()
+
+        if engine.zpk is not None:
+            break
+
+        time.sleep(0.01)
+
+    assert engine.zpk is not None
+    assert not widget.polezero_graph.graph_outdated
+
+    widget.close()
+
+def test_refused_drag(application):
+
+    engine = BiquadEngine()
+    Topology.set_parameters(engine, {"filtertype": "fir highpass", "frequency": 2000, "transband_width": 500})
+    engine.compute()
+
+    graph = InputBodeGraphWidget()
+    graph.set_engine(engine)
+
+    edited = []
+    graph.parameters_edited.connect(edited.append)
+
+    previous_state = dict(vars(engine))
+
+    # The stopband would get narrower than the transition band
+    graph.pending_edit = (engine, {"frequency": 100})
+    graph.apply_edit()
+
+    assert not edited
+    assert vars(engine).keys() == previous_state.keys()
+    assert all(vars(engine)[name] is value for name, value in previous_state.items())
+
+    graph.pending_edit = (engine, {"frequency": 3000})
+    graph.apply_edit()
+
+    assert edited == [engine]
+    assert engine.get_frequency() == 3000
@@ -0,0 +1,74 @@
+"""
+Checks of the matched response design of the cells
+against the analog prototypes.
+"""
+
+import numpy as np
+import pytest
+from scipy.signal import butter, freqs
+
+from lib.Engine.BiquadEngine import BiquadEngine
+from lib.Engine.Topology import Topology
+
+def create_cell(**parameters) -> BiquadEngine:
+    """
+    Returns:
+        BiquadEngine: A computed cell with the parameters set, at 48 kHz
+    """
+
+    cell = BiquadEngine()
+    Topology.set_parameters(cell, {"frequency": 1000} | parameters)
+    cell.compute()
+
+    return cell
+
+@pytest.mark.parametrize("frequency", [8000, 12000, 15000])
+def test_matched_butterworth(frequency):
+    """
+    Within 1.5 dB of the analog prototype down to -40 dB,
+    where the bilinear transform is tens of dB away
+    """
+
+    analog_b, analog_a = butter(4, 2 * np.pi * frequency, analog=True)
+
+    errors = {}
+
+    for matched in [False, True]:
+        cell = create_cell(filtertype="butterworth lowpass", order=4, frequency=frequency, matched=matched)
+
+        frequencies = np.asarray(cell.get_frequencies())
+        _, analog = freqs(analog_b, analog_a, 2 * np.pi * frequencies)
+
+        relevant = (frequencies < 20000) & (np.abs(analog) > 10 ** (-40 / 20))
+        error_db = np.abs(20 * np.log10(np.abs(cell.get_magnitude()) / np.abs(analog)))
+
+        errors[matched] = error_db[relevant].max()
+
+    assert errors[True] < 1.5
+    assert errors[False] > 10
+
+@pytest.mark.parametrize("frequency", [8000, 12000, 15000])
+def test_matched_peak(frequency):
+
+    gain = 6
+    Q = 2
+
+    errors = {}
+
+    for matched in [False, True]:
+        cell = create_cell(filtertype="peak", frequency=frequency, gain=gain, Q=Q, matched=matched)
+
+        frequencies = np.asarray(cell.get_frequencies())
+
+        # Analog prototype of the RBJ peak
+        A = 10 ** (gain / 40)
+        s = 1j * frequencies / frequency
+        analog = (s**2 + s * A / Q + 1) / (s**2 + s / (A * Q) + 1)
+
+        relevant = frequencies < 20000
+        error_db = np.abs(20 * np.log10(np.abs(cell.get_magnitude()) / np.abs(analog)))
+
+        errors[matched] = error_db[relevant].max()
+
+    assert errors[True] < 0.25
+    assert errors[True] < errors[False] / 5
@@ -0,0 +1,65 @@
+"""
+Checks of the session files: saving and opening them again,
+and refusing damaged ones.
+"""
+
+import numpy as np
+import pytest
+
+from lib.Engine.Topology import Topology
+from lib.Engine.Session import Session
+
+DESCRIPTION = {
+    "name": "crossover",
+    "frequency_grid": {"spacing": "octave", "points_per_octave": 24},
+    "cascades": [
+        {"cells": [{"filtertype": "butterworth lowpass", "order": 4, "frequency": 2000}]},
+        {"delay": 3, "cells": [{"filtertype": "butterworth highpass", "order": 4, "frequency": 2000}]}
+    ]
+}
+
+def test_save_and_load(tmp_path):
+
+    topology = Topology(DESCRIPTION)
+    topology.compute()
+
+    path = tmp_path / f"crossover{Session.suffix}"
+    Session.from_engine(topology.sum_engine, "crossover").save(path)
+
+    session = Session.load(path)
+
+    # Opened on engines of the same topology, on the default grid
+    other = Topology({"cascades": [{"cells": [{}]}, {"cells": [{}]}]})
+    session.set_parameters(other.sum_engine)
+
+    engines = Topology.get_engine_names(other.sum_engine)
+    restored_engines = session.restore_results(engines)
+
+    assert len(restored_engines) == len(engines)
+    assert not other.sum_engine.needs_compute()
+
+    np.testing.assert_allclose(other.sum_engine.get_frequencies(), topology.sum_engine.get_frequencies())
+    np.testing.assert_allclose(other.sum_engine.get_magnitude(), topology.sum_engine.get_magnitude())
+
+def test_truncated_file(tmp_path):
+
+    topology = Topology(DESCRIPTION)
+    topology.compute()
+
+    path = tmp_path / f"crossover{Session.suffix}"
+    Session.from_engine(topology.sum_engine).save(path)
+
+    data = path.read_bytes()
+    path.write_bytes(data[:len(data) // 2])
+
+    with pytest.raises(ValueError, match="Not a session file"):
+        Session.load(path)
+
+@pytest.mark.parametrize("description", [{"name": "empty"}, {"cascades": [{"gain": 0}]}])
+def test_missing_cascades(tmp_path, description):
+
+    path = tmp_path / f"invalid{Session.suffix}"
+    Session(description).save(path)
+
+    with pytest.raises(ValueError, match="Not a session file"):
+        Session.load(path)
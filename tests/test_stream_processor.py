@@ -0,0 +1,132 @@
+"""
+Checks of StreamProcessor against direct computations with sosfilt
+and np.convolve, and against the responses of the engines.
+"""
+
+import numpy as np
+import pytest
+from scipy.signal import freqz, sosfilt
+
+from lib.Engine.Topology import Topology
+from lib.Engine.StreamProcessor import StreamProcessor
+
+def create_topology() -> Topology:
+    """
+    Returns:
+        Topology: A computed sum of an IIR cascade and of a delayed FIR cascade
+    """
+
+    topology = Topology({
+        "cascades": [
+            {"cells": [
+                {"filtertype": "butterworth lowpass", "order": 4, "frequency": 2000},
+                {"filtertype": "peak", "frequency": 500, "gain": -3, "Q": 2}
+            ]},
+            {"delay": 5, "cells": [
+                {"filtertype": "fir highpass", "frequency": 2000, "transband_width": 500}
+            ]}
+        ]
+    })
+    topology.compute()
+
+    return topology
+
+def process_in_blocks(process, samples: np.ndarray, block_sizes: list[int]) -> np.ndarray:
+    """
+    Returns:
+        np.ndarray: The samples processed in blocks of the sizes, repeated in turn
+    """
+
+    blocks = []
+    start = 0
+    i = 0
+
+    while start < len(samples):
+        stop = start + block_sizes[i % len(block_sizes)]
+        blocks.append(process(samples[start:stop]))
+
+        start = stop
+        i += 1
+
+    return np.concatenate(blocks)
+
+@pytest.mark.parametrize("partition_size", [None, 256])
+def test_stream_processor(partition_size):
+
+    topology = create_topology()
+    sum_engine = topology.sum_engine
+
+    processor = StreamProcessor(sum_engine, 1, partition_size)
+    assert processor.get_latency() == 0
+
+    samples = np.random.default_rng(0).standard_normal(8000)
+    output = process_in_blocks(processor.process, samples, [256, 100, 513])
+
+    expected = np.zeros(len(samples))
+
+    for cascade in sum_engine.input_engines:
+        branch = np.convolve(sosfilt(cascade.sos, samples), cascade.taps)[:len(samples)]
+
+        # The bulk delay of the taps is part of the taps themselves
+        delay = int(cascade.get_total_delay() - cascade.taps_delay + sum_engine.get_delay())
+        expected[delay:] += branch[:len(samples) - delay]
+
+    np.testing.assert_allclose(output, expected, atol=1e-9)
+
+def test_stream_processor_fractional_delay():
+    """
+    Matches the response of the engine up to 80% of the Nyquist
+    frequency, once its latency is compensated
+    """
+
+    cell = Topology({"cascades": [{"cells": [{"filtertype": "peak", "gain": 6, "delay": 2.5}]}]}).engines["Cascade A 1"]
+    cell.compute()
+
+    processor = StreamProcessor(cell)
+
+    impulse = np.zeros(4096)
+    impulse[0] = 1
+
+    impulse_response = processor.process(impulse)
+
+    frequencies = np.asarray(cell.get_frequencies())
+    relevant = frequencies < 0.8 * cell.get_sample_frequency() / 2
+
+    _, response = freqz(impulse_response, worN=frequencies[relevant], fs=cell.get_sample_frequency())
+    response *= np.exp(2j * np.pi * frequencies[relevant] * processor.get_latency() / cell.get_sample_frequency())
+
+    np.testing.assert_allclose(response, np.asarray(cell.get_magnitude())[relevant], atol=1e-3)
+
+def test_stream_processor_interpolation():
+    """
+    Once the coefficients are interpolated, the output is the one of the
+    new filters, the state having settled
+    """
+
+    topology = create_topology()
+    sum_engine = topology.sum_engine
+
+    processor = StreamProcessor(sum_engine, 1, 256)
+
+    Topology.set_parameters(topology.engines["Cascade A 2"], {"gain": 6})
+    topology.compute()
+
+    new_processor = StreamProcessor(sum_engine, 1, 256)
+
+    assert processor.can_interpolate(new_processor)
+
+    processor.interpolate(new_processor, 2400)
+
+    samples = np.random.default_rng(0).standard_normal(48000)
+
+    output = process_in_blocks(processor.process, samples, [256])
+    expected = process_in_blocks(new_processor.process, samples, [256])
+
+    assert not processor.is_interpolating()
+    np.testing.assert_allclose(output[-10000:], expected[-10000:], atol=1e-9)
+
+    # A new order changes the structure
+    Topology.set_parameters(topology.engines["Cascade A 1"], {"order": 6})
+    topology.compute()
+
+    assert not processor.can_interpolate(StreamProcessor(sum_engine, 1, 256))